@@ -0,0 +1,174 @@
+import random
+import sys
+import time
+import numpy as np
+from typing import Dict, List, Optional, Protocol, Tuple, Any, runtime_checkable
+from genetic_scheduler import ScheduleGA  # V1
+from genetic_scheduler_v2 import ScheduleGA_V2  # V2
+from permutation_v2 import ScheduleGA_V2_Permutacao  # V2 com genoma de permutação
+from simulated_annealing import ScheduleSA  # Simulated annealing sobre o modelo da V2
+from large_neighborhood_search import ScheduleLNS  # Destruir e reparar sobre o modelo da V2
+from nsga2_scheduler import ScheduleNSGA2  # NSGA-II multiobjetivo sobre o modelo da V2
+
+try:
+    import resource  # Disponível apenas em sistemas Unix
+except ImportError:
+    resource = None
+
+@runtime_checkable
+class Engine(Protocol):
+    """
+    Contrato mínimo de um motor de otimização usado pelo harness
+    - Parâmetros configuráveis como atributos
+    - executar() retorna (melhor solução, fitness, histórico de fitness)
+    """
+    populacao_size: int
+    geracoes: int
+    taxa_mutacao: float
+    taxa_crossover: float
+    tamanho_torneio: int
+    verbose: bool
+    total_avaliacoes: int
+    dados_carregados: bool
+
+    def carregar_dados(self) -> None: ...
+
+    def copiar_dados_de(self, outro: Any) -> None: ...
+
+    def executar(self, callbacks=None, retomar=False) -> Tuple[Any, float, List[float]]: ...
+
+# Motores disponíveis para o harness: nome -> classe
+ENGINES = {'V1': ScheduleGA, 'V2': ScheduleGA_V2, 'V2P': ScheduleGA_V2_Permutacao, 'SA': ScheduleSA,
+           'LNS': ScheduleLNS, 'NSGA2': ScheduleNSGA2}
+
+# Fitness máximo esperado de cada motor (normalização para comparação)
+FITNESS_MAX_ESPERADO = {'V1': 10000, 'V2': 15000, 'V2P': 15000, 'SA': 15000, 'LNS': 15000, 'NSGA2': 15000}
+
+def registrar_engine(nome: str, classe, fitness_max_esperado: float):
+    """Registra um novo motor para uso no ParameterOptimizer e nas comparações"""
+    ENGINES[nome] = classe
+    FITNESS_MAX_ESPERADO[nome] = fitness_max_esperado
+
+def pico_memoria_mb() -> Optional[float]:
+    """Pico de memória residente (RSS) do processo atual em MB, se disponível"""
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta em KB; macOS em bytes
+    if sys.platform == 'darwin':
+        return pico / (1024 * 1024)
+    return pico / 1024
+
+# Instância com os dados já carregados, compartilhada pelas execuções de cada processo
+_ENGINE_BASE_WORKER = {}
+
+def inicializar_worker(versao: str):
+    """Carrega os dados do problema uma única vez por processo"""
+    engine_base = ENGINES[versao]()
+    engine_base.verbose = False
+    engine_base.carregar_dados()
+    _ENGINE_BASE_WORKER[versao] = engine_base
+
+def configurar_engine(versao: str, config: Tuple, max_geracoes: int) -> Engine:
+    """Cria um motor com os parâmetros da configuração reaproveitando os dados do processo"""
+    pop_size, mut_rate, cross_rate, tournament_size = config
+    if versao not in _ENGINE_BASE_WORKER:
+        inicializar_worker(versao)
+
+    engine = ENGINES[versao]()
+    engine.verbose = False
+    engine.verificacao_previa = False  # Os dados já foram verificados pelo otimizador
+    engine.copiar_dados_de(_ENGINE_BASE_WORKER[versao])
+    engine.populacao_size = pop_size
+    engine.taxa_mutacao = mut_rate
+    engine.taxa_crossover = cross_rate
+    engine.tamanho_torneio = tournament_size
+    engine.geracoes = max_geracoes
+    return engine
+
+def executar_benchmark(versao: str, config: Tuple, max_geracoes: int, seed: int) -> Dict:
+    """
+    Executa uma configuração com semente fixa e mede desempenho
+    - fitness, tempo, gerações executadas
+    - avaliações/s, gerações/s e pico de RSS do processo
+    """
+    pop_size, mut_rate, cross_rate, tournament_size = config
+
+    random.seed(seed)
+    np.random.seed(seed)
+
+    execucao = {
+        'versao': versao,
+        'populacao_size': pop_size,
+        'taxa_mutacao': mut_rate,
+        'taxa_crossover': cross_rate,
+        'tamanho_torneio': tournament_size,
+        'max_geracoes': max_geracoes,
+        'seed': seed
+    }
+
+    start_time = time.time()
+    try:
+        engine = configurar_engine(versao, config, max_geracoes)
+
+        _, fitness, historico = engine.executar()
+        tempo = time.time() - start_time
+
+        execucao['fitness'] = float(fitness)
+        execucao['tempo'] = tempo
+        execucao['geracoes_executadas'] = len(historico)
+        execucao['avaliacoes'] = engine.total_avaliacoes
+        execucao['avaliacoes_por_segundo'] = engine.total_avaliacoes / max(tempo, 1e-9)
+        execucao['geracoes_por_segundo'] = len(historico) / max(tempo, 1e-9)
+        execucao['operadores'] = getattr(engine, 'estatisticas_operadores', None)
+        execucao['erro'] = None
+    except Exception as e:
+        execucao['fitness'] = 0.0
+        execucao['tempo'] = 999.0
+        execucao['geracoes_executadas'] = 0
+        execucao['avaliacoes'] = 0
+        execucao['avaliacoes_por_segundo'] = 0.0
+        execucao['geracoes_por_segundo'] = 0.0
+        execucao['erro'] = str(e)
+
+    execucao['pico_rss_mb'] = pico_memoria_mb()
+    return execucao
+
+def avancar_configuracao(versao: str, config: Tuple, estado: Optional[Dict], geracoes: int, seed: int):
+    """
+    Avança uma configuração por mais `geracoes` gerações partindo do
+    checkpoint `estado` (None = execução nova)
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+
+    start_time = time.time()
+    engine = configurar_engine(versao, config, geracoes)
+    engine.estado = estado
+    _, fitness, _ = engine.executar(retomar=estado is not None)
+
+    return float(fitness), engine.estado, time.time() - start_time
+
+def agregar_execucoes(versao: str, config: Tuple, execucoes: List[Dict]) -> Dict:
+    """Resume as execuções de uma configuração no formato de ParameterOptimizer.resultados"""
+    pop_size, mut_rate, cross_rate, tournament_size = config
+    fitness_runs = [e['fitness'] for e in execucoes]
+    tempos_runs = [e['tempo'] for e in execucoes]
+    picos = [e['pico_rss_mb'] for e in execucoes if e.get('pico_rss_mb') is not None]
+
+    return {
+        'versao': versao,
+        'populacao_size': pop_size,
+        'taxa_mutacao': mut_rate,
+        'taxa_crossover': cross_rate,
+        'tamanho_torneio': tournament_size,
+        'fitness_medio': np.mean(fitness_runs),
+        'fitness_std': np.std(fitness_runs),
+        'fitness_max': np.max(fitness_runs),
+        'fitness_normalizado': np.mean(fitness_runs) / FITNESS_MAX_ESPERADO[versao],
+        'tempo_medio': np.mean(tempos_runs),
+        'tempo_std': np.std(tempos_runs),
+        'avaliacoes_por_segundo': np.mean([e.get('avaliacoes_por_segundo', 0.0) for e in execucoes]),
+        'geracoes_por_segundo': np.mean([e.get('geracoes_por_segundo', 0.0) for e in execucoes]),
+        'pico_rss_mb': max(picos) if picos else np.nan
+    }
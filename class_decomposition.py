@@ -0,0 +1,229 @@
+import copy
+import random
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from genetic_scheduler_v2 import ScheduleGA_V2
+
+# Conflito entre turmas: (dia, horário, recurso 'professor' ou 'sala', código, turmas envolvidas)
+Conflito = Tuple[int, int, str, str, Tuple[str, ...]]
+
+@dataclass
+class ResultadoDecomposicao:
+    """Agendas por turma após a resolução em paralelo e o acoplamento"""
+    agendas: Dict[str, np.ndarray]
+    fitness: Dict[str, float]
+    conflitos_iniciais: List[Conflito] = field(default_factory=list)
+    conflitos: List[Conflito] = field(default_factory=list)  # Restantes após o acoplamento
+    movimentos: int = 0                                       # Trocas/realocações aplicadas no acoplamento
+    tempo_paralelo: float = 0.0
+    tempo_acoplamento: float = 0.0
+
+    @property
+    def fitness_total(self) -> float:
+        return sum(self.fitness.values())
+
+def particionar(ga: ScheduleGA_V2) -> Dict[str, List[str]]:
+    """Disciplinas de cada turma (o genoma da V2 é a grade de uma turma)"""
+    particoes = {}
+    for codigo, disciplina in ga.disciplinas.items():
+        particoes.setdefault(disciplina.turma, []).append(codigo)
+    return particoes
+
+def criar_subproblema(ga: ScheduleGA_V2, disciplinas: List[str]) -> ScheduleGA_V2:
+    """Cópia do motor (mesma classe e parâmetros) restrita às disciplinas dadas"""
+    codigos = set(disciplinas)
+    sub = copy.copy(ga)
+    sub.verbose = False
+    sub.estado = None
+    sub.disciplinas = {c: d for c, d in ga.disciplinas.items() if c in codigos}
+    turmas = {d.turma for d in sub.disciplinas.values()}
+    sub.turmas = {c: t for c, t in ga.turmas.items() if c in turmas}
+    sub.aulas_obrigatorias = [aula for aula in ga.aulas_obrigatorias if aula.disciplina in codigos]
+    sub.distribuicao_disciplinas = {c: d for c, d in ga.distribuicao_disciplinas.items() if c in codigos}
+    sub.dominios = {c: d for c, d in ga.dominios.items() if c in codigos}
+    return sub
+
+def _resolver_subproblema(chave: str, sub: ScheduleGA_V2, seed: int):
+    """Executado em um processo do pool: resolve a turma de forma independente"""
+    random.seed(seed)
+    np.random.seed(seed)
+    inicio = time.time()
+    agenda, fitness, _ = sub.executar()
+    return chave, agenda, float(fitness), time.time() - inicio, sub.total_avaliacoes
+
+def _turno(ga: ScheduleGA_V2, turma: str) -> str:
+    dados = ga.turmas.get(turma)
+    return str(dados.turno).strip().lower() if dados is not None else ''
+
+def encontrar_conflitos(agendas: Dict[str, np.ndarray], turnos: Dict[str, str]) -> List[Conflito]:
+    """
+    Professores e salas usados por mais de uma turma na mesma célula
+    Só turmas do mesmo turno competem (os índices de horário são relativos ao turno)
+    """
+    conflitos = []
+    grupos = {}
+    for turma, turno in turnos.items():
+        grupos.setdefault(turno, []).append(turma)
+    for turmas in grupos.values():
+        if len(turmas) < 2:
+            continue
+        num_dias, num_horarios = agendas[turmas[0]].shape
+        for dia in range(num_dias):
+            for horario in range(num_horarios):
+                uso = {}
+                for turma in turmas:
+                    aula = agendas[turma][dia, horario]
+                    if aula is not None:
+                        uso.setdefault(('professor', aula.professor), []).append(turma)
+                        uso.setdefault(('sala', aula.sala), []).append(turma)
+                for (recurso, codigo), envolvidas in uso.items():
+                    if len(envolvidas) > 1:
+                        conflitos.append((dia, horario, recurso, codigo, tuple(envolvidas)))
+    return conflitos
+
+def _conflitos_celula(agendas: Dict[str, np.ndarray], turmas: List[str], dia: int, horario: int) -> int:
+    """Usos excedentes de professor e sala na célula, entre as turmas do grupo"""
+    professores, salas = [], []
+    for turma in turmas:
+        aula = agendas[turma][dia, horario]
+        if aula is not None:
+            professores.append(aula.professor)
+            salas.append(aula.sala)
+    return (len(professores) - len(set(professores))) + (len(salas) - len(set(salas)))
+
+def _com_sala(aula, sala: str):
+    """Cópia da aula em outra sala, mantendo grupo_dia e posicao_no_grupo (atributos dinâmicos)"""
+    nova = copy.copy(aula)
+    nova.sala = sala
+    return nova
+
+def acoplar(subproblemas: Dict[str, ScheduleGA_V2], agendas: Dict[str, np.ndarray],
+            fitness: Dict[str, float], penalidade_conflito: float = 1000.0,
+            max_iteracoes: int = 500) -> Tuple[int, List[Conflito]]:
+    """
+    Busca local que elimina conflitos de professor e sala entre turmas (modifica agendas e fitness)
+    - Movimentos em uma turma envolvida: troca de duas células (dentro dos domínios)
+      ou outra sala do domínio para a aula em conflito
+    - Para cada conflito (em ordem aleatória), aplica o melhor movimento por
+      fitness - penalidade_conflito * conflitos; para quando não há conflitos
+      ou nenhum movimento melhora
+    Retorna (movimentos aplicados, conflitos restantes)
+    """
+    turnos = {turma: _turno(sub, turma) for turma, sub in subproblemas.items()}
+    grupo = {turma: [t for t in turnos if turnos[t] == turnos[turma]] for turma in turnos}
+    movimentos = 0
+
+    for _ in range(max_iteracoes):
+        conflitos = encontrar_conflitos(agendas, turnos)
+        if not conflitos:
+            break
+        random.shuffle(conflitos)
+
+        melhor_ganho, melhor_movimento = 0.0, None
+        for dia, horario, recurso, codigo, envolvidas in conflitos:
+            if melhor_movimento is not None:
+                break
+            for turma in envolvidas:
+                sub, agenda, turmas = subproblemas[turma], agendas[turma], grupo[turma]
+                num_dias, num_horarios = agenda.shape
+
+                # Trocas da célula em conflito com as demais células da turma
+                for d2 in range(num_dias):
+                    for h2 in range(num_horarios):
+                        if (d2, h2) == (dia, horario) or not sub._troca_permitida(agenda, dia, horario, d2, h2):
+                            continue
+                        antes = _conflitos_celula(agendas, turmas, dia, horario) + \
+                            _conflitos_celula(agendas, turmas, d2, h2)
+                        agenda[dia, horario], agenda[d2, h2] = agenda[d2, h2], agenda[dia, horario]
+                        depois = _conflitos_celula(agendas, turmas, dia, horario) + \
+                            _conflitos_celula(agendas, turmas, d2, h2)
+                        novo_fitness = float(sub.calcular_fitness(agenda))
+                        agenda[dia, horario], agenda[d2, h2] = agenda[d2, h2], agenda[dia, horario]
+                        ganho = novo_fitness - fitness[turma] - penalidade_conflito * (depois - antes)
+                        if ganho > melhor_ganho:
+                            melhor_ganho, melhor_movimento = ganho, ('troca', turma, (dia, horario, d2, h2), novo_fitness)
+
+                # Outra sala do domínio para a aula em conflito de sala
+                aula = agenda[dia, horario]
+                dominio = sub.dominios.get(aula.disciplina)
+                if recurso != 'sala' or dominio is None:
+                    continue
+                usadas = {agendas[t][dia, horario].sala for t in turmas if agendas[t][dia, horario] is not None}
+                antes = _conflitos_celula(agendas, turmas, dia, horario)
+                for sala in dominio.salas:
+                    if sala in usadas:
+                        continue
+                    agenda[dia, horario] = _com_sala(aula, sala)
+                    depois = _conflitos_celula(agendas, turmas, dia, horario)
+                    novo_fitness = float(sub.calcular_fitness(agenda))
+                    agenda[dia, horario] = aula
+                    ganho = novo_fitness - fitness[turma] - penalidade_conflito * (depois - antes)
+                    if ganho > melhor_ganho:
+                        melhor_ganho, melhor_movimento = ganho, ('sala', turma, (dia, horario, sala), novo_fitness)
+
+        if melhor_movimento is None:
+            break
+        tipo, turma, parametros, novo_fitness = melhor_movimento
+        agenda = agendas[turma]
+        if tipo == 'troca':
+            dia, horario, d2, h2 = parametros
+            agenda[dia, horario], agenda[d2, h2] = agenda[d2, h2], agenda[dia, horario]
+        else:
+            dia, horario, sala = parametros
+            agenda[dia, horario] = _com_sala(agenda[dia, horario], sala)
+        fitness[turma] = novo_fitness
+        movimentos += 1
+
+    return movimentos, encontrar_conflitos(agendas, turnos)
+
+def resolver_decomposto(ga: ScheduleGA_V2, n_processos: Optional[int] = None, semente: int = 42,
+                        acoplamento: bool = True, penalidade_conflito: float = 1000.0,
+                        max_iteracoes_acoplamento: int = 500, verbose: bool = True) -> ResultadoDecomposicao:
+    """
+    Resolve cada turma como um subproblema independente em um pool de processos
+    e depois reconcilia professores e salas compartilhados (acoplar)
+    - ga: motor do modelo V2 (V2, V2P, SA, LNS) com os dados e parâmetros desejados;
+      cada subproblema é uma cópia dele restrita às disciplinas da turma
+    """
+    if not isinstance(ga, ScheduleGA_V2):
+        raise ValueError("A decomposição por turma requer um motor do modelo V2")
+    if not ga.dados_carregados:
+        ga.carregar_dados()
+
+    log = print if verbose else (lambda *_: None)
+    particoes = particionar(ga)
+    subproblemas = {turma: criar_subproblema(ga, disciplinas) for turma, disciplinas in particoes.items()}
+    log(f"🧩 Decomposição em {len(subproblemas)} turmas ({ga.versao})")
+
+    inicio = time.time()
+    agendas, fitness = {}, {}
+    tarefas = [(turma, sub, semente + i) for i, (turma, sub) in enumerate(subproblemas.items())]
+    if n_processos == 1 or len(tarefas) == 1:
+        resultados = [_resolver_subproblema(*tarefa) for tarefa in tarefas]
+    else:
+        with ProcessPoolExecutor(max_workers=n_processos) as pool:
+            resultados = list(pool.map(_resolver_subproblema, *zip(*tarefas)))
+    for turma, agenda, valor, tempo, avaliacoes in resultados:
+        agendas[turma], fitness[turma] = agenda, valor
+        log(f"   {turma}: {valor:.0f} em {tempo:.1f}s ({avaliacoes} avaliações)")
+    tempo_paralelo = time.time() - inicio
+
+    turnos = {turma: _turno(ga, turma) for turma in subproblemas}
+    resultado = ResultadoDecomposicao(agendas, fitness, encontrar_conflitos(agendas, turnos),
+                                      tempo_paralelo=tempo_paralelo)
+    resultado.conflitos = list(resultado.conflitos_iniciais)
+    if acoplamento and resultado.conflitos:
+        log(f"🔗 Acoplamento: {len(resultado.conflitos)} conflitos entre turmas")
+        inicio = time.time()
+        resultado.movimentos, resultado.conflitos = acoplar(subproblemas, agendas, fitness,
+                                                            penalidade_conflito, max_iteracoes_acoplamento)
+        resultado.tempo_acoplamento = time.time() - inicio
+
+    if resultado.conflitos:
+        log(f"⚠️  {len(resultado.conflitos)} conflitos restantes entre turmas")
+    log(f"✅ Decomposição finalizada: fitness total {resultado.fitness_total:.0f} "
+        f"({resultado.movimentos} movimentos de acoplamento)")
+    return resultado
@@ -4,9 +4,10 @@ import numpy as np
 import time
 from genetic_scheduler import ScheduleGA  # V1 - Penalização + Lista
 from genetic_scheduler_v2 import ScheduleGA_V2  # V2 - Pontuação + Agenda
+from simulated_annealing import ScheduleSA  # Baseline não genético (modelo da V2)
 
 def comparar_abordagens():
-    """Compara as duas abordagens: V1 (Penalização) vs V2 (Pontuação)"""
+    """Compara as duas abordagens: V1 (Penalização) vs V2 (Pontuação), com o SA como baseline não genético"""
     
     print("🔬 COMPARAÇÃO: PENALIZAÇÃO vs PONTUAÇÃO")
     print("="*60)
@@ -81,13 +82,41 @@ def comparar_abordagens():
         print(f"❌ Erro no V2: {e}")
         return None
     
+    # Testar SA - baseline não genético com a mesma agenda e os mesmos pesos da V2
+    print("\n🔥 Testando SA - Simulated Annealing (agenda e pesos da V2)")
+    print("-" * 50)
+    
+    start_time = time.time()
+    sa = ScheduleSA()
+    sa.copiar_dados_de(ga_v2)
+    
+    try:
+        agenda_sa, fitness_sa, historico_sa = sa.executar()
+        tempo_sa = time.time() - start_time
+        
+        stats_sa = analisar_solucao_v2(agenda_sa, sa)
+        
+        resultados['abordagem'].append('SA - Annealing')
+        resultados['tempo_execucao'].append(tempo_sa)
+        resultados['fitness_final'].append(fitness_sa)
+        resultados['fitness_normalizado'].append(fitness_sa / 15000)  # Mesma escala da V2
+        resultados['convergencia_geracao'].append(len(historico_sa))
+        resultados['disciplinas_completas'].append(stats_sa['disciplinas_completas'])
+        resultados['disponibilidade_respeitada'].append(stats_sa['disponibilidade_respeitada'])
+        
+        print(f"✅ SA concluído - Fitness: {fitness_sa:.0f}, Tempo: {tempo_sa:.1f}s")
+        
+    except Exception as e:
+        print(f"❌ Erro no SA: {e}")
+        return None
+    
     # Gerar relatório comparativo
     gerar_relatorio_comparativo(resultados, historico_v1, historico_v2)
     
     # Plotar comparações
-    plotar_comparacao(resultados, historico_v1, historico_v2)
+    plotar_comparacao(resultados, historico_v1, historico_v2, historico_sa)
     
-    return resultados, (solucao_v1, ga_v1), (agenda_v2, ga_v2)
+    return resultados, (solucao_v1, ga_v1), (agenda_v2, ga_v2), (agenda_sa, sa)
 
 def analisar_solucao_v1(cromossomo, ga):
     """Analisa estatísticas da solução V1"""
@@ -219,8 +248,17 @@ def gerar_relatorio_comparativo(resultados, historico_v1, historico_v2):
         print(f"  👨‍🏫 V2 respeitou melhor a disponibilidade dos professores")
     else:
         print(f"  🤝 Ambos respeitaram igualmente a disponibilidade")
+    
+    # Baseline não genético: mesma escala de pontuação da V2
+    if len(df) > 2:
+        sa_idx = 2
+        print(f"\n🔥 BASELINE SA (mesmos pesos da V2):")
+        diferenca_fitness = df.iloc[sa_idx]['fitness_final'] - df.iloc[v2_idx]['fitness_final']
+        print(f"  🎯 SA - V2 = {diferenca_fitness:+.0f} pontos")
+        print(f"  ⏱️  SA levou {df.iloc[sa_idx]['tempo_execucao']:.2f}s contra "
+              f"{df.iloc[v2_idx]['tempo_execucao']:.2f}s da V2")
 
-def plotar_comparacao(resultados, historico_v1, historico_v2):
+def plotar_comparacao(resultados, historico_v1, historico_v2, historico_sa=None):
     """Plota gráficos comparativos"""
     fig, axes = plt.subplots(2, 2, figsize=(15, 10))
     fig.suptitle('Comparação: Penalização vs Pontuação', fontsize=16, fontweight='bold')
@@ -232,6 +270,10 @@ def plotar_comparacao(resultados, historico_v1, historico_v2):
     # Normalizar V2 para comparação visual
     historico_v2_norm = np.array(historico_v2) / max(historico_v2) * max(historico_v1)
     axes[0,0].plot(historico_v2_norm, label='V2 - Pontuação (norm)', linewidth=2, alpha=0.8)
+    if historico_sa is not None:
+        # Mesma normalização da V2 (mesma escala de pontuação); x = épocas
+        historico_sa_norm = np.array(historico_sa) / max(historico_v2) * max(historico_v1)
+        axes[0,0].plot(historico_sa_norm, label='SA - Annealing (norm, épocas)', linewidth=2, alpha=0.8)
     axes[0,0].set_title('Evolução do Fitness')
     axes[0,0].set_xlabel('Geração')
     axes[0,0].set_ylabel('Fitness')
@@ -240,7 +282,7 @@ def plotar_comparacao(resultados, historico_v1, historico_v2):
     
     # 2. Tempo de Execução
     axes[0,1].bar(df['abordagem'], df['tempo_execucao'], 
-                  color=['skyblue', 'lightcoral'], alpha=0.8)
+                  color=['skyblue', 'lightcoral', 'khaki'][:len(df)], alpha=0.8)
     axes[0,1].set_title('Tempo de Execução')
     axes[0,1].set_ylabel('Segundos')
     for i, v in enumerate(df['tempo_execucao']):
@@ -258,6 +300,10 @@ def plotar_comparacao(resultados, historico_v1, historico_v2):
                   color='skyblue', alpha=0.8)
     axes[1,0].bar(x + width/2, v2_values, width, label='V2 - Pontuação', 
                   color='lightcoral', alpha=0.8)
+    if len(df) > 2:
+        sa_values = [df.iloc[2][m] for m in metricas]
+        axes[1,0].bar(x + 1.5 * width, sa_values, width, label='SA - Annealing',
+                      color='khaki', alpha=0.8)
     
     axes[1,0].set_title('Comparação de Qualidade')
     axes[1,0].set_ylabel('Score (0-1)')
@@ -365,7 +411,7 @@ def executar_comparacao_completa():
     # Executar comparação prática
     print("\n🚀 Iniciando testes práticos...")
     try:
-        resultados, (sol_v1, ga_v1), (agenda_v2, ga_v2) = comparar_abordagens()
+        resultados, (sol_v1, ga_v1), (agenda_v2, ga_v2), (agenda_sa, sa) = comparar_abordagens()
         
         if resultados:
             print("\n✅ Comparação concluída com sucesso!")
@@ -400,6 +446,11 @@ def executar_comparacao_completa():
                 print("V2 - SOLUÇÃO COM PONTUAÇÃO")
                 print("="*60)
                 ga_v2.exibir_agenda(agenda_v2)
+                
+                print("\n" + "="*60)
+                print("SA - SOLUÇÃO COM SIMULATED ANNEALING")
+                print("="*60)
+                sa.exibir_agenda(agenda_sa)
         
         return resultados
         
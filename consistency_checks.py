@@ -0,0 +1,72 @@
+import pickle
+import random
+import sys
+import numpy as np
+from permutation_v2 import ScheduleGA_V2_Permutacao
+from simulated_annealing import ModeloIncremental, ScheduleSA
+
+def _disciplinas(agenda: np.ndarray) -> list:
+    return [None if aula is None else aula.disciplina for aula in agenda.ravel()]
+
+def verificar_codificacao_permutacao(ga: ScheduleGA_V2_Permutacao, repeticoes: int = 20) -> int:
+    """
+    decodificar(codificar(cópia serializada)) preserva a disciplina de cada célula
+    (soluções migradas pelo portfólio chegam via pickle). Retorna as divergências
+    """
+    divergencias = 0
+    for _ in range(repeticoes):
+        agenda = ga.decodificar(ga.criar_cromossomo())
+        copia = pickle.loads(pickle.dumps(agenda))
+        if _disciplinas(ga.decodificar(ga.codificar(copia))) != _disciplinas(agenda):
+            divergencias += 1
+    return divergencias
+
+def verificar_deltas_incrementais(ga: ScheduleSA, trocas: int = 3000, tolerancia: float = 1e-6) -> int:
+    """
+    ModeloIncremental.delta_troca coincide com a diferença de calcular_fitness
+    antes e depois de cada troca; as trocas são aplicadas, então a agenda percorre
+    um passeio aleatório. Retorna as divergências
+    """
+    modelo = ModeloIncremental(ga, ga.criar_cromossomo())
+    celulas = [(dia, horario) for dia in range(ga.num_dias) for horario in range(ga.num_horarios)]
+    divergencias = 0
+    fitness = ga.calcular_fitness(modelo.agenda)
+    for _ in range(trocas):
+        (dia1, hora1), (dia2, hora2) = random.sample(celulas, 2)
+        delta = modelo.delta_troca(dia1, hora1, dia2, hora2)
+        modelo.trocar(dia1, hora1, dia2, hora2)
+        novo_fitness = ga.calcular_fitness(modelo.agenda)
+        if abs(delta - (novo_fitness - fitness)) > tolerancia:
+            divergencias += 1
+        fitness = novo_fitness
+    return divergencias
+
+def executar_verificacoes(seed: int = 42) -> bool:
+    """Roda todas as verificações com os dados de entrada; retorna se todas passaram"""
+    random.seed(seed)
+    np.random.seed(seed)
+    permutacao = ScheduleGA_V2_Permutacao()
+    permutacao.verbose = False
+    permutacao.carregar_dados()
+
+    recozimento = ScheduleSA()
+    recozimento.verbose = False
+    recozimento.copiar_dados_de(permutacao)
+    deltas_sem_referencia = verificar_deltas_incrementais(recozimento)
+    # Referência com parte das células coincidindo, para exercitar aula_mantida
+    recozimento.agenda_referencia = np.array(
+        [[None if aula is None else aula.disciplina for aula in linha]
+         for linha in recozimento.decodificar(recozimento.criar_cromossomo())], dtype=object)
+    deltas_com_referencia = verificar_deltas_incrementais(recozimento)
+
+    resultados = {
+        'codificação da V2P (cópias via pickle)': verificar_codificacao_permutacao(permutacao),
+        'deltas do SA sem agenda de referência': deltas_sem_referencia,
+        'deltas do SA com agenda de referência': deltas_com_referencia,
+    }
+    for nome, divergencias in resultados.items():
+        print(f"{'✅' if divergencias == 0 else '❌'} {nome}: {divergencias} divergências")
+    return all(divergencias == 0 for divergencias in resultados.values())
+
+if __name__ == "__main__":
+    sys.exit(0 if executar_verificacoes() else 1)
@@ -0,0 +1,273 @@
+import random
+import time
+import numpy as np
+from dataclasses import dataclass, field
+from typing import List, Optional, Set
+from domain_pruning import celulas_disponiveis
+from feasibility_check import _emparelhamento_maximo, _violacao_hall
+
+# Relações binárias entre as células de duas aulas (y em relação a x)
+DIFERENTE, MESMO_DIA, OUTRO_DIA, MAIOR, MENOR = range(5)
+
+@dataclass
+class ResultadoCSP:
+    """Resultado do solver de restrições rígidas"""
+    status: str                                  # 'viavel', 'inviavel' ou 'limite'
+    agenda: Optional[np.ndarray] = None
+    nos: int = 0                                 # Atribuições tentadas
+    saltos: int = 0                              # Retrocessos que pularam níveis (backjumps)
+    tempo_ms: float = 0.0
+    conflito: List[str] = field(default_factory=list)  # Disciplinas envolvidas na prova de inviabilidade
+
+    @property
+    def viavel(self) -> bool:
+        return self.status == 'viavel'
+
+class SolverRestricoes:
+    """
+    Backtracking sobre bitsets para as restrições rígidas do modelo V2
+    - Variáveis: aulas obrigatórias; domínio: máscara de bits das células (dia * H + horário)
+      em que o professor está disponível no turno da turma
+    - Aulas que dividem turma, professor ou sala ocupam células distintas
+    - Com respeitar_distribuicao, aulas do mesmo grupo ficam no mesmo dia e
+      grupos diferentes da disciplina em dias diferentes
+    - Ordenação MRV (menor domínio, depois maior grau), forward checking e
+      backjumping dirigido por conflitos (FC-CBJ)
+    - Aulas idênticas recebem células em ordem crescente (quebra de simetria)
+    """
+
+    def __init__(self, ga, respeitar_distribuicao: bool = True, limite_nos: int = 200000,
+                 aleatorio: bool = False):
+        self.ga = ga
+        self.respeitar_distribuicao = respeitar_distribuicao
+        self.limite_nos = limite_nos
+        self.aleatorio = aleatorio
+        self.aulas = list(ga.aulas_obrigatorias)
+        self.num_celulas = ga.num_dias * ga.num_horarios
+        self._montar_mascaras()
+        self._montar_restricoes()
+
+    def _montar_mascaras(self):
+        """Máscara de cada relação para cada célula de x"""
+        num_horarios = self.ga.num_horarios
+        cheia = (1 << self.num_celulas) - 1
+        dia = [0] * self.ga.num_dias
+        for c in range(self.num_celulas):
+            dia[c // num_horarios] |= 1 << c
+        self.cheia = cheia
+        self.mascaras = {
+            DIFERENTE: [cheia & ~(1 << c) for c in range(self.num_celulas)],
+            MESMO_DIA: [dia[c // num_horarios] for c in range(self.num_celulas)],
+            OUTRO_DIA: [cheia & ~dia[c // num_horarios] for c in range(self.num_celulas)],
+            MAIOR: [cheia & ~((1 << (c + 1)) - 1) for c in range(self.num_celulas)],
+            MENOR: [(1 << c) - 1 for c in range(self.num_celulas)],
+        }
+
+    def _montar_restricoes(self):
+        """Domínios iniciais e lista de vizinhos (y, relação de y com x) de cada aula"""
+        ga = self.ga
+        num_horarios = ga.num_horarios
+        self.dominios_iniciais = []
+        for aula in self.aulas:
+            turma = ga.turmas.get(ga.disciplinas[aula.disciplina].turma)
+            celulas = celulas_disponiveis(aula.professor, turma, ga.disponibilidades, ga.dias, ga.horarios)
+            mascara = 0
+            for d, h in celulas:
+                mascara |= 1 << (d * num_horarios + h)
+            self.dominios_iniciais.append(mascara)
+
+        def turma(aula):
+            return ga.disciplinas[aula.disciplina].turma
+
+        n = len(self.aulas)
+        self.vizinhos = [[] for _ in range(n)]
+        for x in range(n):
+            a = self.aulas[x]
+            for y in range(x + 1, n):
+                b = self.aulas[y]
+                relacoes = []
+                if turma(a) == turma(b) or a.professor == b.professor or a.sala == b.sala:
+                    relacoes.append((DIFERENTE, DIFERENTE))
+                if a.disciplina == b.disciplina:
+                    mesmo_grupo = getattr(a, 'grupo_dia', 0) == getattr(b, 'grupo_dia', 0)
+                    if self.respeitar_distribuicao:
+                        relacoes.append((MESMO_DIA, MESMO_DIA) if mesmo_grupo else (OUTRO_DIA, OUTRO_DIA))
+                    if mesmo_grupo or not self.respeitar_distribuicao:
+                        # Aulas intercambiáveis: x antes de y
+                        relacoes.append((MAIOR, MENOR))
+                for relacao_y, relacao_x in relacoes:
+                    self.vizinhos[x].append((y, relacao_y))
+                    self.vizinhos[y].append((x, relacao_x))
+
+    def resolver(self) -> ResultadoCSP:
+        """Procura uma atribuição que satisfaça todas as restrições rígidas"""
+        inicio = time.perf_counter()
+        n = len(self.aulas)
+        self.dominios = list(self.dominios_iniciais)
+        self.valor = [None] * n
+        self.profundidade = [None] * n
+        self.pilha = []
+        self.podado_por = [[] for _ in range(n)]   # Variáveis atribuídas que reduziram cada domínio
+        self.nos = 0
+        self.saltos = 0
+
+        resultado = ResultadoCSP(status='inviavel')
+        vazias = [x for x in range(n) if not self.dominios[x]] or self._violacao_emparelhamento()
+        if vazias:
+            resultado.conflito = sorted({self.aulas[x].disciplina for x in vazias})
+        else:
+            try:
+                saida = self._buscar()
+                if saida is True:
+                    resultado.status = 'viavel'
+                    resultado.agenda = self._montar_agenda()
+                else:
+                    _, conflito = saida
+                    resultado.conflito = sorted({self.aulas[x].disciplina for x in conflito})
+            except _LimiteAtingido:
+                resultado.status = 'limite'
+
+        resultado.nos = self.nos
+        resultado.saltos = self.saltos
+        resultado.tempo_ms = (time.perf_counter() - inicio) * 1000
+        return resultado
+
+    def _violacao_emparelhamento(self) -> List[int]:
+        """
+        Aulas da mesma turma precisam de células distintas: sem emparelhamento
+        perfeito aula -> célula, retorna as aulas de um conjunto de Hall violado
+        (prova inviabilidade sem busca)
+        """
+        por_turma = {}
+        for x, aula in enumerate(self.aulas):
+            por_turma.setdefault(self.ga.disciplinas[aula.disciplina].turma, []).append(x)
+        for variaveis in por_turma.values():
+            vizinhos = [[c for c in range(self.num_celulas) if self.dominios[x] >> c & 1] for x in variaveis]
+            par_celula = _emparelhamento_maximo(vizinhos)
+            if len(par_celula) < len(variaveis):
+                conjunto, _ = _violacao_hall(vizinhos, par_celula)
+                return [variaveis[i] for i in conjunto]
+        return []
+
+    def _escolher_variavel(self) -> int:
+        """MRV: menor domínio; empate pelo maior número de vizinhos não atribuídos"""
+        melhor, chave_melhor = None, None
+        for x in range(len(self.aulas)):
+            if self.valor[x] is not None:
+                continue
+            chave = (bin(self.dominios[x]).count('1'),
+                     -sum(1 for y, _ in self.vizinhos[x] if self.valor[y] is None))
+            if chave_melhor is None or chave < chave_melhor:
+                melhor, chave_melhor = x, chave
+        return melhor
+
+    def _valores(self, dominio: int) -> List[int]:
+        valores = [c for c in range(self.num_celulas) if dominio >> c & 1]
+        if self.aleatorio:
+            random.shuffle(valores)
+        return valores
+
+    def _propagar(self, x: int, c: int):
+        """Forward checking; retorna (reduções, variável esvaziada ou None)"""
+        reducoes = []
+        for y, relacao in self.vizinhos[x]:
+            if self.valor[y] is not None:
+                continue
+            novo = self.dominios[y] & self.mascaras[relacao][c]
+            if novo != self.dominios[y]:
+                reducoes.append((y, self.dominios[y]))
+                self.dominios[y] = novo
+                self.podado_por[y].append(x)
+                if not novo:
+                    return reducoes, y
+        return reducoes, None
+
+    def _desfazer(self, x: int, reducoes):
+        for y, dominio in reversed(reducoes):
+            self.dominios[y] = dominio
+            self.podado_por[y].pop()
+
+    def _buscar(self):
+        """True em caso de sucesso; senão (variável alvo do salto, conjunto de conflito)"""
+        x = self._escolher_variavel()
+        if x is None:
+            return True
+
+        conflito: Set[int] = set()
+        envolvidas = {x}   # Para o diagnóstico quando a inviabilidade é provada
+        for c in self._valores(self.dominios[x]):
+            self.nos += 1
+            if self.nos > self.limite_nos:
+                raise _LimiteAtingido()
+
+            self.valor[x] = c
+            self.profundidade[x] = len(self.pilha)
+            self.pilha.append(x)
+            reducoes, esvaziada = self._propagar(x, c)
+
+            if esvaziada is None:
+                saida = self._buscar()
+                if saida is True:
+                    return True
+                alvo, conflito_filho = saida
+                self._desfazer(x, reducoes)
+                self._liberar(x)
+                if alvo != x:
+                    return saida
+                conflito |= conflito_filho - {x}
+                envolvidas |= conflito_filho
+            else:
+                conflito |= set(self.podado_por[esvaziada]) - {x}
+                envolvidas |= {esvaziada}
+                self._desfazer(x, reducoes)
+                self._liberar(x)
+
+        # Sem valores: salta para a variável mais profunda do conflito
+        conflito |= set(self.podado_por[x])
+        if not conflito:
+            return None, envolvidas
+        alvo = max(conflito, key=lambda v: self.profundidade[v])
+        if self.profundidade[alvo] < len(self.pilha) - 1:
+            self.saltos += 1
+        return alvo, conflito
+
+    def _liberar(self, x: int):
+        self.pilha.pop()
+        self.valor[x] = None
+        self.profundidade[x] = None
+
+    def _montar_agenda(self) -> np.ndarray:
+        agenda = self.ga.criar_agenda_vazia()
+        for aula, c in zip(self.aulas, self.valor):
+            agenda[c // self.ga.num_horarios, c % self.ga.num_horarios] = aula
+        return agenda
+
+class _LimiteAtingido(Exception):
+    pass
+
+def resolver_agenda(ga, respeitar_distribuicao: bool = True, limite_nos: int = 200000,
+                    aleatorio: bool = False) -> ResultadoCSP:
+    """
+    Resolve as restrições rígidas dos dados carregados em um motor do modelo V2
+    Sem solução com a distribuição planejada (inviável ou limite de nós), tenta de novo sem ela
+    """
+    resultado = SolverRestricoes(ga, respeitar_distribuicao, limite_nos, aleatorio).resolver()
+    if respeitar_distribuicao and not resultado.viavel:
+        resultado = SolverRestricoes(ga, False, limite_nos, aleatorio).resolver()
+    return resultado
+
+def gerar_sementes(ga, quantidade: int, limite_nos: int = 200000) -> List[np.ndarray]:
+    """Até `quantidade` agendas viáveis distintas (ordem de valores aleatória), para semear a população"""
+    sementes = []
+    vistas = set()
+    for _ in range(quantidade * 3):
+        if len(sementes) >= quantidade:
+            break
+        resultado = resolver_agenda(ga, limite_nos=limite_nos, aleatorio=True)
+        if not resultado.viavel:
+            break
+        chave = tuple(str(aula) for aula in resultado.agenda.ravel())
+        if chave not in vistas:
+            vistas.add(chave)
+            sementes.append(resultado.agenda)
+    return sementes
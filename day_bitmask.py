@@ -0,0 +1,71 @@
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Tuple
+import numpy as np
+
+class TabelasMascara(NamedTuple):
+    """
+    Tabelas pré-calculadas indexadas pela máscara de ocupação de um dia
+    (bit h = 1 se o horário h está ocupado)
+    - ocupados: número de horários ocupados
+    - janelas: horários vazios entre o primeiro e o último ocupado
+    - maior_sequencia: maior bloco de horários consecutivos ocupados
+    - extensao: último - primeiro + 1 (0 para o dia vazio)
+    """
+    ocupados: Tuple[int, ...]
+    janelas: Tuple[int, ...]
+    maior_sequencia: Tuple[int, ...]
+    extensao: Tuple[int, ...]
+
+@lru_cache(maxsize=None)
+def tabelas_mascara(num_horarios: int) -> TabelasMascara:
+    """Calcula (uma única vez por tamanho de turno) as tabelas para todas as 2^n máscaras"""
+    if num_horarios < 1 or num_horarios > 20:
+        raise ValueError(f"num_horarios deve estar entre 1 e 20 (recebido {num_horarios})")
+
+    mascaras = np.arange(1 << num_horarios, dtype=np.int64)
+    bits = (mascaras[:, None] >> np.arange(num_horarios)) & 1
+
+    ocupados = bits.sum(axis=1)
+
+    # Primeiro e último bit ocupado (vale 0 para a máscara vazia)
+    primeiro = np.where(ocupados > 0, bits.argmax(axis=1), 0)
+    ultimo = np.where(ocupados > 0, num_horarios - 1 - bits[:, ::-1].argmax(axis=1), -1)
+    extensao = np.maximum(ultimo - primeiro + 1, 0)
+    janelas = extensao - ocupados
+
+    # Maior sequência: tamanho da sequência corrente em cada bit, depois o máximo
+    sequencia = np.zeros_like(bits)
+    sequencia[:, 0] = bits[:, 0]
+    for h in range(1, num_horarios):
+        sequencia[:, h] = (sequencia[:, h - 1] + 1) * bits[:, h]
+    maior_sequencia = sequencia.max(axis=1)
+
+    return TabelasMascara(
+        ocupados=tuple(int(v) for v in ocupados),
+        janelas=tuple(int(v) for v in janelas),
+        maior_sequencia=tuple(int(v) for v in maior_sequencia),
+        extensao=tuple(int(v) for v in extensao)
+    )
+
+def mascaras_agenda(agenda: np.ndarray) -> Tuple[List[int], Dict[str, List[int]]]:
+    """
+    Codifica uma agenda (dias x horários de Aula/None) em máscaras de bits
+    Retorna (máscara de ocupação por dia, {disciplina: máscara por dia})
+    """
+    num_dias, num_horarios = agenda.shape
+    ocupacao = [0] * num_dias
+    por_disciplina = {}
+
+    for dia in range(num_dias):
+        linha = agenda[dia]
+        for horario in range(num_horarios):
+            aula = linha[horario]
+            if aula is not None:
+                bit = 1 << horario
+                ocupacao[dia] |= bit
+                mascaras = por_disciplina.get(aula.disciplina)
+                if mascaras is None:
+                    mascaras = por_disciplina[aula.disciplina] = [0] * num_dias
+                mascaras[dia] |= bit
+
+    return ocupacao, por_disciplina
@@ -0,0 +1,139 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Set, Tuple
+
+@dataclass
+class DominioDisciplina:
+    """Células (dia, horário) e salas em que as aulas de uma disciplina podem ocorrer"""
+    disciplina: str
+    turma: str
+    professor: str
+    carga_horaria: int
+    celulas: Set[Tuple[int, int]]
+    salas: List[str]
+    fixadas: Set[Tuple[int, int]] = field(default_factory=set)  # Forçadas pela propagação
+
+    @property
+    def totalmente_fixada(self) -> bool:
+        """Todas as aulas já têm célula determinada"""
+        return len(self.fixadas) >= self.carga_horaria and self.fixadas == self.celulas
+
+def _normalizar_turno(turno) -> str:
+    return str(turno).strip().lower()
+
+def professor_por_disciplina(professores: Dict) -> Dict[str, str]:
+    """Professor responsável por cada disciplina (o primeiro cadastrado, como nos motores)"""
+    responsaveis = {}
+    for prof_codigo, prof in professores.items():
+        responsaveis.setdefault(prof.disciplina, prof_codigo)
+    return responsaveis
+
+def celulas_disponiveis(professor: str, turma, disponibilidades: Dict,
+                        dias: List[str], horarios: List[str]) -> Set[Tuple[int, int]]:
+    """Células (dia, horário) em que o professor está disponível no turno da turma"""
+    indice_dia = {nome: i for i, nome in enumerate(dias)}
+    indice_horario = {nome: i for i, nome in enumerate(horarios)}
+
+    celulas = set()
+    for disp in disponibilidades.get(professor, []):
+        if turma is not None and _normalizar_turno(disp.turno) != _normalizar_turno(turma.turno):
+            continue
+        if disp.dia in indice_dia and disp.horario in indice_horario:
+            celulas.add((indice_dia[disp.dia], indice_horario[disp.horario]))
+    return celulas
+
+def calcular_dominios(disciplinas: Dict, professores: Dict, salas: Dict, turmas: Dict,
+                      disponibilidades: Dict, dias: List[str], horarios: List[str],
+                      avisos: List[str] = None) -> Dict[str, DominioDisciplina]:
+    """
+    Calcula o domínio viável de cada disciplina antes da evolução
+    - Turno: só vale a disponibilidade do professor no turno da turma
+    - Disponibilidade: células em que o professor está disponível
+    - Capacidade: salas que comportam a quantidade de alunos da turma
+    - Propagação: disciplina com exatamente `carga_horaria` células tem as aulas
+      forçadas, e essas células saem do domínio das disciplinas que dividem
+      turma, professor ou sala única (repete até estabilizar)
+    Domínios vazios voltam para a grade completa e geram um aviso em `avisos`
+    """
+    if avisos is None:
+        avisos = []
+
+    grade_completa = {(d, h) for d in range(len(dias)) for h in range(len(horarios))}
+    professor_disciplina = professor_por_disciplina(professores)
+
+    dominios = {}
+    for disc_codigo, disciplina in disciplinas.items():
+        turma = turmas.get(disciplina.turma)
+        professor = professor_disciplina.get(disc_codigo)
+
+        celulas = celulas_disponiveis(professor, turma, disponibilidades, dias, horarios)
+        if not celulas:
+            avisos.append(f"Disciplina {disc_codigo}: professor sem disponibilidade no turno da turma")
+            celulas = set(grade_completa)
+
+        alunos = turma.quantidade_alunos if turma is not None else 0
+        salas_viaveis = [codigo for codigo, sala in salas.items() if sala.capacidade >= alunos]
+        if not salas_viaveis:
+            avisos.append(f"Disciplina {disc_codigo}: nenhuma sala comporta {alunos} alunos")
+            salas_viaveis = list(salas.keys())
+
+        dominios[disc_codigo] = DominioDisciplina(
+            disciplina=disc_codigo,
+            turma=disciplina.turma,
+            professor=professor,
+            carga_horaria=int(disciplina.carga_horaria),
+            celulas=celulas,
+            salas=salas_viaveis
+        )
+
+    propagar_fixacoes(dominios, avisos)
+    return dominios
+
+def _compartilham_recurso(a: DominioDisciplina, b: DominioDisciplina) -> bool:
+    """Duas disciplinas não podem ocupar a mesma célula"""
+    if a.turma == b.turma or (a.professor is not None and a.professor == b.professor):
+        return True
+    return len(a.salas) == 1 and a.salas == b.salas
+
+def propagar_fixacoes(dominios: Dict[str, DominioDisciplina], avisos: List[str] = None):
+    """Fixa domínios de tamanho igual à carga e remove essas células dos vizinhos"""
+    if avisos is None:
+        avisos = []
+
+    conflitos_reportados = set()
+    mudou = True
+    while mudou:
+        mudou = False
+        for dominio in dominios.values():
+            if len(dominio.celulas) == dominio.carga_horaria and dominio.fixadas != dominio.celulas:
+                dominio.fixadas = set(dominio.celulas)
+                mudou = True
+
+        for dominio in dominios.values():
+            if not dominio.fixadas:
+                continue
+            for outro in dominios.values():
+                if outro is dominio or not _compartilham_recurso(dominio, outro):
+                    continue
+                conflito = outro.celulas & dominio.fixadas
+                if not conflito:
+                    continue
+                if len(outro.celulas) - len(conflito) >= outro.carga_horaria:
+                    outro.celulas -= conflito
+                    mudou = True
+                elif (dominio.disciplina, outro.disciplina) not in conflitos_reportados:
+                    # Remover deixaria o vizinho sem células suficientes: mantém e avisa
+                    conflitos_reportados.add((dominio.disciplina, outro.disciplina))
+                    avisos.append(f"Disciplinas {dominio.disciplina} e {outro.disciplina} "
+                                  f"disputam as mesmas células fixadas")
+
+    return dominios
+
+def resumo_dominios(dominios: Dict[str, DominioDisciplina], total_celulas: int) -> Dict[str, float]:
+    """Tamanho do espaço de busca antes e depois da poda"""
+    celulas = [len(d.celulas) for d in dominios.values()]
+    return {
+        'disciplinas': len(dominios),
+        'celulas_media': sum(celulas) / max(len(celulas), 1),
+        'reducao_percentual': 100 * (1 - sum(celulas) / max(total_celulas * len(celulas), 1)),
+        'disciplinas_fixadas': sum(1 for d in dominios.values() if d.fixadas)
+    }
@@ -0,0 +1,304 @@
+import copy
+import random
+import time
+import numpy as np
+from typing import List, Optional, Tuple
+from execution_events import RegistroReinicio, emitir_evento
+from hall_of_fame import HallDaFama
+from operator_selection import SelecaoOperadores, gerar_filhos, creditar_filho
+from population_diversity import hash_genomas, indices_duplicados, entropia_posicional
+
+class MecanismosEvolutivos:
+    """
+    Maquinaria comum aos motores genéticos V1 e V2 (e derivados): modo estacionário,
+    diversidade, reinícios, hall da fama, adaptação de taxas e seleção de operadores
+    O motor fornece versao, criar_cromossomo, decodificar, _matriz_genomas,
+    _indice_torneio, _log e os ganchos _cruzar, _mutar e _avaliar_individuo
+    """
+    
+    def _inicializar_mecanismos(self):
+        """Parâmetros e estado da maquinaria (chamado no __init__ do motor)"""
+        # Substituição: 'geracional' (padrão) ou 'estacionario' (steady-state)
+        self.modo_substituicao = 'geracional'
+        self.filhos_por_passo = 2
+        self.substituicao = 'torneio'  # Quem sai no modo estacionário: 'torneio' (perdedor) ou 'pior'
+        
+        # Diversidade: eliminação de duplicatas (hash do genoma) e renovação
+        self.eliminar_duplicatas = False
+        self.limiar_diversidade = 0.0      # Entropia posicional mínima (0 desliga a renovação)
+        self.fracao_renovacao = 0.5        # Fração renovada quando a diversidade colapsa
+        self.proporcao_renovacao_mutada = 0.5  # Renovados: cópias mutadas x novos indivíduos
+        self.historico_diversidade = []
+        
+        # Reinício por estagnação: None (desligado), 'parcial', 'explosao_mutacao' ou 'total'
+        self.estrategia_reinicio = None
+        self.geracoes_estagnacao = 50      # Gerações sem melhora global que disparam o reinício
+        self.fracao_elite_reinicio = 0.1   # Parcial: fração dos melhores mantida
+        self.fator_explosao = 3.0          # Explosão: multiplicador da taxa de mutação
+        self.geracoes_explosao = 10        # Explosão: duração em gerações
+        self.tamanho_hall_da_fama = 10     # Soluções distintas guardadas no hall da fama
+        self.hall_da_fama = HallDaFama(self.tamanho_hall_da_fama)
+        self.historico_reinicios = []
+        self._taxa_mutacao_base = None
+        self._fim_explosao = None
+        
+        # Adaptação das taxas durante a execução: None, 'um_quinto' ou 'diversidade'
+        self.adaptacao_taxas = None
+        self.fator_adaptacao = 0.85               # Multiplicador por geração (e seu inverso)
+        self.limites_taxa_mutacao = (0.01, 0.5)
+        self.limites_taxa_crossover = (0.5, 1.0)
+        self.diversidade_alvo = (0.2, 0.6)        # Faixa desejada de diversidade ('diversidade')
+        self.historico_taxas = []
+        self._fitness_pais = None
+        self._sucessos = []
+        
+        # Seleção adaptativa de operadores: None, 'ucb' ou 'probabilidade'
+        self.selecao_operadores = None
+        self.parametros_selecao = {}              # Repassados a SelecaoOperadores
+        self.estatisticas_operadores = None
+        self._bandits = None
+        self._origens = None
+    
+    def _cruzar(self, pai1, pai2) -> Tuple[object, object]:
+        """Crossover padrão do motor (sem seleção de operadores)"""
+        raise NotImplementedError
+    
+    def _mutar(self, individuo):
+        """Mutação padrão do motor (sem seleção de operadores)"""
+        raise NotImplementedError
+    
+    def _avaliar_individuo(self, individuo) -> Tuple[float, Optional[np.ndarray]]:
+        """(fitness, linha de componentes ou None) de um indivíduo"""
+        raise NotImplementedError
+    
+    def _preservar_diversidade(self, populacao: list, protegidos=()) -> List[int]:
+        """
+        Elimina clones e renova a população quando a diversidade colapsa (no lugar)
+        - Duplicatas (mesmo hash de genoma) são substituídas
+        - Entropia posicional abaixo de limiar_diversidade renova fracao_renovacao
+          dos indivíduos não protegidos
+        - Substitutos: cópias mutadas de sobreviventes ou novos cromossomos
+        Retorna os índices substituídos
+        """
+        protegidos = list(protegidos)
+        matriz = self._matriz_genomas(populacao)
+        substituir = indices_duplicados(hash_genomas(matriz), protegidos) if self.eliminar_duplicatas else []
+        
+        entropia = entropia_posicional(matriz)
+        self.historico_diversidade.append(entropia)
+        
+        if self.limiar_diversidade > 0 and entropia < self.limiar_diversidade:
+            bloqueados = set(protegidos) | set(substituir)
+            livres = [i for i in range(len(populacao)) if i not in bloqueados]
+            quantidade = min(len(livres), int(self.fracao_renovacao * len(populacao)))
+            substituir = sorted(set(substituir) | set(random.sample(livres, quantidade)))
+            self._log(f"Diversidade baixa (entropia {entropia:.3f}): renovando {len(substituir)} indivíduos")
+        
+        if substituir:
+            descartados = set(substituir)
+            sobreviventes = [i for i in range(len(populacao)) if i not in descartados]
+            for i in substituir:
+                if sobreviventes and random.random() < self.proporcao_renovacao_mutada:
+                    populacao[i] = self._mutar(populacao[random.choice(sobreviventes)])
+                else:
+                    populacao[i] = self.criar_cromossomo()
+        
+        return substituir
+    
+    def _passos_estacionarios(self, populacao: list, fitness_scores: List[float], melhor_indice: int,
+                              componentes: Optional[np.ndarray] = None) -> int:
+        """
+        Uma geração no modo estacionário: populacao_size filhos, gerados em passos
+        de filhos_por_passo, que substituem indivíduos no lugar (população pré-alocada)
+        - Só os filhos são avaliados; fitness_scores e as linhas de componentes
+          (quando o motor as produz) são atualizados junto com a população
+        - O melhor indivíduo nunca sai; seu índice é atualizado em O(1) por filho
+        Retorna o índice do melhor indivíduo
+        """
+        filhos_por_passo = max(1, self.filhos_por_passo)
+        filhos_gerados = 0
+        
+        while filhos_gerados < len(populacao):
+            filhos = []
+            while len(filhos) < filhos_por_passo:
+                indice1 = self._indice_torneio(fitness_scores)
+                indice2 = self._indice_torneio(fitness_scores)
+                referencia = max(fitness_scores[indice1], fitness_scores[indice2])
+                pai1 = copy.deepcopy(populacao[indice1])
+                pai2 = copy.deepcopy(populacao[indice2])
+                filhos.extend((filho, origem, referencia) for filho, origem in self._gerar_filhos(pai1, pai2))
+            
+            for filho, origem, referencia in filhos[:filhos_por_passo]:
+                inicio = time.process_time()
+                fitness, linha = self._avaliar_individuo(filho)
+                self.total_avaliacoes += 1
+                if self.adaptacao_taxas == 'um_quinto':
+                    # Só a regra de 1/5 consome (e esvazia) a lista de sucessos
+                    self._sucessos.append(fitness > referencia)
+                if origem is not None:
+                    creditar_filho(self._bandits, origem, fitness - referencia, time.process_time() - inicio)
+                
+                vitima = self._escolher_vitima(fitness_scores, melhor_indice)
+                populacao[vitima] = filho
+                fitness_scores[vitima] = fitness
+                if componentes is not None:
+                    componentes[vitima] = linha
+                if fitness > fitness_scores[melhor_indice]:
+                    melhor_indice = vitima
+            
+            filhos_gerados += filhos_por_passo
+        
+        return melhor_indice
+    
+    def _escolher_vitima(self, fitness_scores: List[float], melhor_indice: int) -> int:
+        """Índice a ser substituído: perdedor de um torneio ou o pior (nunca o melhor)"""
+        if self.substituicao == 'pior':
+            candidatos = range(len(fitness_scores))
+        else:
+            candidatos = random.sample(range(len(fitness_scores)),
+                                       min(self.tamanho_torneio, len(fitness_scores)))
+        candidatos = [i for i in candidatos if i != melhor_indice] or \
+                     [i for i in range(len(fitness_scores)) if i != melhor_indice]
+        return min(candidatos, key=lambda i: fitness_scores[i])
+    
+    def _preparar_selecao_operadores(self):
+        """Cria os bandits de crossover e mutação (mantém os do checkpoint ao retomar)"""
+        if not self.selecao_operadores:
+            self._bandits = None
+            return
+        self._registro_operadores = (self._operadores_crossover(), self._operadores_mutacao())
+        if self._bandits is None:
+            self._bandits = {
+                tipo: SelecaoOperadores(list(operadores), self.selecao_operadores, **self.parametros_selecao)
+                for tipo, operadores in zip(('crossover', 'mutacao'), self._registro_operadores)
+            }
+    
+    def _gerar_filhos(self, pai1, pai2) -> list:
+        """
+        Crossover + mutação de um par de pais; retorna [(filho, origem)]
+        Com selecao_operadores, os operadores são sorteados pelos bandits e a origem
+        guarda os nomes e o CPU gasto (senão origem é None)
+        """
+        if self._bandits is None:
+            filho1, filho2 = self._cruzar(pai1, pai2)
+            return [(self._mutar(filho1), None), (self._mutar(filho2), None)]
+        crossovers, mutacoes = self._registro_operadores
+        return gerar_filhos(self._bandits, crossovers, mutacoes, pai1, pai2)
+    
+    def _creditar_operadores(self, fitness_scores: List[float], tempo_avaliacao: float):
+        """Credita a cada operador a melhoria dos filhos sobre o melhor pai"""
+        if self._fitness_pais is not None and len(self._origens) == len(fitness_scores):
+            for fitness, referencia, origem in zip(fitness_scores, self._fitness_pais, self._origens):
+                if origem is not None and referencia is not None:
+                    creditar_filho(self._bandits, origem, fitness - referencia, tempo_avaliacao)
+        self._origens = None
+    
+    def _adaptar_taxas(self, geracao: int, fitness_scores: List[float], entropia=None):
+        """
+        Ajusta taxa_mutacao e taxa_crossover a cada geração
+        - 'um_quinto': regra de 1/5 de sucesso (filho melhor que o melhor pai);
+          sucesso acima de 1/5 aumenta a mutação, abaixo reduz
+        - 'diversidade': diversidade abaixo da faixa alvo aumenta a mutação e reduz
+          o crossover; acima da faixa faz o contrário (usa a entropia posicional
+          quando calculada, senão a proporção de fitness distintos)
+        A trajetória fica em historico_taxas
+        """
+        fator = self.fator_adaptacao
+        registro = {'geracao': geracao}
+        
+        if self.adaptacao_taxas == 'um_quinto':
+            if self._fitness_pais is not None and len(self._fitness_pais) == len(fitness_scores):
+                self._sucessos.extend(f > ref for f, ref in zip(fitness_scores, self._fitness_pais)
+                                      if ref is not None)
+            self._fitness_pais = None
+            if self._sucessos:
+                sucesso = float(sum(self._sucessos) / len(self._sucessos))
+                if sucesso > 0.2:
+                    self.taxa_mutacao /= fator
+                elif sucesso < 0.2:
+                    self.taxa_mutacao *= fator
+                registro['taxa_sucesso'] = sucesso
+            self._sucessos = []
+        elif self.adaptacao_taxas == 'diversidade':
+            diversidade = entropia if entropia is not None else \
+                len(set(fitness_scores)) / max(len(fitness_scores), 1)
+            if diversidade < self.diversidade_alvo[0]:
+                self.taxa_mutacao /= fator
+                self.taxa_crossover *= fator
+            elif diversidade > self.diversidade_alvo[1]:
+                self.taxa_mutacao *= fator
+                self.taxa_crossover /= fator
+            registro['diversidade'] = diversidade
+        else:
+            raise ValueError(f"Adaptação de taxas desconhecida: {self.adaptacao_taxas}")
+        
+        self.taxa_mutacao = float(np.clip(self.taxa_mutacao, *self.limites_taxa_mutacao))
+        self.taxa_crossover = float(np.clip(self.taxa_crossover, *self.limites_taxa_crossover))
+        registro['taxa_mutacao'] = self.taxa_mutacao
+        registro['taxa_crossover'] = self.taxa_crossover
+        self.historico_taxas.append(registro)
+    
+    def _reiniciar(self, populacao: list, fitness_scores: List[float], geracao: int,
+                   melhor_fitness_global: float, geracoes_sem_melhora: int, callbacks=None):
+        """
+        Aplica a estratégia de reinício configurada após estagnação
+        - 'parcial': mantém fracao_elite_reinicio dos melhores e recria o restante
+        - 'explosao_mutacao': multiplica a taxa de mutação por geracoes_explosao gerações
+        - 'total': recria toda a população (os melhores ficam no hall da fama)
+        Retorna (população, precisa_reavaliar)
+        """
+        if self.estrategia_reinicio not in ('parcial', 'explosao_mutacao', 'total'):
+            raise ValueError(f"Estratégia de reinício desconhecida: {self.estrategia_reinicio}")
+        
+        ordem = sorted(range(len(populacao)), key=lambda i: fitness_scores[i], reverse=True)
+        
+        reavaliar = True
+        if self.estrategia_reinicio == 'parcial':
+            num_elite = max(1, int(self.fracao_elite_reinicio * len(populacao)))
+            populacao = [populacao[i] for i in ordem[:num_elite]] + \
+                        [self.criar_cromossomo() for _ in range(len(populacao) - num_elite)]
+        elif self.estrategia_reinicio == 'total':
+            populacao = [self.criar_cromossomo() for _ in range(len(populacao))]
+        else:
+            if self._fim_explosao is None:
+                self._taxa_mutacao_base = self.taxa_mutacao
+                self.taxa_mutacao = min(1.0, self.taxa_mutacao * self.fator_explosao)
+            self._fim_explosao = geracao + self.geracoes_explosao
+            reavaliar = False
+        
+        registro = RegistroReinicio(
+            versao=self.versao,
+            geracao=geracao,
+            estrategia=self.estrategia_reinicio,
+            melhor_global=float(melhor_fitness_global),
+            geracoes_sem_melhora=geracoes_sem_melhora,
+            taxa_mutacao=self.taxa_mutacao
+        )
+        self.historico_reinicios.append(registro)
+        emitir_evento(callbacks, registro)
+        self._log(f"Reinício '{self.estrategia_reinicio}' na geração {geracao} "
+                  f"após {geracoes_sem_melhora} gerações sem melhora")
+        
+        return populacao, reavaliar
+    
+    def _encerrar_explosao_mutacao(self):
+        """Restaura a taxa de mutação original após uma explosão"""
+        if self._fim_explosao is not None:
+            self.taxa_mutacao = self._taxa_mutacao_base
+            self._fim_explosao = None
+    
+    def _atualizar_hall_da_fama(self, populacao: list, fitness_scores: List[float],
+                                componentes: Optional[np.ndarray] = None):
+        """
+        Oferece ao hall da fama os indivíduos da geração (com as linhas de componentes, se houver)
+        Só os que superam o pior do hall são codificados e têm o hash calculado
+        """
+        limiar = self.hall_da_fama.limiar()
+        candidatos = [i for i, fitness in enumerate(fitness_scores) if fitness > limiar]
+        if not candidatos:
+            return
+        hashes = hash_genomas(self._matriz_genomas([populacao[i] for i in candidatos])).tolist()
+        for i, chave in zip(candidatos, hashes):
+            if self.hall_da_fama.aceita(fitness_scores[i], chave):
+                self.hall_da_fama.inserir(fitness_scores[i], chave, self.decodificar(populacao[i]),
+                                          None if componentes is None else componentes[i].copy())
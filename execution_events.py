@@ -0,0 +1,125 @@
+import json
+import os
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Callable, Iterable, List, Optional
+import numpy as np
+
+@dataclass
+class RegistroGeracao:
+    """Estatísticas de uma geração emitidas durante a execução do AG"""
+    versao: str
+    geracao: int
+    melhor: float
+    media: float
+    desvio: float
+    diversidade: float
+    avaliacoes: int
+    tempo_avaliacao: float
+    entropia: Optional[float] = None  # Entropia posicional do genoma (quando calculada)
+    taxa_mutacao: Optional[float] = None
+    taxa_crossover: Optional[float] = None
+    tipo: str = 'geracao'
+
+@dataclass
+class RegistroReinicio:
+    """Reinício por estagnação registrado no histórico da execução"""
+    versao: str
+    geracao: int
+    estrategia: str
+    melhor_global: float
+    geracoes_sem_melhora: int
+    taxa_mutacao: float
+    tipo: str = 'reinicio'
+
+def criar_registro_geracao(versao: str, geracao: int, fitness_scores: List[float],
+                           avaliacoes: int, tempo_avaliacao: float,
+                           entropia: Optional[float] = None,
+                           taxa_mutacao: Optional[float] = None,
+                           taxa_crossover: Optional[float] = None) -> RegistroGeracao:
+    """Monta o registro de uma geração a partir dos fitness da população"""
+    scores = np.asarray(fitness_scores, dtype=float)
+
+    # Diversidade simples: proporção de valores de fitness distintos na população
+    diversidade = len(np.unique(scores)) / max(len(scores), 1)
+
+    return RegistroGeracao(
+        versao=versao,
+        geracao=geracao,
+        melhor=float(scores.max()),
+        media=float(scores.mean()),
+        desvio=float(scores.std()),
+        diversidade=float(diversidade),
+        avaliacoes=int(avaliacoes),
+        tempo_avaliacao=float(tempo_avaliacao),
+        entropia=None if entropia is None else float(entropia),
+        taxa_mutacao=None if taxa_mutacao is None else float(taxa_mutacao),
+        taxa_crossover=None if taxa_crossover is None else float(taxa_crossover)
+    )
+
+def emitir_evento(callbacks: Optional[Iterable[Callable]], registro) -> None:
+    """Entrega o registro para cada callback registrado"""
+    if not callbacks:
+        return
+    for callback in callbacks:
+        callback(registro)
+
+def registro_para_dict(registro) -> dict:
+    """Converte um registro (dataclass ou dict) para dicionário serializável"""
+    if isinstance(registro, dict):
+        return dict(registro)
+    return asdict(registro)
+
+class SinkJsonLines:
+    """
+    Sink que grava cada evento como uma linha JSON (arquivo em modo append)
+    - Uma linha por evento, pronta para ser lida em tempo real (tail -f)
+    - flush a cada `flush_a_cada` eventos
+    """
+
+    def __init__(self, caminho: str, flush_a_cada: int = 1):
+        pasta = os.path.dirname(caminho)
+        if pasta and not os.path.exists(pasta):
+            os.makedirs(pasta)
+
+        self.caminho = caminho
+        self.flush_a_cada = max(1, flush_a_cada)
+        self._arquivo = open(caminho, 'a', encoding='utf-8')
+        self._pendentes = 0
+
+    def __call__(self, registro):
+        self._arquivo.write(json.dumps(registro_para_dict(registro), ensure_ascii=False) + "\n")
+        self._pendentes += 1
+        if self._pendentes >= self.flush_a_cada:
+            self._arquivo.flush()
+            self._pendentes = 0
+
+    def fechar(self):
+        """Fecha o arquivo garantindo que tudo foi gravado"""
+        if not self._arquivo.closed:
+            self._arquivo.flush()
+            self._arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.fechar()
+
+class SinkBufferCircular:
+    """Sink em memória que mantém apenas os últimos `capacidade` eventos"""
+
+    def __init__(self, capacidade: int = 1000):
+        self.registros = deque(maxlen=capacidade)
+
+    def __call__(self, registro):
+        self.registros.append(registro)
+
+    def ultimos(self, n: Optional[int] = None) -> list:
+        """Retorna os últimos n eventos (todos se n for None)"""
+        if n is None:
+            return list(self.registros)
+        return list(self.registros)[-n:]
+
+    def __len__(self):
+        return len(self.registros)
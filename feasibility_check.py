@@ -0,0 +1,174 @@
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Set, Tuple
+from domain_pruning import professor_por_disciplina, celulas_disponiveis
+
+@dataclass
+class RelatorioViabilidade:
+    """Resultado da verificação prévia dos dados carregados"""
+    viavel: bool = True
+    erros: List[str] = field(default_factory=list)
+    avisos: List[str] = field(default_factory=list)
+    verificacoes: Dict[str, bool] = field(default_factory=dict)
+    tempo_ms: float = 0.0
+
+    def registrar(self, verificacao: str, problemas: List[str]):
+        """Marca a verificação como aprovada ou reprovada e guarda os erros"""
+        self.verificacoes[verificacao] = not problemas
+        if problemas:
+            self.viavel = False
+            self.erros.extend(problemas)
+
+    def exibir(self, log: Callable[[str], None] = print):
+        """Imprime o relatório resumido"""
+        status = "✅ Dados viáveis" if self.viavel else "❌ Dados INVIÁVEIS"
+        log(f"{status} (verificação em {self.tempo_ms:.1f} ms)")
+        for verificacao, aprovada in self.verificacoes.items():
+            log(f"   {'✓' if aprovada else '✗'} {verificacao}")
+        for erro in self.erros:
+            log(f"   ❌ {erro}")
+        for aviso in self.avisos:
+            log(f"   ⚠️  {aviso}")
+
+def _emparelhamento_maximo(vizinhos: List[List[Tuple[int, int]]]) -> Dict[Tuple[int, int], int]:
+    """Emparelhamento máximo aula -> célula (caminhos aumentantes de Kuhn)"""
+    par_celula = {}
+
+    def aumentar(aula: int, visitadas: Set) -> bool:
+        for celula in vizinhos[aula]:
+            if celula in visitadas:
+                continue
+            visitadas.add(celula)
+            if celula not in par_celula or aumentar(par_celula[celula], visitadas):
+                par_celula[celula] = aula
+                return True
+        return False
+
+    for aula in range(len(vizinhos)):
+        aumentar(aula, set())
+    return par_celula
+
+def _violacao_hall(vizinhos: List[List[Tuple[int, int]]],
+                   par_celula: Dict[Tuple[int, int], int]) -> Tuple[Set[int], Set[Tuple[int, int]]]:
+    """
+    Conjunto S de aulas com |N(S)| < |S| (condição de Hall violada), obtido
+    pelos caminhos alternantes a partir das aulas não emparelhadas
+    """
+    emparelhadas = set(par_celula.values())
+    conjunto = {aula for aula in range(len(vizinhos)) if aula not in emparelhadas}
+    vizinhanca = set()
+    fila = list(conjunto)
+    while fila:
+        aula = fila.pop()
+        for celula in vizinhos[aula]:
+            if celula in vizinhanca:
+                continue
+            vizinhanca.add(celula)
+            outra = par_celula.get(celula)
+            if outra is not None and outra not in conjunto:
+                conjunto.add(outra)
+                fila.append(outra)
+    return conjunto, vizinhanca
+
+def _verificar_hall(grupos: Dict[str, List[str]], carga: Dict[str, int],
+                    celulas: Dict[str, Set[Tuple[int, int]]], rotulo: str) -> List[str]:
+    """Emparelhamento perfeito das aulas de cada grupo (turma ou professor) com células distintas"""
+    problemas = []
+    for grupo, disciplinas_grupo in grupos.items():
+        aulas = [disc for disc in disciplinas_grupo for _ in range(carga[disc])]
+        vizinhos = [sorted(celulas[disc]) for disc in aulas]
+        par_celula = _emparelhamento_maximo(vizinhos)
+        if len(par_celula) < len(aulas):
+            conjunto, vizinhanca = _violacao_hall(vizinhos, par_celula)
+            disciplinas_violadas = sorted({aulas[i] for i in conjunto})
+            problemas.append(
+                f"{rotulo} {grupo}: só {len(par_celula)} de {len(aulas)} aulas podem ocupar células distintas "
+                f"(Hall: disciplinas {disciplinas_violadas} somam {len(conjunto)} aulas para "
+                f"{len(vizinhanca)} células)"
+            )
+    return problemas
+
+def verificar_viabilidade(ga, abortar: bool = False) -> RelatorioViabilidade:
+    """
+    Verificação prévia (contagem, capacidade e emparelhamento) dos dados já carregados
+    em um motor V1/V2. Retorna um RelatorioViabilidade; com abortar=True, dados
+    inviáveis levantam ValueError
+    """
+    inicio = time.perf_counter()
+    relatorio = RelatorioViabilidade()
+    num_celulas = len(ga.dias) * len(ga.horarios)
+    responsaveis = professor_por_disciplina(ga.professores)
+
+    # Dados básicos de cada disciplina
+    carga = {}
+    celulas = {}
+    turma_disciplina = {}
+    sem_professor = []
+    sem_sala = []
+    for disc_codigo, disciplina in ga.disciplinas.items():
+        carga[disc_codigo] = int(disciplina.carga_horaria)
+        turma_disciplina[disc_codigo] = disciplina.turma
+        turma = ga.turmas.get(disciplina.turma)
+        if turma is None:
+            relatorio.avisos.append(f"Disciplina {disc_codigo}: turma {disciplina.turma} não cadastrada "
+                                    f"(turno e capacidade não verificados)")
+
+        professor = responsaveis.get(disc_codigo)
+        if professor is None:
+            sem_professor.append(f"Disciplina {disc_codigo} não tem professor")
+        celulas[disc_codigo] = celulas_disponiveis(professor, turma, ga.disponibilidades,
+                                                   ga.dias, ga.horarios)
+
+        alunos = turma.quantidade_alunos if turma is not None else 0
+        if not any(sala.capacidade >= alunos for sala in ga.salas.values()):
+            sem_sala.append(f"Disciplina {disc_codigo}: nenhuma sala comporta {alunos} alunos")
+
+    relatorio.registrar('professor por disciplina', sem_professor)
+    relatorio.registrar('capacidade das salas', sem_sala)
+
+    # Contagem: carga de cada disciplina x células disponíveis
+    relatorio.registrar('disponibilidade por disciplina', [
+        f"Disciplina {disc}: {carga[disc]} aulas e só {len(celulas[disc])} horários disponíveis"
+        for disc in ga.disciplinas if len(celulas[disc]) < carga[disc]
+    ])
+
+    # Contagem: horas de cada turma x grade
+    por_turma = {}
+    for disc, turma in turma_disciplina.items():
+        por_turma.setdefault(turma, []).append(disc)
+    relatorio.registrar('carga da turma x grade', [
+        f"Turma {turma}: {sum(carga[d] for d in discs)} aulas para {num_celulas} horários"
+        for turma, discs in por_turma.items() if sum(carga[d] for d in discs) > num_celulas
+    ])
+
+    # Contagem: horas de cada professor x disponibilidade
+    por_professor = {}
+    for disc, professor in responsaveis.items():
+        if disc in carga:
+            por_professor.setdefault(professor, []).append(disc)
+    problemas_professor = []
+    for professor, discs in por_professor.items():
+        horas = sum(carga[d] for d in discs)
+        disponiveis = set().union(*(celulas[d] for d in discs))
+        if horas > len(disponiveis):
+            problemas_professor.append(f"Professor {professor}: {horas} aulas e só "
+                                       f"{len(disponiveis)} horários disponíveis")
+    relatorio.registrar('carga do professor x disponibilidade', problemas_professor)
+
+    # Contagem: total de aulas x salas x grade
+    total_aulas = sum(carga.values())
+    capacidade_total = num_celulas * len(ga.salas)
+    relatorio.registrar('total de aulas x salas', [] if total_aulas <= capacidade_total else [
+        f"{total_aulas} aulas para {capacidade_total} pares (sala, horário)"
+    ])
+
+    # Emparelhamento (condição de Hall) por turma e por professor
+    relatorio.registrar('emparelhamento por turma', _verificar_hall(por_turma, carga, celulas, 'Turma'))
+    relatorio.registrar('emparelhamento por professor',
+                        _verificar_hall(por_professor, carga, celulas, 'Professor'))
+
+    relatorio.tempo_ms = (time.perf_counter() - inicio) * 1000
+
+    if abortar and not relatorio.viavel:
+        raise ValueError("Dados inviáveis: " + "; ".join(relatorio.erros))
+    return relatorio
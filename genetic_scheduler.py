@@ -2,8 +2,16 @@ import pandas as pd
 import numpy as np
 import random
 from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Tuple
 import copy
+import time
+from execution_events import criar_registro_geracao, emitir_evento
+from domain_pruning import calcular_dominios, resumo_dominios
+from feasibility_check import verificar_viabilidade
+from population_diversity import hash_genomas
+from operator_selection import exibir_estatisticas
+from hall_of_fame import HallDaFama
+from evolution_mechanics import MecanismosEvolutivos
 
 @dataclass
 class Disciplina:
@@ -41,7 +49,10 @@ class Disponibilidade:
     dia: str
     horario: str
 
-class ScheduleGA:
+class ScheduleGA(MecanismosEvolutivos):
+    # Identificação do motor nos eventos de geração
+    versao = 'V1'
+    
     def __init__(self):
         # Mapeamentos para facilitar o processamento
         self.dias = ['Segunda', 'Terça', 'Quarta', 'Quinta', 'Sexta']
@@ -59,6 +70,39 @@ class ScheduleGA:
         self.taxa_crossover = 0.8
         self.tamanho_torneio = 3
         
+        # Mutação guiada: concentra as mutações nos genes com violações
+        self.mutacao_guiada = False
+        self.proporcao_aleatoria = 0.2  # Fração de movimentos puramente aleatórios
+        
+        # Poda de domínios: cada disciplina só recebe células/salas viáveis
+        self.podar_dominios = True
+        self.dominios = {}
+        self.avisos_dominio = []
+        
+        # Modo estacionário, diversidade, reinícios, hall da fama, adaptação de taxas
+        # e seleção de operadores (evolution_mechanics.MecanismosEvolutivos)
+        self._inicializar_mecanismos()
+        self._cache_fitness = {}
+        
+        # Verificação prévia de viabilidade dos dados (antes de cada execução nova)
+        self.verificacao_previa = True
+        self.abortar_se_inviavel = False
+        self.relatorio_viabilidade = None
+        
+        # Saída e telemetria
+        self.verbose = True  # False silencia os prints de progresso
+        self.intervalo_log = 100
+        self.total_avaliacoes = 0
+        self.dados_carregados = False
+        
+        # Checkpoint da última execução (permite retomar com executar(retomar=True))
+        self.estado = None
+        
+    def _log(self, mensagem: str):
+        """Imprime mensagem de progresso apenas no modo verboso"""
+        if self.verbose:
+            print(mensagem)
+        
     def carregar_dados(self):
         """Carrega os dados dos arquivos Excel"""
         
@@ -118,6 +162,48 @@ class ScheduleGA:
                 dia=row['DIADASEMANA'],
                 horario=row['HORARIO']
             ))
+        
+        self._calcular_dominios()
+        
+        self.dados_carregados = True
+    
+    def copiar_dados_de(self, outro: 'ScheduleGA'):
+        """Reaproveita os dados já carregados por outra instância (sem reler o Excel)"""
+        self.disciplinas = outro.disciplinas
+        self.professores = outro.professores
+        self.salas = outro.salas
+        self.turmas = outro.turmas
+        self.disponibilidades = outro.disponibilidades
+        self.dominios = outro.dominios
+        self.avisos_dominio = outro.avisos_dominio
+        self.dados_carregados = outro.dados_carregados
+    
+    def _verificar_viabilidade(self):
+        """Roda a verificação prévia; com abortar_se_inviavel, dados inviáveis levantam ValueError"""
+        self.relatorio_viabilidade = verificar_viabilidade(self, abortar=self.abortar_se_inviavel)
+        if self.relatorio_viabilidade.viavel:
+            self._log(f"Dados viáveis (verificação em {self.relatorio_viabilidade.tempo_ms:.1f} ms)")
+        else:
+            self.relatorio_viabilidade.exibir(self._log)
+    
+    def _calcular_dominios(self):
+        """Pré-processamento: domínio viável de cada disciplina (turno, disponibilidade, capacidade)"""
+        self.avisos_dominio = []
+        self.dominios = calcular_dominios(self.disciplinas, self.professores, self.salas, self.turmas,
+                                          self.disponibilidades, self.dias, self.horarios,
+                                          self.avisos_dominio)
+        resumo = resumo_dominios(self.dominios, len(self.dias) * len(self.horarios))
+        self._log(f"Domínios: {resumo['celulas_media']:.1f} células por disciplina "
+                  f"({resumo['reducao_percentual']:.0f}% de redução, "
+                  f"{resumo['disciplinas_fixadas']} disciplinas com aulas forçadas)")
+        for aviso in self.avisos_dominio:
+            self._log(f"Aviso: {aviso}")
+    
+    def _dominio(self, disciplina_codigo: str):
+        """Domínio da disciplina, ou None quando a poda está desligada"""
+        if not self.podar_dominios:
+            return None
+        return self.dominios.get(disciplina_codigo)
     
     def criar_gene(self, disciplina_codigo: str) -> Dict:
         """Cria um gene representando uma aula"""
@@ -128,6 +214,17 @@ class ScheduleGA:
                 professor = prof_codigo
                 break
         
+        dominio = self._dominio(disciplina_codigo)
+        if dominio is not None:
+            dia, horario = random.choice(sorted(dominio.celulas))
+            return {
+                'disciplina': disciplina_codigo,
+                'professor': professor,
+                'dia': dia,
+                'horario': horario,
+                'sala': random.choice(dominio.salas)
+            }
+        
         return {
             'disciplina': disciplina_codigo,
             'professor': professor,
@@ -142,8 +239,13 @@ class ScheduleGA:
         
         # Para cada disciplina, criar o número de aulas necessário
         for disc_codigo, disciplina in self.disciplinas.items():
-            for _ in range(disciplina.carga_horaria):
+            dominio = self._dominio(disc_codigo)
+            fixadas = sorted(dominio.fixadas) if dominio is not None else []
+            for i in range(disciplina.carga_horaria):
                 gene = self.criar_gene(disc_codigo)
+                if i < len(fixadas):
+                    # Aula forçada pela propagação
+                    gene['dia'], gene['horario'] = fixadas[i]
                 cromossomo.append(gene)
         
         return cromossomo
@@ -222,9 +324,12 @@ class ScheduleGA:
     
     def selecao_torneio(self, populacao: List[List[Dict]], fitness_scores: List[float]) -> List[Dict]:
         """Seleção por torneio"""
-        indices = random.sample(range(len(populacao)), self.tamanho_torneio)
-        melhor_indice = max(indices, key=lambda i: fitness_scores[i])
-        return copy.deepcopy(populacao[melhor_indice])
+        return copy.deepcopy(populacao[self._indice_torneio(fitness_scores)])
+    
+    def _indice_torneio(self, fitness_scores: List[float]) -> int:
+        """Índice do vencedor de um torneio"""
+        indices = random.sample(range(len(fitness_scores)), self.tamanho_torneio)
+        return max(indices, key=lambda i: fitness_scores[i])
     
     def crossover(self, pai1: List[Dict], pai2: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
         """Crossover de ordem adaptado"""
@@ -246,76 +351,444 @@ class ScheduleGA:
     
     def mutacao(self, cromossomo: List[Dict]) -> List[Dict]:
         """Mutação do cromossomo"""
+        if self.mutacao_guiada:
+            return self.mutacao_guiada_violacoes(cromossomo)
+        return self._mutacao_aleatoria(cromossomo)
+    
+    def _mutar_gene(self, gene: Dict):
+        """Muda o dia ou o horário do gene (dentro do domínio da disciplina, se houver)"""
+        mudar_dia = random.choice([True, False])
+        dominio = self._dominio(gene['disciplina'])
+        
+        if dominio is None:
+            if mudar_dia:
+                gene['dia'] = random.choice(range(len(self.dias)))
+            else:
+                gene['horario'] = random.choice(range(len(self.horarios)))
+            return
+        
+        if dominio.totalmente_fixada:
+            return
+        
+        # Mantém a outra coordenada quando o domínio permite
+        if mudar_dia:
+            candidatos = [c for c in dominio.celulas if c[1] == gene['horario']]
+        else:
+            candidatos = [c for c in dominio.celulas if c[0] == gene['dia']]
+        gene['dia'], gene['horario'] = random.choice(candidatos or sorted(dominio.celulas))
+    
+    def _operadores_crossover(self) -> Dict[str, Callable]:
+        """Registro de operadores de crossover disponíveis para a seleção adaptativa"""
+        return {
+            'dois_pontos': self.crossover,
+            'uniforme': self._crossover_uniforme,
+            'dias': self._crossover_dias
+        }
+    
+    def _operadores_mutacao(self) -> Dict[str, Callable]:
+        """Registro de operadores de mutação disponíveis para a seleção adaptativa"""
+        return {
+            'aleatoria': self._mutacao_aleatoria,
+            'guiada': self.mutacao_guiada_violacoes,
+            'troca_horarios': self._mutacao_troca_horarios
+        }
+    
+    def _crossover_uniforme(self, pai1: List[Dict], pai2: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """Crossover uniforme: cada gene vem de um dos pais com probabilidade 1/2"""
+        if random.random() > self.taxa_crossover:
+            return copy.deepcopy(pai1), copy.deepcopy(pai2)
+        
+        filho1 = copy.deepcopy(pai1)
+        filho2 = copy.deepcopy(pai2)
+        for i in range(len(filho1)):
+            if random.random() < 0.5:
+                filho1[i], filho2[i] = filho2[i], filho1[i]
+        
+        return filho1, filho2
+    
+    def _crossover_dias(self, pai1: List[Dict], pai2: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """Crossover por dias: troca os genes alocados (em qualquer pai) nos dias sorteados"""
+        if random.random() > self.taxa_crossover:
+            return copy.deepcopy(pai1), copy.deepcopy(pai2)
+        
+        num_dias = len(self.dias)
+        dias_trocar = set(random.sample(range(num_dias), random.randint(1, min(3, num_dias))))
+        
+        filho1 = copy.deepcopy(pai1)
+        filho2 = copy.deepcopy(pai2)
+        for i in range(len(filho1)):
+            if filho1[i]['dia'] in dias_trocar or filho2[i]['dia'] in dias_trocar:
+                filho1[i], filho2[i] = filho2[i], filho1[i]
+        
+        return filho1, filho2
+    
+    def _mutacao_aleatoria(self, cromossomo: List[Dict]) -> List[Dict]:
+        """Mutação aleatória: cada gene muda de dia ou horário com probabilidade taxa_mutacao"""
         cromossomo_mutado = copy.deepcopy(cromossomo)
         
         for i, gene in enumerate(cromossomo_mutado):
             if random.random() < self.taxa_mutacao:
-                # Mutar dia ou horário aleatoriamente
-                if random.choice([True, False]):
-                    gene['dia'] = random.choice(range(len(self.dias)))
-                else:
-                    gene['horario'] = random.choice(range(len(self.horarios)))
+                self._mutar_gene(gene)
         
         return cromossomo_mutado
     
-    def executar(self) -> Tuple[List[Dict], float, List[float]]:
-        """Executa o algoritmo genético"""
-        print("Carregando dados...")
-        self.carregar_dados()
+    def _mutacao_troca_horarios(self, cromossomo: List[Dict]) -> List[Dict]:
+        """Troca de slots: dois genes trocam de dia/horário (dentro dos domínios, se houver)"""
+        cromossomo_mutado = copy.deepcopy(cromossomo)
+        if len(cromossomo_mutado) < 2:
+            return cromossomo_mutado
         
-        print("Inicializando população...")
-        populacao = self.inicializar_populacao()
+        for gene in cromossomo_mutado:
+            if random.random() < self.taxa_mutacao:
+                outro = random.choice(cromossomo_mutado)
+                celula_gene = (gene['dia'], gene['horario'])
+                celula_outro = (outro['dia'], outro['horario'])
+                if self._celula_permitida(gene, celula_outro) and self._celula_permitida(outro, celula_gene):
+                    gene['dia'], gene['horario'] = celula_outro
+                    outro['dia'], outro['horario'] = celula_gene
         
-        historico_fitness = []
-        melhor_global = None
-        melhor_fitness_global = float('-inf')
+        return cromossomo_mutado
+    
+    def _celula_permitida(self, gene: Dict, celula: Tuple[int, int]) -> bool:
+        """A célula está no domínio da disciplina do gene (sempre, sem poda)"""
+        dominio = self._dominio(gene['disciplina'])
+        return dominio is None or celula in dominio.celulas
+    
+    def _professor_disponivel(self, professor: str, dia: int, horario: int) -> bool:
+        """Verifica se professor está disponível no dia/horário"""
+        dia_nome = self.dias[dia]
+        horario_nome = self.horarios[horario]
+        for disp in self.disponibilidades.get(professor, []):
+            if disp.dia == dia_nome and disp.horario == horario_nome:
+                return True
+        return False
+    
+    def _flags_violacao(self, cromossomo: List[Dict]) -> List[bool]:
+        """
+        Marca cada gene que participa de alguma violação avaliada em avaliar_fitness
+        - Conflito de professor ou de sala no mesmo dia/horário
+        - Professor indisponível
+        - Disciplina repetindo dia (distribuição ideal: um dia por aula)
+        - Gene em dia com mais de 4 aulas
+        """
+        contagem_professor = {}
+        contagem_sala = {}
+        contagem_disciplina_dia = {}
+        aulas_por_dia = [0] * len(self.dias)
+        for gene in cromossomo:
+            chave_prof = (gene['professor'], gene['dia'], gene['horario'])
+            chave_sala = (gene['sala'], gene['dia'], gene['horario'])
+            chave_disc = (gene['disciplina'], gene['dia'])
+            contagem_professor[chave_prof] = contagem_professor.get(chave_prof, 0) + 1
+            contagem_sala[chave_sala] = contagem_sala.get(chave_sala, 0) + 1
+            contagem_disciplina_dia[chave_disc] = contagem_disciplina_dia.get(chave_disc, 0) + 1
+            aulas_por_dia[gene['dia']] += 1
         
-        print("Iniciando evolução...")
-        for geracao in range(self.geracoes):
+        flags = []
+        for gene in cromossomo:
+            carga = self.disciplinas[gene['disciplina']].carga_horaria
+            flags.append(
+                contagem_professor[(gene['professor'], gene['dia'], gene['horario'])] > 1
+                or contagem_sala[(gene['sala'], gene['dia'], gene['horario'])] > 1
+                or not self._professor_disponivel(gene['professor'], gene['dia'], gene['horario'])
+                or (carga <= len(self.dias) and contagem_disciplina_dia[(gene['disciplina'], gene['dia'])] > 1)
+                or aulas_por_dia[gene['dia']] > 4
+            )
+        
+        return flags
+    
+    def mutacao_guiada_violacoes(self, cromossomo: List[Dict]) -> List[Dict]:
+        """
+        Mutação guiada: sorteia preferencialmente genes com violações
+        - Mesmo número esperado de movimentos da mutação aleatória
+        - self.proporcao_aleatoria dos movimentos escolhe qualquer gene
+        - Gene guiado vai para um dia/horário em que a sala está livre
+        """
+        cromossomo_mutado = copy.deepcopy(cromossomo)
+        num_movimentos = sum(1 for _ in cromossomo_mutado if random.random() < self.taxa_mutacao)
+        if num_movimentos == 0:
+            return cromossomo_mutado
+        
+        flags = self._flags_violacao(cromossomo_mutado)
+        violadores = [i for i, violado in enumerate(flags) if violado]
+        
+        for _ in range(num_movimentos):
+            if not violadores or random.random() < self.proporcao_aleatoria:
+                self._mutar_gene(random.choice(cromossomo_mutado))
+                continue
+            
+            gene = cromossomo_mutado[random.choice(violadores)]
+            dominio = self._dominio(gene['disciplina'])
+            if dominio is not None and dominio.totalmente_fixada:
+                continue
+            celulas = sorted(dominio.celulas) if dominio is not None else \
+                [(d, h) for d in range(len(self.dias)) for h in range(len(self.horarios))]
+            ocupados = {(g['sala'], g['dia'], g['horario']) for g in cromossomo_mutado if g is not gene}
+            livres = [(d, h) for d, h in celulas if (gene['sala'], d, h) not in ocupados]
+            disponiveis = [(d, h) for d, h in livres if self._professor_disponivel(gene['professor'], d, h)]
+            candidatos = disponiveis or livres
+            if candidatos:
+                gene['dia'], gene['horario'] = random.choice(candidatos)
+        
+        return cromossomo_mutado
+    
+    def decodificar(self, individuo: List[Dict]) -> List[Dict]:
+        """O cromossomo da V1 já é a solução (lista de genes)"""
+        return individuo
+    
+    def _cruzar(self, pai1: List[Dict], pai2: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        return self.crossover(pai1, pai2)
+    
+    def _mutar(self, cromossomo: List[Dict]) -> List[Dict]:
+        return self.mutacao(cromossomo)
+    
+    def _avaliar_individuo(self, cromossomo: List[Dict]) -> Tuple[float, None]:
+        return self.avaliar_fitness(cromossomo), None
+    
+    def _matriz_genomas(self, populacao: List[List[Dict]]) -> np.ndarray:
+        """Codifica a população como matriz inteira (indivíduos x genes): célula + sala de cada aula"""
+        num_horarios = len(self.horarios)
+        num_celulas = len(self.dias) * num_horarios
+        indice_sala = {sala: i for i, sala in enumerate(self.salas)}
+        return np.array([[gene['dia'] * num_horarios + gene['horario'] +
+                          num_celulas * indice_sala.get(gene['sala'], 0) for gene in ind]
+                         for ind in populacao], dtype=np.int64)
+    
+    def _avaliar_populacao(self, populacao: list) -> List[float]:
+        """
+        Avalia a população inteira
+        Com eliminar_duplicatas, genomas repetidos (mesmo hash) ou já avaliados
+        na geração anterior reaproveitam o fitness sem nova avaliação
+        """
+        if not self.eliminar_duplicatas:
+            self.total_avaliacoes += len(populacao)
+            return [self.avaliar_fitness(ind) for ind in populacao]
+        
+        hashes = hash_genomas(self._matriz_genomas(populacao)).tolist()
+        cache = {}
+        fitness_scores = []
+        for ind, chave in zip(populacao, hashes):
+            fitness = cache.get(chave, self._cache_fitness.get(chave))
+            if fitness is None:
+                fitness = self.avaliar_fitness(ind)
+                self.total_avaliacoes += 1
+            cache[chave] = fitness
+            fitness_scores.append(fitness)
+        
+        self._cache_fitness = cache
+        return fitness_scores
+    
+    def importar_solucao(self, solucao, fitness: float):
+        """
+        Insere uma solução externa (p. ex. o incumbente de outro motor) no checkpoint
+        - Substitui o pior indivíduo de self.estado (o último, no modo geracional)
+        - Entra na busca na próxima execução com retomar=True
+        """
+        if self.estado is None:
+            raise ValueError("Sem checkpoint: execute o motor antes de importar soluções")
+        populacao = self.estado['populacao']
+        fitness_scores = self.estado.get('fitness_scores')
+        indice = fitness_scores.index(min(fitness_scores)) if fitness_scores else len(populacao) - 1
+        populacao[indice] = copy.deepcopy(solucao)
+        if fitness_scores:
+            fitness_scores[indice] = fitness
+    
+    def executar(self, callbacks=None, retomar=False) -> Tuple[List[Dict], float, List[float]]:
+        """
+        Executa o algoritmo genético
+        - callbacks: lista de funções chamadas a cada geração com um RegistroGeracao
+          (ver execution_events.SinkJsonLines e SinkBufferCircular)
+        - retomar: continua a partir de self.estado (checkpoint da execução anterior)
+          por mais self.geracoes gerações
+        """
+        if not self.dados_carregados:
+            self._log("Carregando dados...")
+            self.carregar_dados()
+        
+        if retomar and self.estado is not None:
+            populacao = self.estado['populacao']
+            historico_fitness = list(self.estado['historico_fitness'])
+            melhor_global = self.estado['melhor_global']
+            melhor_fitness_global = self.estado['melhor_fitness_global']
+            geracao_inicial = self.estado['geracao']
+            self.total_avaliacoes = self.estado['total_avaliacoes']
+            fitness_scores = self.estado.get('fitness_scores')
+            taxas_estado = self.estado.get('taxas')
+            self._bandits = self.estado.get('bandits')
+        else:
+            if self.verificacao_previa:
+                self._verificar_viabilidade()
+            
+            self._log("Inicializando população...")
+            populacao = self.inicializar_populacao()
+            
+            historico_fitness = []
+            melhor_global = None
+            melhor_fitness_global = float('-inf')
+            geracao_inicial = 0
+            self.total_avaliacoes = 0
+            fitness_scores = None
+            taxas_estado = None
+            self._bandits = None
+            self.historico_diversidade = []
+            self.historico_taxas = []
+            self.hall_da_fama = HallDaFama(self.tamanho_hall_da_fama)
+            self.historico_reinicios = []
+        
+        # Cache de avaliações vale só dentro de uma execução: os dados podem mudar
+        # entre execuções (inclusive ao retomar)
+        self._cache_fitness = {}
+        convergiu = False
+        tamanho_historico_inicial = len(historico_fitness)
+        melhor_indice = fitness_scores.index(max(fitness_scores)) if fitness_scores else 0
+        
+        # Taxas configuradas são restauradas no fim; as adaptadas seguem no checkpoint
+        taxas_configuradas = (self.taxa_mutacao, self.taxa_crossover)
+        if self.adaptacao_taxas and taxas_estado:
+            self.taxa_mutacao, self.taxa_crossover = taxas_estado
+        self._fitness_pais = None
+        self._sucessos = []
+        self._origens = None
+        self._preparar_selecao_operadores()
+        geracoes_sem_melhora = 0
+        
+        self._log("Iniciando evolução...")
+        for geracao in range(geracao_inicial, geracao_inicial + self.geracoes):
+            estacionario = self.modo_substituicao == 'estacionario'
+            diversidade_ativa = self.eliminar_duplicatas or self.limiar_diversidade > 0
+            
             # Avaliar fitness
-            fitness_scores = [self.avaliar_fitness(ind) for ind in populacao]
+            inicio_avaliacao = time.perf_counter()
+            if estacionario and fitness_scores is not None:
+                # Steady-state: só os filhos são avaliados, substituindo no lugar
+                melhor_indice = self._passos_estacionarios(populacao, fitness_scores, melhor_indice)
+                if diversidade_ativa:
+                    for i in self._preservar_diversidade(populacao, [melhor_indice]):
+                        fitness_scores[i] = self.avaliar_fitness(populacao[i])
+                        self.total_avaliacoes += 1
+                        if fitness_scores[i] > fitness_scores[melhor_indice]:
+                            melhor_indice = i
+            else:
+                if diversidade_ativa:
+                    # A elite fica no início da população
+                    substituidos = self._preservar_diversidade(populacao, range(1))
+                    # Substitutos não são filhos dos pais registrados
+                    for registro in (self._fitness_pais, self._origens):
+                        for i in (substituidos if registro is not None else ()):
+                            registro[i] = None
+                inicio_cpu = time.process_time()
+                fitness_scores = self._avaliar_populacao(populacao)
+                if self._origens is not None:
+                    self._creditar_operadores(fitness_scores, (time.process_time() - inicio_cpu) / len(populacao))
+                melhor_indice = fitness_scores.index(max(fitness_scores))
+            tempo_avaliacao = time.perf_counter() - inicio_avaliacao
             
             # Encontrar melhor da geração
-            melhor_fitness_geracao = max(fitness_scores)
-            melhor_indice = fitness_scores.index(melhor_fitness_geracao)
+            melhor_fitness_geracao = fitness_scores[melhor_indice]
+            self._atualizar_hall_da_fama(populacao, fitness_scores)
             
             if melhor_fitness_geracao > melhor_fitness_global:
                 melhor_fitness_global = melhor_fitness_geracao
                 melhor_global = copy.deepcopy(populacao[melhor_indice])
+                geracoes_sem_melhora = 0
+            else:
+                geracoes_sem_melhora += 1
+            
+            # Fim de uma explosão de mutação
+            if self._fim_explosao is not None and geracao >= self._fim_explosao:
+                self._encerrar_explosao_mutacao()
             
             historico_fitness.append(melhor_fitness_geracao)
             
+            # Emitir estatísticas da geração
+            if callbacks:
+                emitir_evento(callbacks, criar_registro_geracao(
+                    'V1', geracao, fitness_scores, self.total_avaliacoes, tempo_avaliacao,
+                    self.historico_diversidade[-1] if diversidade_ativa else None,
+                    self.taxa_mutacao, self.taxa_crossover
+                ))
+            
+            # Ajustar taxas de mutação e crossover para a próxima geração
+            if self.adaptacao_taxas:
+                self._adaptar_taxas(geracao, fitness_scores,
+                                    self.historico_diversidade[-1] if diversidade_ativa else None)
+            
             # Log do progresso
-            if geracao % 100 == 0:
-                print(f"Geração {geracao}: Melhor fitness = {melhor_fitness_geracao:.2f}")
+            if geracao % self.intervalo_log == 0:
+                self._log(f"Geração {geracao}: Melhor fitness = {melhor_fitness_geracao:.2f}")
             
             # Verificar critério de parada
             if melhor_fitness_geracao >= 9500:  # Solução quase perfeita
-                print(f"Solução ótima encontrada na geração {geracao}!")
+                self._log(f"Solução ótima encontrada na geração {geracao}!")
+                convergiu = True
                 break
             
+            # Estagnação: reiniciar em vez de rodar gerações planas
+            if self.estrategia_reinicio and geracoes_sem_melhora >= self.geracoes_estagnacao:
+                populacao, reavaliar = self._reiniciar(populacao, fitness_scores, geracao,
+                                                       melhor_fitness_global, geracoes_sem_melhora, callbacks)
+                geracoes_sem_melhora = 0
+                if reavaliar:
+                    fitness_scores = None
+                    continue
+            
+            if estacionario:
+                continue
+            
             # Criar nova população
             nova_populacao = []
             
             # Elitismo: manter o melhor
             nova_populacao.append(copy.deepcopy(populacao[melhor_indice]))
             
+            # Fitness de referência (melhor pai) e operadores de cada filho,
+            # para a regra de 1/5 e o crédito dos operadores
+            fitness_pais = [None] * len(nova_populacao)
+            origens = [None] * len(nova_populacao)
+            
             # Gerar resto da população
             while len(nova_populacao) < self.populacao_size:
-                pai1 = self.selecao_torneio(populacao, fitness_scores)
-                pai2 = self.selecao_torneio(populacao, fitness_scores)
-                
-                filho1, filho2 = self.crossover(pai1, pai2)
-                
-                filho1 = self.mutacao(filho1)
-                filho2 = self.mutacao(filho2)
+                indice1 = self._indice_torneio(fitness_scores)
+                indice2 = self._indice_torneio(fitness_scores)
+                pai1 = copy.deepcopy(populacao[indice1])
+                pai2 = copy.deepcopy(populacao[indice2])
                 
-                nova_populacao.extend([filho1, filho2])
+                for filho, origem in self._gerar_filhos(pai1, pai2):
+                    nova_populacao.append(filho)
+                    origens.append(origem)
+                referencia = max(fitness_scores[indice1], fitness_scores[indice2])
+                fitness_pais.extend([referencia] * (len(nova_populacao) - len(fitness_pais)))
             
             # Ajustar tamanho da população
             populacao = nova_populacao[:self.populacao_size]
+            self._fitness_pais = fitness_pais[:self.populacao_size]
+            self._origens = origens[:self.populacao_size] if self._bandits is not None else None
+        
+        # Uma explosão de mutação não sobrevive ao fim da execução
+        self._encerrar_explosao_mutacao()
+        taxas_adaptadas = (self.taxa_mutacao, self.taxa_crossover) if self.adaptacao_taxas else None
+        self.taxa_mutacao, self.taxa_crossover = taxas_configuradas
+        
+        # Guardar checkpoint para permitir retomar a execução
+        self.estado = {
+            'populacao': populacao,
+            'historico_fitness': historico_fitness,
+            'melhor_global': melhor_global,
+            'melhor_fitness_global': melhor_fitness_global,
+            'geracao': geracao_inicial + len(historico_fitness) - tamanho_historico_inicial,
+            'total_avaliacoes': self.total_avaliacoes,
+            'fitness_scores': fitness_scores if self.modo_substituicao == 'estacionario' else None,
+            'taxas': taxas_adaptadas,
+            'bandits': self._bandits,
+            'convergiu': convergiu
+        }
+        
+        if self._bandits is not None:
+            self.estatisticas_operadores = {tipo: bandit.estatisticas() for tipo, bandit in self._bandits.items()}
+            self._log(f"Crédito dos operadores ({self.selecao_operadores}):")
+            exibir_estatisticas(self.estatisticas_operadores, self._log)
         
-        print(f"Evolução finalizada. Melhor fitness: {melhor_fitness_global:.2f}")
+        self._log(f"Evolução finalizada. Melhor fitness: {melhor_fitness_global:.2f}")
         return melhor_global, melhor_fitness_global, historico_fitness
     
     def exibir_horario(self, cromossomo: List[Dict]):
@@ -2,8 +2,18 @@ import pandas as pd
 import numpy as np
 import random
 from dataclasses import dataclass
-from typing import List, Dict, Tuple, Optional
+from typing import Callable, List, Dict, Tuple, Optional
 import copy
+import time
+from execution_events import criar_registro_geracao, emitir_evento
+from day_bitmask import tabelas_mascara, mascaras_agenda
+from domain_pruning import calcular_dominios, resumo_dominios
+from feasibility_check import verificar_viabilidade
+from population_diversity import hash_genomas
+from operator_selection import exibir_estatisticas
+from constraint_solver import gerar_sementes
+from hall_of_fame import HallDaFama
+from evolution_mechanics import MecanismosEvolutivos
 
 @dataclass
 class Disciplina:
@@ -50,7 +60,15 @@ class Aula:
     def __str__(self):
         return f"{self.disciplina}|{self.professor}|{self.sala}"
 
-class ScheduleGA_V2:
+# Colunas da matriz de componentes do fitness: uma por peso em self.pesos,
+# mais o bônus fixo de aulas consecutivas (sem peso)
+COMPONENTES_FITNESS = (
+    'disciplina_atendida', 'disponibilidade_respeitada', 'distribuicao_equilibrada',
+    'distribuicao_inteligente', 'sem_sobrecarga_dia', 'sem_janelas', 'professor_satisfeito',
+    'sala_otimizada', 'aula_mantida', 'bonus_consecutivas'
+)
+
+class ScheduleGA_V2(MecanismosEvolutivos):
     """
     Versão 2: Agenda com pontuação positiva e distribuição inteligente
     - Genoma = Matriz (agenda) 5 dias x 4 horários
@@ -59,6 +77,9 @@ class ScheduleGA_V2:
     - Distribuição inteligente das disciplinas
     """
     
+    # Identificação do motor nos eventos de geração
+    versao = 'V2'
+    
     def __init__(self):
         # Dimensões da agenda (5 dias x 4 horários)
         self.num_dias = 5
@@ -86,6 +107,29 @@ class ScheduleGA_V2:
         self.taxa_crossover = 0.8
         self.tamanho_torneio = 3
         
+        # Mutação guiada: concentra as trocas nas células com violações
+        self.mutacao_guiada = False
+        self.proporcao_aleatoria = 0.2  # Fração de trocas puramente aleatórias
+        
+        # Poda de domínios: cada aula só ocupa células/salas viáveis
+        self.podar_dominios = True
+        self.dominios = {}
+        self.avisos_dominio = []
+        
+        # Modo estacionário, diversidade, reinícios, hall da fama, adaptação de taxas
+        # e seleção de operadores (evolution_mechanics.MecanismosEvolutivos)
+        self._inicializar_mecanismos()
+        self._cache_componentes = {}
+        
+        # Sementes da população inicial (agendas), p. ex. do solver de restrições
+        self.sementes = []
+        self.sementes_solver = 0    # Sementes extras geradas por constraint_solver a cada inicialização
+        
+        # Verificação prévia de viabilidade dos dados (antes de cada execução nova)
+        self.verificacao_previa = True
+        self.abortar_se_inviavel = False
+        self.relatorio_viabilidade = None
+        
         # Pesos para pontuação
         self.pesos = {
             'disciplina_atendida': 1000,          # Todas as aulas de uma disciplina alocadas
@@ -95,8 +139,26 @@ class ScheduleGA_V2:
             'sem_sobrecarga_dia': 150,           # Não mais que 4 aulas por dia
             'sem_janelas': 100,                  # Aulas consecutivas por dia
             'professor_satisfeito': 80,          # Professor com horário concentrado
-            'sala_otimizada': 50                 # Uso eficiente da sala
+            'sala_otimizada': 50,                # Uso eficiente da sala
+            'aula_mantida': 80                   # Aula na célula da agenda de referência (reotimização)
         }
+        
+        # Agenda publicada anterior: disciplina de cada célula (None = sem termo de estabilidade)
+        self.agenda_referencia = None
+        
+        # Saída e telemetria
+        self.verbose = True  # False silencia os prints de progresso
+        self.intervalo_log = 50
+        self.total_avaliacoes = 0
+        self.dados_carregados = False
+        
+        # Checkpoint da última execução (permite retomar com executar(retomar=True))
+        self.estado = None
+    
+    def _log(self, mensagem: str):
+        """Imprime mensagem de progresso apenas no modo verboso"""
+        if self.verbose:
+            print(mensagem)
     
     def carregar_dados(self):
         """Carrega os dados dos arquivos Excel"""
@@ -156,8 +218,57 @@ class ScheduleGA_V2:
                 horario=row['HORARIO']
             ))
         
-        # Criar lista de aulas obrigatórias
+        # Domínios viáveis e lista de aulas obrigatórias
+        self._calcular_dominios()
         self._criar_aulas_obrigatorias()
+        self.dados_carregados = True
+    
+    def copiar_dados_de(self, outro: 'ScheduleGA_V2'):
+        """Reaproveita os dados já carregados por outra instância (sem reler o Excel)"""
+        self.disciplinas = outro.disciplinas
+        self.professores = outro.professores
+        self.salas = outro.salas
+        self.turmas = outro.turmas
+        self.disponibilidades = outro.disponibilidades
+        self.aulas_obrigatorias = outro.aulas_obrigatorias
+        self.distribuicao_disciplinas = outro.distribuicao_disciplinas
+        self.dominios = outro.dominios
+        self.avisos_dominio = outro.avisos_dominio
+        self.dados_carregados = outro.dados_carregados
+    
+    def _verificar_viabilidade(self):
+        """Roda a verificação prévia; com abortar_se_inviavel, dados inviáveis levantam ValueError"""
+        self.relatorio_viabilidade = verificar_viabilidade(self, abortar=self.abortar_se_inviavel)
+        if self.relatorio_viabilidade.viavel:
+            self._log(f"✅ Dados viáveis (verificação em {self.relatorio_viabilidade.tempo_ms:.1f} ms)")
+        else:
+            self.relatorio_viabilidade.exibir(self._log)
+    
+    def _calcular_dominios(self):
+        """Pré-processamento: domínio viável de cada disciplina (turno, disponibilidade, capacidade)"""
+        self.avisos_dominio = []
+        self.dominios = calcular_dominios(self.disciplinas, self.professores, self.salas, self.turmas,
+                                          self.disponibilidades, self.dias, self.horarios,
+                                          self.avisos_dominio)
+        resumo = resumo_dominios(self.dominios, self.num_dias * self.num_horarios)
+        self._log(f"🔎 Domínios: {resumo['celulas_media']:.1f} células por disciplina "
+                  f"({resumo['reducao_percentual']:.0f}% de redução, "
+                  f"{resumo['disciplinas_fixadas']} disciplinas com aulas forçadas)")
+        for aviso in self.avisos_dominio:
+            self._log(f"⚠️  {aviso}")
+    
+    def _celulas_permitidas(self, disciplina_codigo: str):
+        """Células (dia, horário) permitidas para a disciplina, ou None sem poda"""
+        if not self.podar_dominios or disciplina_codigo not in self.dominios:
+            return None
+        return self.dominios[disciplina_codigo].celulas
+    
+    def _aula_permitida(self, aula, dia: int, horario: int) -> bool:
+        """Célula vazia ou aula dentro do domínio da sua disciplina"""
+        if aula is None:
+            return True
+        celulas = self._celulas_permitidas(aula.disciplina)
+        return celulas is None or (dia, horario) in celulas
     
     def _criar_aulas_obrigatorias(self):
         """Cria lista de todas as aulas que devem ser alocadas com distribuição inteligente"""
@@ -204,18 +315,24 @@ class ScheduleGA_V2:
                     aula = Aula(
                         disciplina=disc_codigo,
                         professor=professor,
-                        sala=list(self.salas.keys())[0]  # Por enquanto só temos uma sala
+                        sala=self._sala_disciplina(disc_codigo)
                     )
                     # Adicionar metadata para controle de distribuição
                     aula.grupo_dia = grupo_idx
                     aula.posicao_no_grupo = aula_no_grupo
                     self.aulas_obrigatorias.append(aula)
         
-        print(f"📚 Total de aulas obrigatórias: {len(self.aulas_obrigatorias)}")
-        print("📋 Distribuição planejada por disciplina:")
+        self._log(f"📚 Total de aulas obrigatórias: {len(self.aulas_obrigatorias)}")
+        self._log("📋 Distribuição planejada por disciplina:")
         for disc_codigo, info in self.distribuicao_disciplinas.items():
             disciplina = self.disciplinas[disc_codigo]
-            print(f"   • {disciplina.nome[:30]}: {info['distribuicao']} aulas por dia")
+            self._log(f"   • {disciplina.nome[:30]}: {info['distribuicao']} aulas por dia")
+    
+    def _sala_disciplina(self, disc_codigo: str) -> str:
+        """Sala da disciplina: a primeira do domínio (capacidade) ou a primeira cadastrada"""
+        if self.podar_dominios and disc_codigo in self.dominios:
+            return self.dominios[disc_codigo].salas[0]
+        return list(self.salas.keys())[0]  # Por enquanto só temos uma sala
     
     def _calcular_distribuicao_equilibrada(self, carga_total):
         """Calcula distribuição equilibrada para cargas horárias maiores"""
@@ -260,6 +377,9 @@ class ScheduleGA_V2:
             
             aulas_por_disciplina[disc][grupo].append(aula)
         
+        # Aulas forçadas pela propagação ocupam primeiro as células fixadas (como na V1)
+        self._alocar_aulas_fixadas(agenda, aulas_por_disciplina)
+        
         # Lista de dias disponíveis para cada disciplina
         dias_disponiveis = list(range(self.num_dias))
         
@@ -267,10 +387,13 @@ class ScheduleGA_V2:
         for disc_codigo, grupos in aulas_por_disciplina.items():
             disciplina = self.disciplinas[disc_codigo]
             dias_escolhidos = []
+            permitidas = self._celulas_permitidas(disc_codigo)
+            dias_da_disciplina = dias_disponiveis if permitidas is None else \
+                sorted({dia for dia, _ in permitidas})
             
             # Escolher dias diferentes para cada grupo da disciplina
-            dias_para_esta_disciplina = random.sample(dias_disponiveis, 
-                                                     min(len(grupos), len(dias_disponiveis)))
+            dias_para_esta_disciplina = random.sample(dias_da_disciplina, 
+                                                     min(len(grupos), len(dias_da_disciplina)))
             
             for grupo_idx, (grupo, aulas_do_grupo) in enumerate(grupos.items()):
                 if grupo_idx < len(dias_para_esta_disciplina):
@@ -279,7 +402,7 @@ class ScheduleGA_V2:
                     
                     # Encontrar horários consecutivos disponíveis neste dia
                     horarios_consecutivos = self._encontrar_horarios_consecutivos(
-                        agenda, dia_escolhido, len(aulas_do_grupo)
+                        agenda, dia_escolhido, len(aulas_do_grupo), permitidas
                     )
                     
                     if horarios_consecutivos:
@@ -290,18 +413,34 @@ class ScheduleGA_V2:
                                 agenda[dia_escolhido, horario] = aula
                     else:
                         # Se não conseguir consecutivos, alocar em qualquer horário disponível
-                        self._alocar_aulas_disponiveis(agenda, dia_escolhido, aulas_do_grupo)
+                        self._alocar_aulas_disponiveis(agenda, dia_escolhido, aulas_do_grupo, permitidas)
         
         # Verificar se sobrou alguma aula não alocada e alocar em slots livres
         self._alocar_aulas_restantes(agenda, aulas_por_disciplina)
         
         return agenda
     
-    def _encontrar_horarios_consecutivos(self, agenda: np.ndarray, dia: int, num_aulas: int) -> list:
-        """Encontra horários consecutivos livres em um dia específico"""
+    def _alocar_aulas_fixadas(self, agenda: np.ndarray, aulas_por_disciplina: dict):
+        """Aloca nas células fixadas do domínio as primeiras aulas de cada disciplina e as retira dos grupos"""
+        if not self.podar_dominios:
+            return
+        for disc_codigo, grupos in aulas_por_disciplina.items():
+            dominio = self.dominios.get(disc_codigo)
+            if dominio is None or not dominio.fixadas:
+                continue
+            livres = [celula for celula in sorted(dominio.fixadas) if agenda[celula] is None]
+            for grupo in list(grupos):
+                while grupos[grupo] and livres:
+                    agenda[livres.pop(0)] = grupos[grupo].pop(0)
+                if not grupos[grupo]:
+                    del grupos[grupo]
+    
+    def _encontrar_horarios_consecutivos(self, agenda: np.ndarray, dia: int, num_aulas: int,
+                                         permitidas=None) -> list:
+        """Encontra horários consecutivos livres (e permitidos) em um dia específico"""
         horarios_livres = []
         for h in range(self.num_horarios):
-            if agenda[dia, h] is None:
+            if agenda[dia, h] is None and (permitidas is None or (dia, h) in permitidas):
                 horarios_livres.append(h)
         
         # Tentar encontrar sequência consecutiva
@@ -314,9 +453,10 @@ class ScheduleGA_V2:
         # Se não encontrar consecutivos, retornar os primeiros disponíveis
         return horarios_livres[:num_aulas] if len(horarios_livres) >= num_aulas else horarios_livres
     
-    def _alocar_aulas_disponiveis(self, agenda: np.ndarray, dia: int, aulas: list):
-        """Aloca aulas em horários disponíveis de um dia específico"""
-        horarios_livres = [h for h in range(self.num_horarios) if agenda[dia, h] is None]
+    def _alocar_aulas_disponiveis(self, agenda: np.ndarray, dia: int, aulas: list, permitidas=None):
+        """Aloca aulas em horários disponíveis (e permitidos) de um dia específico"""
+        horarios_livres = [h for h in range(self.num_horarios) if agenda[dia, h] is None
+                           and (permitidas is None or (dia, h) in permitidas)]
         
         for i, aula in enumerate(aulas):
             if i < len(horarios_livres):
@@ -341,14 +481,17 @@ class ScheduleGA_V2:
             if id_aula not in aulas_na_agenda:
                 aulas_nao_alocadas.append(aula)
         
-        # Alocar em qualquer slot livre
+        # Alocar em qualquer slot livre (preferindo os do domínio da disciplina)
         slots_livres = [(d, h) for d in range(self.num_dias) for h in range(self.num_horarios) 
                        if agenda[d, h] is None]
         
-        for i, aula in enumerate(aulas_nao_alocadas):
-            if i < len(slots_livres):
-                d, h = slots_livres[i]
-                agenda[d, h] = aula
+        for aula in aulas_nao_alocadas:
+            if not slots_livres:
+                break
+            permitidos = [slot for slot in slots_livres if self._aula_permitida(aula, *slot)]
+            d, h = (permitidos or slots_livres)[0]
+            slots_livres.remove((d, h))
+            agenda[d, h] = aula
     
     def _professor_disponivel(self, professor_codigo: str, dia: int, horario: int) -> bool:
         """Verifica se professor está disponível no dia/horário"""
@@ -364,49 +507,78 @@ class ScheduleGA_V2:
         
         return False
     
+    def decodificar(self, individuo) -> np.ndarray:
+        """
+        Converte o genoma em agenda (matriz dias x horários)
+        Na V2 o genoma já é a própria agenda; codificações alternativas sobrescrevem este método
+        """
+        return individuo
+    
+    def codificar(self, agenda: np.ndarray) -> np.ndarray:
+        """Converte uma agenda em genoma (na V2, uma cópia da própria agenda)"""
+        return agenda.copy()
+    
+    def _solucao_inicial(self) -> np.ndarray:
+        """Ponto de partida dos motores de trajetória única: a primeira semente ou a inicialização padrão"""
+        sementes = self.sementes or (gerar_sementes(self, 1) if self.sementes_solver else [])
+        return sementes[0].copy() if sementes else self.criar_cromossomo()
+    
     def inicializar_populacao(self) -> List[np.ndarray]:
-        """Inicializa a população garantindo viabilidade"""
-        populacao = []
-        
-        print("🧬 Inicializando população...")
-        for i in range(self.populacao_size):
+        """
+        Inicializa a população garantindo viabilidade
+        As sementes (self.sementes e as geradas pelo solver) entram primeiro
+        """
+        sementes = list(self.sementes)
+        if self.sementes_solver:
+            sementes += gerar_sementes(self, self.sementes_solver)
+        populacao = [self.codificar(semente) for semente in sementes[:self.populacao_size]]
+        if populacao:
+            self._log(f"🌱 {len(populacao)} sementes na população inicial")
+        
+        self._log("🧬 Inicializando população...")
+        for i in range(len(populacao), self.populacao_size):
             cromossomo = self.criar_cromossomo()
             populacao.append(cromossomo)
             
             if (i + 1) % 10 == 0:
-                print(f"   Criados {i + 1}/{self.populacao_size} cromossomos")
+                self._log(f"   Criados {i + 1}/{self.populacao_size} cromossomos")
         
         return populacao
     
     def calcular_fitness(self, agenda: np.ndarray) -> float:
         """
         Calcula fitness usando pontuação positiva
-        Quanto maior, melhor a solução
+        Quanto maior, melhor a solução (soma dos componentes)
         """
-        pontuacao_total = 0
-        
-        # 1. Pontuação por disciplinas completamente atendidas
-        pontuacao_total += self._pontuar_disciplinas_atendidas(agenda)
-        
-        # 2. Pontuação por disponibilidade respeitada
-        pontuacao_total += self._pontuar_disponibilidade(agenda)
-        
-        # 3. Pontuação por distribuição equilibrada e inteligente
-        pontuacao_total += self._pontuar_distribuicao(agenda)
-        
-        # 4. Pontuação por não sobrecarga de dias
-        pontuacao_total += self._pontuar_carga_diaria(agenda)
-        
-        # 5. Pontuação por ausência de janelas
-        pontuacao_total += self._pontuar_continuidade(agenda)
-        
-        # 6. Pontuação por satisfação do professor
-        pontuacao_total += self._pontuar_professor(agenda)
-        
-        # 7. Pontuação por uso da sala
-        pontuacao_total += self._pontuar_sala(agenda)
-        
-        return pontuacao_total
+        return float(self.calcular_componentes(agenda).sum())
+    
+    def calcular_componentes(self, agenda: np.ndarray) -> np.ndarray:
+        """
+        Pontos de cada componente do fitness, na ordem de COMPONENTES_FITNESS
+        A soma é calcular_fitness(agenda); ver score_reweighting para reponderar
+        """
+        # Máscaras de bits montadas uma vez e compartilhadas pelos termos que as usam
+        mascaras = mascaras_agenda(agenda)
+        equilibrada, inteligente, consecutivas = self._partes_distribuicao(agenda, mascaras)
+        return np.array([
+            self._pontuar_disciplinas_atendidas(agenda),   # Disciplinas completamente atendidas
+            self._pontuar_disponibilidade(agenda),         # Disponibilidade respeitada
+            equilibrada,                                   # Distribuição equilibrada
+            inteligente,                                   # Distribuição inteligente
+            self._pontuar_carga_diaria(agenda),            # Sem sobrecarga de dias
+            self._pontuar_continuidade(agenda, mascaras),  # Sem janelas
+            self._pontuar_professor(agenda),               # Satisfação do professor
+            self._pontuar_sala(agenda),                    # Uso da sala
+            self._pontuar_estabilidade(agenda),            # Estabilidade em relação à agenda de referência
+            consecutivas                                   # Bônus por aulas consecutivas
+        ], dtype=float)
+    
+    def matriz_componentes(self, populacao: list) -> np.ndarray:
+        """Componentes de cada indivíduo: matriz (indivíduos x COMPONENTES_FITNESS)"""
+        matriz = np.zeros((len(populacao), len(COMPONENTES_FITNESS)))
+        for i, ind in enumerate(populacao):
+            matriz[i] = self.calcular_componentes(self.decodificar(ind))
+        return matriz
     
     def _pontuar_disciplinas_atendidas(self, agenda: np.ndarray) -> float:
         """Pontua disciplinas que tiveram EXATAMENTE a carga horária alocada"""
@@ -455,31 +627,34 @@ class ScheduleGA_V2:
     
     def _pontuar_distribuicao(self, agenda: np.ndarray) -> float:
         """Pontua distribuição equilibrada das aulas e respeito à distribuição planejada"""
-        pontos = 0
+        return sum(self._partes_distribuicao(agenda))
+    
+    def _partes_distribuicao(self, agenda: np.ndarray, mascaras=None) -> Tuple[float, float, float]:
+        """
+        Pontos de distribuição separados: (equilibrada, planejada, bônus de aulas consecutivas)
+        - mascaras: resultado de mascaras_agenda(agenda), se já calculado
+        """
+        equilibrada = inteligente = consecutivas = 0
+        tabelas = tabelas_mascara(self.num_horarios)
+        ocupacao, mascaras_disciplina = mascaras if mascaras is not None else mascaras_agenda(agenda)
+        vazio = [0] * self.num_dias
         
         # 1. Pontuar distribuição geral equilibrada entre dias
-        aulas_por_dia = []
-        for dia in range(self.num_dias):
-            count = sum(1 for h in range(self.num_horarios) if agenda[dia, h] is not None)
-            aulas_por_dia.append(count)
+        aulas_por_dia = [tabelas.ocupados[mascara] for mascara in ocupacao]
         
         if len(aulas_por_dia) > 0:
             media = np.mean(aulas_por_dia)
             variacao = np.std(aulas_por_dia)
             # Menos variação = mais pontos
-            pontos += self.pesos['distribuicao_equilibrada'] * max(0, (2.0 - variacao)) * 0.5
+            equilibrada += self.pesos['distribuicao_equilibrada'] * max(0, (2.0 - variacao)) * 0.5
         
         # 2. Pontuar respeito à distribuição planejada por disciplina
         for disc_codigo, info_dist in self.distribuicao_disciplinas.items():
             distribuicao_planejada = info_dist['distribuicao']
+            mascaras = mascaras_disciplina.get(disc_codigo, vazio)
             
-            # Contar como as aulas desta disciplina estão distribuídas na agenda
-            distribuicao_real = [0] * self.num_dias
-            for dia in range(self.num_dias):
-                for horario in range(self.num_horarios):
-                    aula = agenda[dia, horario]
-                    if aula is not None and aula.disciplina == disc_codigo:
-                        distribuicao_real[dia] += 1
+            # Como as aulas desta disciplina estão distribuídas na agenda
+            distribuicao_real = [tabelas.ocupados[mascara] for mascara in mascaras]
             
             # Filtrar apenas dias com aulas desta disciplina
             dias_com_aulas = [count for count in distribuicao_real if count > 0]
@@ -492,7 +667,7 @@ class ScheduleGA_V2:
                 
                 if dias_com_aulas == distribuicao_planejada_ordenada:
                     # Distribuição perfeita!
-                    pontos += self.pesos['distribuicao_inteligente']
+                    inteligente += self.pesos['distribuicao_inteligente']
                 else:
                     # Distribuição parcial - pontuar proporcionalmente
                     diferenca = sum(abs(real - planejado) 
@@ -500,31 +675,26 @@ class ScheduleGA_V2:
                     total_aulas = sum(distribuicao_planejada)
                     if total_aulas > 0:
                         similarity = max(0, 1 - (diferenca / total_aulas))
-                        pontos += self.pesos['distribuicao_inteligente'] * similarity
+                        inteligente += self.pesos['distribuicao_inteligente'] * similarity
             
             # 3. Bonificar aulas consecutivas no mesmo dia para a mesma disciplina
-            for dia in range(self.num_dias):
-                aulas_consecutivas = self._contar_aulas_consecutivas_disciplina(agenda, dia, disc_codigo)
+            for mascara in mascaras:
+                aulas_consecutivas = tabelas.maior_sequencia[mascara]
                 if aulas_consecutivas >= 2:
                     # Bonificar por ter aulas consecutivas (melhor para o aluno)
-                    pontos += 50 * (aulas_consecutivas - 1)
+                    consecutivas += 50 * (aulas_consecutivas - 1)
         
-        return pontos
+        return equilibrada, inteligente, consecutivas
     
     def _contar_aulas_consecutivas_disciplina(self, agenda: np.ndarray, dia: int, disciplina: str) -> int:
         """Conta o maior número de aulas consecutivas de uma disciplina em um dia"""
-        max_consecutivas = 0
-        consecutivas_atual = 0
-        
+        mascara = 0
         for horario in range(self.num_horarios):
             aula = agenda[dia, horario]
             if aula is not None and aula.disciplina == disciplina:
-                consecutivas_atual += 1
-                max_consecutivas = max(max_consecutivas, consecutivas_atual)
-            else:
-                consecutivas_atual = 0
+                mascara |= 1 << horario
         
-        return max_consecutivas
+        return tabelas_mascara(self.num_horarios).maior_sequencia[mascara]
     
     def _pontuar_carga_diaria(self, agenda: np.ndarray) -> float:
         """Pontua dias sem sobrecarga (máximo 4 aulas)"""
@@ -537,21 +707,16 @@ class ScheduleGA_V2:
         
         return pontos
     
-    def _pontuar_continuidade(self, agenda: np.ndarray) -> float:
-        """Pontua aulas consecutivas (sem janelas)"""
+    def _pontuar_continuidade(self, agenda: np.ndarray, mascaras=None) -> float:
+        """Pontua aulas consecutivas (sem janelas); mascaras como em _partes_distribuicao"""
         pontos = 0
+        tabelas = tabelas_mascara(self.num_horarios)
+        ocupacao, _ = mascaras if mascaras is not None else mascaras_agenda(agenda)
         
-        for dia in range(self.num_dias):
-            # Verificar continuidade no dia
-            aulas_dia = [agenda[dia, h] is not None for h in range(self.num_horarios)]
-            
-            if any(aulas_dia):
-                # Encontrar primeiro e último slot ocupado
-                primeiro_slot = next(i for i, ocupado in enumerate(aulas_dia) if ocupado)
-                ultimo_slot = next(i for i in reversed(range(len(aulas_dia))) if aulas_dia[i])
-                
-                # Contar janelas (slots vazios entre primeiro e último)
-                janelas = sum(1 for i in range(primeiro_slot, ultimo_slot + 1) if not aulas_dia[i])
+        for mascara in ocupacao:
+            if mascara:
+                # Janelas = slots vazios entre o primeiro e o último ocupado (consulta à tabela)
+                janelas = tabelas.janelas[mascara]
                 
                 # Menos janelas = mais pontos
                 pontos += self.pesos['sem_janelas'] * max(0, (4 - janelas))
@@ -596,11 +761,25 @@ class ScheduleGA_V2:
         
         return pontos
     
+    def _pontuar_estabilidade(self, agenda: np.ndarray) -> float:
+        """Pontua aulas que continuam na mesma célula da agenda_referencia"""
+        if self.agenda_referencia is None:
+            return 0
+        
+        mantidas = sum(1 for d in range(self.num_dias)
+                       for h in range(self.num_horarios)
+                       if agenda[d, h] is not None and agenda[d, h].disciplina == self.agenda_referencia[d, h])
+        
+        return self.pesos['aula_mantida'] * mantidas
+    
     def selecao_torneio(self, populacao: List[np.ndarray], fitness_scores: List[float]) -> np.ndarray:
         """Seleção por torneio"""
-        indices = random.sample(range(len(populacao)), self.tamanho_torneio)
-        melhor_indice = max(indices, key=lambda i: fitness_scores[i])
-        return copy.deepcopy(populacao[melhor_indice])
+        return copy.deepcopy(populacao[self._indice_torneio(fitness_scores)])
+    
+    def _indice_torneio(self, fitness_scores: List[float]) -> int:
+        """Índice do vencedor de um torneio"""
+        indices = random.sample(range(len(fitness_scores)), self.tamanho_torneio)
+        return max(indices, key=lambda i: fitness_scores[i])
     
     def crossover_agenda(self, pai1: np.ndarray, pai2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -633,6 +812,12 @@ class ScheduleGA_V2:
         Mutação específica para agenda
         Move aulas para outros slots
         """
+        if self.mutacao_guiada:
+            return self.mutacao_guiada_violacoes(agenda)
+        return self._mutacao_aleatoria(agenda)
+    
+    def _mutacao_aleatoria(self, agenda: np.ndarray) -> np.ndarray:
+        """Troca de células: pares de slots aleatórios trocam de conteúdo"""
         agenda_mutada = copy.deepcopy(agenda)
         
         # Número de mutações baseado no tamanho da agenda
@@ -644,6 +829,14 @@ class ScheduleGA_V2:
                 dia1, hora1 = random.randint(0, self.num_dias-1), random.randint(0, self.num_horarios-1)
                 dia2, hora2 = random.randint(0, self.num_dias-1), random.randint(0, self.num_horarios-1)
                 
+                # Com poda de domínios, o segundo slot é sorteado entre as trocas permitidas
+                if self.podar_dominios and not self._troca_permitida(agenda_mutada, dia1, hora1, dia2, hora2):
+                    opcoes = [(d, h) for d in range(self.num_dias) for h in range(self.num_horarios)
+                              if self._troca_permitida(agenda_mutada, dia1, hora1, d, h)]
+                    if not opcoes:
+                        continue
+                    dia2, hora2 = random.choice(opcoes)
+                
                 # Trocar conteúdo dos slots
                 temp = agenda_mutada[dia1, hora1]
                 agenda_mutada[dia1, hora1] = agenda_mutada[dia2, hora2]
@@ -651,6 +844,154 @@ class ScheduleGA_V2:
         
         return agenda_mutada
     
+    def _operadores_crossover(self) -> Dict[str, Callable]:
+        """Registro de operadores de crossover disponíveis para a seleção adaptativa"""
+        return {
+            'dias': self.crossover_agenda,
+            'uniforme': self._crossover_uniforme,
+            'dois_pontos': self._crossover_dois_pontos
+        }
+    
+    def _operadores_mutacao(self) -> Dict[str, Callable]:
+        """Registro de operadores de mutação disponíveis para a seleção adaptativa"""
+        return {
+            'troca_celulas': self._mutacao_aleatoria,
+            'guiada': self.mutacao_guiada_violacoes,
+            'troca_dias': self._mutacao_troca_dias
+        }
+    
+    def _crossover_uniforme(self, pai1: np.ndarray, pai2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Crossover uniforme: cada célula vem de um dos pais com probabilidade 1/2 (com reparo)"""
+        if random.random() > self.taxa_crossover:
+            return copy.deepcopy(pai1), copy.deepcopy(pai2)
+        
+        mascara = np.random.random(pai1.shape) < 0.5
+        filho1 = np.where(mascara, pai2, pai1)
+        filho2 = np.where(mascara, pai1, pai2)
+        
+        return self._reparar_cromossomo(copy.deepcopy(filho1)), self._reparar_cromossomo(copy.deepcopy(filho2))
+    
+    def _crossover_dois_pontos(self, pai1: np.ndarray, pai2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Crossover de dois pontos sobre as células em ordem (dia, horário), com reparo"""
+        if random.random() > self.taxa_crossover:
+            return copy.deepcopy(pai1), copy.deepcopy(pai2)
+        
+        num_celulas = self.num_dias * self.num_horarios
+        ponto1, ponto2 = sorted(random.sample(range(num_celulas + 1), 2))
+        filho1 = copy.deepcopy(pai1).ravel()
+        filho2 = copy.deepcopy(pai2).ravel()
+        temp = filho1[ponto1:ponto2].copy()
+        filho1[ponto1:ponto2] = filho2[ponto1:ponto2]
+        filho2[ponto1:ponto2] = temp
+        
+        return (self._reparar_cromossomo(filho1.reshape(pai1.shape)),
+                self._reparar_cromossomo(filho2.reshape(pai2.shape)))
+    
+    def _mutacao_troca_dias(self, agenda: np.ndarray) -> np.ndarray:
+        """
+        Troca de dias: dois dias trocam todas as aulas
+        Preserva a distribuição por dia; com poda de domínios, só troca se
+        todas as aulas continuam dentro do domínio
+        """
+        agenda_mutada = copy.deepcopy(agenda)
+        if self.num_dias < 2:
+            return agenda_mutada
+        
+        num_mutacoes = max(1, int(self.taxa_mutacao * self.num_dias))
+        for _ in range(num_mutacoes):
+            if random.random() < self.taxa_mutacao:
+                dia1, dia2 = random.sample(range(self.num_dias), 2)
+                if self.podar_dominios and not all(
+                        self._troca_permitida(agenda_mutada, dia1, h, dia2, h) for h in range(self.num_horarios)):
+                    continue
+                temp = agenda_mutada[dia1, :].copy()
+                agenda_mutada[dia1, :] = agenda_mutada[dia2, :]
+                agenda_mutada[dia2, :] = temp
+        
+        return agenda_mutada
+    
+    def _troca_permitida(self, agenda: np.ndarray, dia1: int, hora1: int, dia2: int, hora2: int) -> bool:
+        """Trocar as duas células mantém cada aula dentro do seu domínio"""
+        return self._aula_permitida(agenda[dia1, hora1], dia2, hora2) and \
+               self._aula_permitida(agenda[dia2, hora2], dia1, hora1)
+    
+    def _flags_violacao(self, agenda: np.ndarray, mascaras=None) -> np.ndarray:
+        """
+        Matriz booleana (dias x horários) das células que violam alguma pontuação
+        - Aula com professor indisponível
+        - Aula de disciplina fora da distribuição planejada (dia com quantidade
+          que não está no plano, ou número de dias diferente do planejado)
+        - Disciplina com aulas extras
+        - mascaras: resultado de mascaras_agenda(agenda), se já calculado
+        """
+        flags = np.zeros((self.num_dias, self.num_horarios), dtype=bool)
+        tabelas = tabelas_mascara(self.num_horarios)
+        _, mascaras_disciplina = mascaras if mascaras is not None else mascaras_agenda(agenda)
+        
+        disciplinas_violadas = {}
+        for disc_codigo, mascaras in mascaras_disciplina.items():
+            contagens = [tabelas.ocupados[mascara] for mascara in mascaras]
+            info = self.distribuicao_disciplinas.get(disc_codigo)
+            planejada = info['distribuicao'] if info else []
+            dias_com_aulas = [c for c in contagens if c > 0]
+            
+            if sum(contagens) > self.disciplinas[disc_codigo].carga_horaria or \
+               len(dias_com_aulas) != len(planejada):
+                disciplinas_violadas[disc_codigo] = set(range(self.num_dias))
+            elif sorted(dias_com_aulas, reverse=True) != sorted(planejada, reverse=True):
+                disciplinas_violadas[disc_codigo] = {dia for dia, c in enumerate(contagens)
+                                                     if c > 0 and c not in planejada}
+        
+        for dia in range(self.num_dias):
+            for horario in range(self.num_horarios):
+                aula = agenda[dia, horario]
+                if aula is None:
+                    continue
+                if dia in disciplinas_violadas.get(aula.disciplina, ()) or \
+                   not self._professor_disponivel(aula.professor, dia, horario):
+                    flags[dia, horario] = True
+        
+        return flags
+    
+    def mutacao_guiada_violacoes(self, agenda: np.ndarray) -> np.ndarray:
+        """
+        Mutação guiada: troca preferencialmente células com violações
+        - Mesmo número de tentativas e probabilidade da mutação aleatória
+        - self.proporcao_aleatoria das trocas sorteia a primeira célula livremente
+        - Nunca troca vazio com vazio
+        """
+        agenda_mutada = copy.deepcopy(agenda)
+        
+        num_mutacoes = max(1, int(self.taxa_mutacao * self.num_dias * self.num_horarios))
+        num_trocas = sum(1 for _ in range(num_mutacoes) if random.random() < self.taxa_mutacao)
+        if num_trocas == 0:
+            return agenda_mutada
+        
+        violadas = list(zip(*np.nonzero(self._flags_violacao(agenda_mutada))))
+        celulas = [(d, h) for d in range(self.num_dias) for h in range(self.num_horarios)]
+        
+        for _ in range(num_trocas):
+            if violadas and random.random() >= self.proporcao_aleatoria:
+                dia1, hora1 = random.choice(violadas)
+            else:
+                dia1, hora1 = random.choice(celulas)
+            
+            # Se a primeira célula está vazia, a segunda precisa ter aula
+            if agenda_mutada[dia1, hora1] is None:
+                opcoes = [(d, h) for d, h in celulas if agenda_mutada[d, h] is not None]
+            else:
+                opcoes = [(d, h) for d, h in celulas if (d, h) != (dia1, hora1)]
+            opcoes = [(d, h) for d, h in opcoes if self._troca_permitida(agenda_mutada, dia1, hora1, d, h)]
+            if not opcoes:
+                continue
+            dia2, hora2 = random.choice(opcoes)
+            
+            temp = agenda_mutada[dia1, hora1]
+            agenda_mutada[dia1, hora1] = agenda_mutada[dia2, hora2]
+            agenda_mutada[dia2, hora2] = temp
+        
+        return agenda_mutada
+    
     def _reparar_cromossomo(self, agenda: np.ndarray) -> np.ndarray:
         """
         Repara cromossomo para garantir que todas as disciplinas sejam atendidas
@@ -706,10 +1047,13 @@ class ScheduleGA_V2:
                         professor = prof_codigo
                         break
                 
-                # Procurar slots vazios e adicionar aulas
+                # Procurar slots vazios (primeiro os do domínio) e adicionar aulas
                 slots_vazios = [(d, h) for d in range(self.num_dias) 
                                for h in range(self.num_horarios) 
                                if agenda[d, h] is None]
+                permitidas = self._celulas_permitidas(disc_codigo)
+                if permitidas is not None:
+                    slots_vazios.sort(key=lambda slot: slot not in permitidas)
                 
                 aulas_adicionadas = 0
                 for dia, horario in slots_vazios:
@@ -718,7 +1062,7 @@ class ScheduleGA_V2:
                     nova_aula = Aula(
                         disciplina=disc_codigo,
                         professor=professor,
-                        sala=list(self.salas.keys())[0]
+                        sala=self._sala_disciplina(disc_codigo)
                     )
                     nova_aula.grupo_dia = 0  # Grupo padrão para aulas de reparo
                     nova_aula.posicao_no_grupo = aulas_adicionadas
@@ -727,42 +1071,221 @@ class ScheduleGA_V2:
         
         return agenda
     
-    def executar(self) -> Tuple[np.ndarray, float, List[float]]:
-        """Executa o algoritmo genético"""
-        print("📚 Carregando dados...")
-        self.carregar_dados()
-        
-        print("🧬 Inicializando população...")
-        populacao = self.inicializar_populacao()
-        
-        historico_fitness = []
-        melhor_global = None
-        melhor_fitness_global = 0
-        
-        print("🚀 Iniciando evolução...")
-        for geracao in range(self.geracoes):
+    def _cruzar(self, pai1: np.ndarray, pai2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return self.crossover_agenda(pai1, pai2)
+    
+    def _mutar(self, individuo: np.ndarray) -> np.ndarray:
+        return self.mutacao_agenda(individuo)
+    
+    def _avaliar_individuo(self, individuo: np.ndarray) -> Tuple[float, np.ndarray]:
+        linha = self.calcular_componentes(self.decodificar(individuo))
+        return float(linha.sum()), linha
+    
+    def _matriz_genomas(self, populacao: list) -> np.ndarray:
+        """Codifica a população como matriz inteira (indivíduos x células): disciplina de cada célula (0 = vazia)"""
+        indice = {disc: i + 1 for i, disc in enumerate(self.disciplinas)}
+        return np.array([[0 if aula is None else indice.get(aula.disciplina, 0)
+                          for aula in self.decodificar(ind).ravel()]
+                         for ind in populacao], dtype=np.int64)
+    
+    def _avaliar_populacao(self, populacao: list) -> np.ndarray:
+        """
+        Avalia a população inteira: matriz (indivíduos x COMPONENTES_FITNESS);
+        o fitness de cada indivíduo é a soma da sua linha
+        Com eliminar_duplicatas, genomas repetidos (mesmo hash) ou já avaliados
+        na geração anterior reaproveitam os componentes sem nova avaliação
+        """
+        if not self.eliminar_duplicatas:
+            self.total_avaliacoes += len(populacao)
+            return self.matriz_componentes(populacao)
+        
+        hashes = hash_genomas(self._matriz_genomas(populacao)).tolist()
+        cache = {}
+        componentes = np.zeros((len(populacao), len(COMPONENTES_FITNESS)))
+        for i, (ind, chave) in enumerate(zip(populacao, hashes)):
+            linha = cache.get(chave, self._cache_componentes.get(chave))
+            if linha is None:
+                linha = self.calcular_componentes(self.decodificar(ind))
+                self.total_avaliacoes += 1
+            cache[chave] = linha
+            componentes[i] = linha
+        
+        self._cache_componentes = cache
+        return componentes
+    
+    def importar_solucao(self, solucao: np.ndarray, fitness: float):
+        """
+        Insere uma solução externa (p. ex. o incumbente de outro motor) no checkpoint
+        - Substitui o pior indivíduo de self.estado (o último, no modo geracional)
+        - Entra na busca na próxima execução com retomar=True
+        """
+        if self.estado is None:
+            raise ValueError("Sem checkpoint: execute o motor antes de importar soluções")
+        populacao = self.estado['populacao']
+        fitness_scores = self.estado.get('fitness_scores')
+        indice = fitness_scores.index(min(fitness_scores)) if fitness_scores else len(populacao) - 1
+        populacao[indice] = self.codificar(solucao)
+        if fitness_scores:
+            fitness_scores[indice] = fitness
+        # Quando a matriz arquivada descreve a própria população (modo estacionário),
+        # a linha do indivíduo substituído acompanha a troca
+        componentes = self.estado.get('componentes')
+        if componentes is not None and self.estado.get('avaliados') is populacao:
+            componentes[indice] = self.calcular_componentes(solucao)
+            self.estado['total_avaliacoes'] += 1
+    
+    def executar(self, callbacks=None, retomar=False) -> Tuple[np.ndarray, float, List[float]]:
+        """
+        Executa o algoritmo genético
+        - callbacks: lista de funções chamadas a cada geração com um RegistroGeracao
+          (ver execution_events.SinkJsonLines e SinkBufferCircular)
+        - retomar: continua a partir de self.estado (checkpoint da execução anterior)
+          por mais self.geracoes gerações
+        """
+        if not self.dados_carregados:
+            self._log("📚 Carregando dados...")
+            self.carregar_dados()
+        
+        if retomar and self.estado is not None:
+            populacao = self.estado['populacao']
+            historico_fitness = list(self.estado['historico_fitness'])
+            melhor_global = self.estado['melhor_global']
+            melhor_fitness_global = self.estado['melhor_fitness_global']
+            geracao_inicial = self.estado['geracao']
+            self.total_avaliacoes = self.estado['total_avaliacoes']
+            fitness_scores = self.estado.get('fitness_scores')
+            componentes = self.estado.get('componentes')
+            avaliados = self.estado.get('avaliados')
+            taxas_estado = self.estado.get('taxas')
+            self._bandits = self.estado.get('bandits')
+        else:
+            if self.verificacao_previa:
+                self._verificar_viabilidade()
+            
+            self._log("🧬 Inicializando população...")
+            populacao = self.inicializar_populacao()
+            
+            historico_fitness = []
+            melhor_global = None
+            melhor_fitness_global = 0
+            geracao_inicial = 0
+            self.total_avaliacoes = 0
+            fitness_scores = None
+            componentes = None
+            avaliados = None
+            taxas_estado = None
+            self._bandits = None
+            self.historico_diversidade = []
+            self.historico_taxas = []
+            self.hall_da_fama = HallDaFama(self.tamanho_hall_da_fama)
+            self.historico_reinicios = []
+        
+        # Cache de avaliações vale só dentro de uma execução: pesos, agenda_referencia
+        # e dados podem mudar entre execuções (inclusive ao retomar)
+        self._cache_componentes = {}
+        convergiu = False
+        tamanho_historico_inicial = len(historico_fitness)
+        melhor_indice = fitness_scores.index(max(fitness_scores)) if fitness_scores else 0
+        
+        # Taxas configuradas são restauradas no fim; as adaptadas seguem no checkpoint
+        taxas_configuradas = (self.taxa_mutacao, self.taxa_crossover)
+        if self.adaptacao_taxas and taxas_estado:
+            self.taxa_mutacao, self.taxa_crossover = taxas_estado
+        self._fitness_pais = None
+        self._sucessos = []
+        self._origens = None
+        self._preparar_selecao_operadores()
+        geracoes_sem_melhora = 0
+        
+        self._log("🚀 Iniciando evolução...")
+        for geracao in range(geracao_inicial, geracao_inicial + self.geracoes):
+            estacionario = self.modo_substituicao == 'estacionario'
+            diversidade_ativa = self.eliminar_duplicatas or self.limiar_diversidade > 0
+            
             # Avaliar fitness
-            fitness_scores = [self.calcular_fitness(ind) for ind in populacao]
+            inicio_avaliacao = time.perf_counter()
+            if estacionario and fitness_scores is not None:
+                # Steady-state: só os filhos são avaliados, substituindo no lugar
+                melhor_indice = self._passos_estacionarios(populacao, fitness_scores, melhor_indice, componentes)
+                if diversidade_ativa:
+                    for i in self._preservar_diversidade(populacao, [melhor_indice]):
+                        componentes[i] = self.calcular_componentes(self.decodificar(populacao[i]))
+                        fitness_scores[i] = float(componentes[i].sum())
+                        self.total_avaliacoes += 1
+                        if fitness_scores[i] > fitness_scores[melhor_indice]:
+                            melhor_indice = i
+            else:
+                if diversidade_ativa:
+                    # A elite fica no início da população
+                    substituidos = self._preservar_diversidade(populacao, range(max(1, self.populacao_size // 10)))
+                    # Substitutos não são filhos dos pais registrados
+                    for registro in (self._fitness_pais, self._origens):
+                        for i in (substituidos if registro is not None else ()):
+                            registro[i] = None
+                inicio_cpu = time.process_time()
+                componentes = self._avaliar_populacao(populacao)
+                fitness_scores = componentes.sum(axis=1).tolist()
+                if self._origens is not None:
+                    self._creditar_operadores(fitness_scores, (time.process_time() - inicio_cpu) / len(populacao))
+                melhor_indice = fitness_scores.index(max(fitness_scores))
+            tempo_avaliacao = time.perf_counter() - inicio_avaliacao
+            avaliados = populacao
             
             # Encontrar melhor da geração
-            melhor_fitness_geracao = max(fitness_scores)
-            melhor_indice = fitness_scores.index(melhor_fitness_geracao)
+            melhor_fitness_geracao = fitness_scores[melhor_indice]
+            self._atualizar_hall_da_fama(populacao, fitness_scores, componentes)
             
             if melhor_fitness_geracao > melhor_fitness_global:
                 melhor_fitness_global = melhor_fitness_geracao
-                melhor_global = copy.deepcopy(populacao[melhor_indice])
+                # O hall da fama já guardou uma cópia do novo melhor
+                fitness_hall, agenda_hall, _ = self.hall_da_fama.melhor()
+                melhor_global = agenda_hall if fitness_hall == melhor_fitness_geracao else \
+                    copy.deepcopy(self.decodificar(populacao[melhor_indice]))
+                geracoes_sem_melhora = 0
+            else:
+                geracoes_sem_melhora += 1
+            
+            # Fim de uma explosão de mutação
+            if self._fim_explosao is not None and geracao >= self._fim_explosao:
+                self._encerrar_explosao_mutacao()
             
             historico_fitness.append(melhor_fitness_geracao)
             
+            # Emitir estatísticas da geração
+            if callbacks:
+                emitir_evento(callbacks, criar_registro_geracao(
+                    self.versao, geracao, fitness_scores, self.total_avaliacoes, tempo_avaliacao,
+                    self.historico_diversidade[-1] if diversidade_ativa else None,
+                    self.taxa_mutacao, self.taxa_crossover
+                ))
+            
+            # Ajustar taxas de mutação e crossover para a próxima geração
+            if self.adaptacao_taxas:
+                self._adaptar_taxas(geracao, fitness_scores,
+                                    self.historico_diversidade[-1] if diversidade_ativa else None)
+            
             # Log do progresso
-            if geracao % 50 == 0:
-                print(f"Geração {geracao}: Melhor fitness = {melhor_fitness_geracao:.0f}")
+            if geracao % self.intervalo_log == 0:
+                self._log(f"Geração {geracao}: Melhor fitness = {melhor_fitness_geracao:.0f}")
             
             # Verificar critério de parada
-            if geracao > 100 and len(set(historico_fitness[-50:])) == 1:
-                print(f"Convergência detectada na geração {geracao}!")
+            if not self.estrategia_reinicio and geracao > 100 and len(set(historico_fitness[-50:])) == 1:
+                self._log(f"Convergência detectada na geração {geracao}!")
+                convergiu = True
                 break
             
+            # Estagnação: reiniciar em vez de rodar gerações planas
+            if self.estrategia_reinicio and geracoes_sem_melhora >= self.geracoes_estagnacao:
+                populacao, reavaliar = self._reiniciar(populacao, fitness_scores, geracao,
+                                                       melhor_fitness_global, geracoes_sem_melhora, callbacks)
+                geracoes_sem_melhora = 0
+                if reavaliar:
+                    fitness_scores = None
+                    continue
+            
+            if estacionario:
+                continue
+            
             # Criar nova população
             nova_populacao = []
             
@@ -774,23 +1297,60 @@ class ScheduleGA_V2:
             for i in indices_elite:
                 nova_populacao.append(copy.deepcopy(populacao[i]))
             
+            # Fitness de referência (melhor pai) e operadores de cada filho,
+            # para a regra de 1/5 e o crédito dos operadores
+            fitness_pais = [None] * len(nova_populacao)
+            origens = [None] * len(nova_populacao)
+            
             # Gerar resto da população
             while len(nova_populacao) < self.populacao_size:
-                pai1 = self.selecao_torneio(populacao, fitness_scores)
-                pai2 = self.selecao_torneio(populacao, fitness_scores)
+                indice1 = self._indice_torneio(fitness_scores)
+                indice2 = self._indice_torneio(fitness_scores)
+                pai1 = copy.deepcopy(populacao[indice1])
+                pai2 = copy.deepcopy(populacao[indice2])
                 
-                filho1, filho2 = self.crossover_agenda(pai1, pai2)
-                
-                filho1 = self.mutacao_agenda(filho1)
-                filho2 = self.mutacao_agenda(filho2)
-                
-                nova_populacao.extend([filho1, filho2])
+                for filho, origem in self._gerar_filhos(pai1, pai2):
+                    nova_populacao.append(filho)
+                    origens.append(origem)
+                referencia = max(fitness_scores[indice1], fitness_scores[indice2])
+                fitness_pais.extend([referencia] * (len(nova_populacao) - len(fitness_pais)))
             
             # Ajustar tamanho da população
             populacao = nova_populacao[:self.populacao_size]
+            self._fitness_pais = fitness_pais[:self.populacao_size]
+            self._origens = origens[:self.populacao_size] if self._bandits is not None else None
+        
+        # Uma explosão de mutação não sobrevive ao fim da execução
+        self._encerrar_explosao_mutacao()
+        taxas_adaptadas = (self.taxa_mutacao, self.taxa_crossover) if self.adaptacao_taxas else None
+        self.taxa_mutacao, self.taxa_crossover = taxas_configuradas
+        
+        # Guardar checkpoint para permitir retomar a execução
+        self.estado = {
+            'populacao': populacao,
+            'historico_fitness': historico_fitness,
+            'melhor_global': melhor_global,
+            'melhor_fitness_global': melhor_fitness_global,
+            'geracao': geracao_inicial + len(historico_fitness) - tamanho_historico_inicial,
+            'total_avaliacoes': self.total_avaliacoes,
+            'fitness_scores': fitness_scores if self.modo_substituicao == 'estacionario' else None,
+            'taxas': taxas_adaptadas,
+            'bandits': self._bandits,
+            'convergiu': convergiu,
+            # Linhas da última avaliação (no modo geracional, 'populacao' já são os filhos seguintes)
+            'componentes': componentes,
+            'avaliados': avaliados,
+            'pesos': dict(self.pesos)
+        }
+        
+        if self._bandits is not None:
+            self.estatisticas_operadores = {tipo: bandit.estatisticas() for tipo, bandit in self._bandits.items()}
+            self._log(f"🎰 Crédito dos operadores ({self.selecao_operadores}):")
+            exibir_estatisticas(self.estatisticas_operadores, self._log)
         
-        print(f"✅ Evolução finalizada. Melhor fitness: {melhor_fitness_global:.0f}")
-        return melhor_global, melhor_fitness_global, historico_fitness
+        self._log(f"✅ Evolução finalizada. Melhor fitness: {melhor_fitness_global:.0f}")
+        # melhor_global é o objeto guardado no hall da fama: quem chama recebe uma cópia
+        return copy.deepcopy(melhor_global), melhor_fitness_global, historico_fitness
     
     def exibir_agenda(self, agenda: np.ndarray):
         """Exibe a agenda de forma organizada"""
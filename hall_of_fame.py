@@ -0,0 +1,70 @@
+import copy
+import heapq
+import itertools
+from typing import Iterator, List, Optional, Tuple
+
+class HallDaFama:
+    """
+    Arquivo das capacidade melhores agendas distintas de uma execução
+    - Distintas por hash do genoma (population_diversity.hash_genomas)
+    - Min-heap pelo fitness: inserir e descartar o pior custam O(log n)
+    - Só entra quem supera o pior do arquivo cheio (empate mantém o mais antigo)
+    Iterar devolve (fitness, agenda, componentes) do melhor ao pior
+    """
+
+    def __init__(self, capacidade: int = 10):
+        if capacidade < 1:
+            raise ValueError(f"A capacidade do hall da fama deve ser >= 1 (recebido {capacidade})")
+        self.capacidade = capacidade
+        self._heap = []          # (fitness, ordem de chegada, hash)
+        self._entradas = {}      # hash -> (fitness, agenda, componentes)
+        self._contador = itertools.count()
+        self._melhor = None      # Hash da melhor entrada, atualizado a cada inserção
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, chave: int) -> bool:
+        return chave in self._entradas
+
+    def __iter__(self) -> Iterator[Tuple[float, object, object]]:
+        return iter(self.entradas())
+
+    def limiar(self) -> float:
+        """Fitness que um candidato precisa superar para entrar"""
+        return self._heap[0][0] if len(self._heap) >= self.capacidade else float('-inf')
+
+    def aceita(self, fitness: float, chave: int) -> bool:
+        """O genoma é novo e entraria no arquivo (sem alterá-lo)"""
+        return fitness > self.limiar() and chave not in self._entradas
+
+    def inserir(self, fitness: float, chave: int, agenda, componentes=None) -> bool:
+        """Guarda uma cópia da agenda se ela entra no arquivo; retorna se entrou"""
+        if not self.aceita(fitness, chave):
+            return False
+        item = (fitness, next(self._contador), chave)
+        if len(self._heap) < self.capacidade:
+            heapq.heappush(self._heap, item)
+        else:
+            _, _, descartada = heapq.heapreplace(self._heap, item)
+            del self._entradas[descartada]
+        self._entradas[chave] = (fitness, copy.deepcopy(agenda), componentes)
+        # O descartado é o pior: se era também o melhor, o novo (que o superou) passa a ser;
+        # empate com o melhor mantém o mais antigo, como em entradas()
+        if self._melhor not in self._entradas or fitness > self._entradas[self._melhor][0]:
+            self._melhor = chave
+        return True
+
+    def entradas(self) -> List[Tuple[float, object, object]]:
+        """(fitness, agenda, componentes) do melhor ao pior"""
+        ordem = sorted(self._heap, key=lambda item: (-item[0], item[1]))
+        return [self._entradas[chave] for _, _, chave in ordem]
+
+    def melhor(self) -> Optional[Tuple[float, object, object]]:
+        """(fitness, agenda, componentes) da melhor entrada, em O(1)"""
+        return self._entradas[self._melhor] if self._melhor is not None else None
+
+    def limpar(self):
+        self._heap = []
+        self._entradas = {}
+        self._melhor = None
@@ -0,0 +1,33 @@
+import numpy as np
+from typing import List, Tuple
+
+def aulas_da_solucao(solucao) -> List[Tuple[str, str, str, int, int]]:
+    """
+    (disciplina, professor, sala, dia, horário) de cada aula, nas duas representações
+    - Agenda do modelo V2 (matriz dias x horários de Aula)
+    - Cromossomo da V1 (lista de genes)
+    """
+    if isinstance(solucao, np.ndarray):
+        return [(aula.disciplina, aula.professor, aula.sala, dia, horario)
+                for (dia, horario), aula in np.ndenumerate(solucao) if aula is not None]
+    return [(gene['disciplina'], gene['professor'], gene['sala'], gene['dia'], gene['horario'])
+            for gene in solucao]
+
+def contar_violacoes(engine, solucao) -> int:
+    """
+    Violações rígidas de uma solução (mesma definição na fronteira do NSGA-II e no portfólio)
+    - Professor ou sala em duas aulas na mesma célula (cada uso excedente conta 1)
+    - Aula com professor indisponível
+    - Diferença entre aulas alocadas e carga horária de cada disciplina
+    """
+    violacoes = 0
+    usos, contagem = {}, {}
+    for disciplina, professor, sala, dia, horario in aulas_da_solucao(solucao):
+        for chave in (('professor', professor, dia, horario), ('sala', sala, dia, horario)):
+            violacoes += usos.get(chave, 0)
+            usos[chave] = usos.get(chave, 0) + 1
+        if not engine._professor_disponivel(professor, dia, horario):
+            violacoes += 1
+        contagem[disciplina] = contagem.get(disciplina, 0) + 1
+    return violacoes + sum(abs(contagem.get(codigo, 0) - disciplina.carga_horaria)
+                           for codigo, disciplina in engine.disciplinas.items())
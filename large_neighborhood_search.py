@@ -0,0 +1,253 @@
+import random
+import time
+import numpy as np
+from itertools import islice
+from typing import List, Tuple
+from execution_events import criar_registro_geracao, emitir_evento
+from genetic_scheduler_v2 import ScheduleGA_V2
+from operator_selection import SelecaoOperadores, exibir_estatisticas
+
+class ScheduleLNS(ScheduleGA_V2):
+    """
+    Large Neighbourhood Search (destruir e reparar) sobre a agenda e os pesos da V2
+    - Destruição: aulas de um dia, de um professor ou das células com violações
+      (_flags_violacao), escolhida por um bandit (selecao_operadores) ou ao acaso
+    - Reparo exato (todas as atribuições, até limite_exato combinações) ou guloso
+      (aula mais restrita primeiro, na célula livre de maior fitness)
+    - Aceita pioras de até tolerancia_aceitacao do melhor (record-to-record)
+    - Para por número de iterações (self.geracoes), tempo_limite ou fitness_alvo
+    """
+
+    versao = 'LNS'
+    OPERADORES_DESTRUICAO = ('dia', 'professor', 'piores')
+
+    def __init__(self):
+        super().__init__()
+        self.geracoes = 300                   # Iterações de destruir e reparar
+        self.tamanho_destruicao = 6           # Aulas removidas pela destruição 'piores'
+        self.limite_exato = 300               # Máximo de atribuições no reparo exato (0 desliga)
+        self.tolerancia_aceitacao = 0.005     # Piora aceita, como fração do melhor fitness
+        self.selecao_operadores = 'probabilidade'  # Bandit da destruição (None = sorteio uniforme)
+        self.tempo_limite = None              # Segundos (None = sem limite)
+        self.fitness_alvo = None
+        self.reparos_exatos = 0
+        self.historico_atual = []
+
+    def _destruir(self, nome: str, agenda: np.ndarray) -> List[Tuple[int, int]]:
+        """Células cujas aulas serão removidas"""
+        ocupadas = [(d, h) for d in range(self.num_dias) for h in range(self.num_horarios)
+                    if agenda[d, h] is not None]
+        if not ocupadas:
+            return []
+
+        if nome == 'dia':
+            dias = set(random.sample(range(self.num_dias), min(2, self.num_dias)))
+            primeiro = random.choice(sorted(dias))
+            celulas = [(d, h) for d, h in ocupadas if d == primeiro]
+            if len(celulas) < 3:
+                celulas = [(d, h) for d, h in ocupadas if d in dias]
+            return celulas
+
+        if nome == 'professor':
+            professor = agenda[random.choice(ocupadas)].professor
+            return [(d, h) for d, h in ocupadas if agenda[d, h].professor == professor]
+
+        if nome == 'piores':
+            flags = self._flags_violacao(agenda)
+            violadas = [(d, h) for d, h in ocupadas if flags[d, h]]
+            celulas = random.sample(violadas, min(len(violadas), self.tamanho_destruicao))
+            restantes = [c for c in ocupadas if c not in celulas]
+            faltam = min(len(restantes), self.tamanho_destruicao - len(celulas))
+            return celulas + random.sample(restantes, max(0, faltam))
+
+        raise ValueError(f"Operador de destruição desconhecido: {nome} "
+                         f"(use um de {self.OPERADORES_DESTRUICAO})")
+
+    def _opcoes_reparo(self, agenda: np.ndarray, aulas: list) -> List[List[Tuple[int, int]]]:
+        """Células livres de cada aula (as do domínio; todas as livres se nenhuma for permitida)"""
+        livres = [(d, h) for d in range(self.num_dias) for h in range(self.num_horarios)
+                  if agenda[d, h] is None]
+        return [[c for c in livres if self._aula_permitida(aula, *c)] or livres for aula in aulas]
+
+    def _atribuicoes(self, aulas: list, opcoes: List[List[Tuple[int, int]]], i: int = 0,
+                     usadas: tuple = ()):
+        """
+        Gera as atribuições aula -> célula distinta
+        Aulas iguais (mesma disciplina, em sequência) recebem células em ordem
+        crescente, eliminando atribuições simétricas
+        """
+        if i == len(aulas):
+            yield usadas
+            return
+        minimo = usadas[-1] if i > 0 and aulas[i].disciplina == aulas[i - 1].disciplina else None
+        for celula in opcoes[i]:
+            if celula in usadas or (minimo is not None and celula <= minimo):
+                continue
+            yield from self._atribuicoes(aulas, opcoes, i + 1, usadas + (celula,))
+
+    def _reparar_exato(self, agenda: np.ndarray, aulas: list) -> bool:
+        """Testa todas as atribuições se houver no máximo limite_exato; senão não faz nada"""
+        aulas = sorted(aulas, key=lambda aula: aula.disciplina)
+        opcoes = self._opcoes_reparo(agenda, aulas)
+        if sum(1 for _ in islice(self._atribuicoes(aulas, opcoes), self.limite_exato + 1)) > self.limite_exato:
+            return False
+
+        melhor, melhor_fitness = None, float('-inf')
+        for atribuicao in self._atribuicoes(aulas, opcoes):
+            for aula, (d, h) in zip(aulas, atribuicao):
+                agenda[d, h] = aula
+            fitness = self.calcular_fitness(agenda)
+            self.total_avaliacoes += 1
+            if fitness > melhor_fitness:
+                melhor, melhor_fitness = atribuicao, fitness
+            for d, h in atribuicao:
+                agenda[d, h] = None
+
+        if melhor is None:
+            return False
+        for aula, (d, h) in zip(aulas, melhor):
+            agenda[d, h] = aula
+        self.reparos_exatos += 1
+        return True
+
+    def _reparar_guloso(self, agenda: np.ndarray, aulas: list):
+        """Insere as aulas (mais restritas primeiro) na célula livre que maximiza o fitness"""
+        pendentes = list(aulas)
+        random.shuffle(pendentes)
+        while pendentes:
+            opcoes = self._opcoes_reparo(agenda, pendentes)
+            i = min(range(len(pendentes)), key=lambda k: len(opcoes[k]))
+            aula = pendentes.pop(i)
+            if not opcoes[i]:
+                break
+
+            avaliadas = []
+            for d, h in opcoes[i]:
+                agenda[d, h] = aula
+                avaliadas.append((self.calcular_fitness(agenda), random.random(), (d, h)))
+                self.total_avaliacoes += 1
+                agenda[d, h] = None
+            _, _, (d, h) = max(avaliadas)
+            agenda[d, h] = aula
+
+    def importar_solucao(self, solucao: np.ndarray, fitness: float):
+        """Faz a próxima execução com retomar=True continuar da solução externa"""
+        if self.estado is None:
+            raise ValueError("Sem checkpoint: execute o motor antes de importar soluções")
+        self.estado['agenda_atual'] = solucao.copy()
+        self.estado['fitness_atual'] = fitness
+        if fitness > self.estado['melhor_fitness_global']:
+            self.estado['melhor_global'] = solucao.copy()
+            self.estado['melhor_fitness_global'] = fitness
+
+    def executar(self, callbacks=None, retomar=False) -> Tuple[np.ndarray, float, List[float]]:
+        """
+        Executa o LNS
+        - Mesmo contrato dos motores genéticos: (melhor agenda, fitness, histórico)
+        - O histórico guarda o melhor fitness ao fim de cada iteração
+        - retomar: continua de self.estado por mais self.geracoes iterações
+        """
+        if not self.dados_carregados:
+            self._log("📚 Carregando dados...")
+            self.carregar_dados()
+
+        inicio = time.perf_counter()
+
+        if retomar and self.estado is not None:
+            agenda = self.estado['agenda_atual'].copy()
+            fitness_atual = self.estado['fitness_atual']
+            historico_fitness = list(self.estado['historico_fitness'])
+            melhor_global = self.estado['melhor_global'].copy()
+            melhor_fitness_global = self.estado['melhor_fitness_global']
+            iteracao_inicial = self.estado['geracao']
+            self.total_avaliacoes = self.estado['total_avaliacoes']
+            bandit = self.estado['bandit']
+        else:
+            if self.verificacao_previa:
+                self._verificar_viabilidade()
+
+            self._log("🧬 Criando solução inicial...")
+            agenda = self._solucao_inicial()
+            fitness_atual = self.calcular_fitness(agenda)
+            historico_fitness = []
+            melhor_global = agenda.copy()
+            melhor_fitness_global = fitness_atual
+            iteracao_inicial = 0
+            self.total_avaliacoes = 1
+            self.reparos_exatos = 0
+            self.historico_atual = []
+            bandit = SelecaoOperadores(list(self.OPERADORES_DESTRUICAO), self.selecao_operadores,
+                                       **self.parametros_selecao) if self.selecao_operadores else None
+
+        convergiu = False
+        tamanho_historico_inicial = len(historico_fitness)
+
+        self._log("🔨 Iniciando destruir e reparar...")
+        for iteracao in range(iteracao_inicial, iteracao_inicial + self.geracoes):
+            inicio_iteracao = time.perf_counter()
+            inicio_cpu = time.process_time()
+            nome = bandit.escolher() if bandit is not None else random.choice(self.OPERADORES_DESTRUICAO)
+
+            candidata = agenda.copy()
+            celulas = self._destruir(nome, candidata)
+            aulas = [candidata[d, h] for d, h in celulas]
+            for d, h in celulas:
+                candidata[d, h] = None
+
+            if not (self.limite_exato and self._reparar_exato(candidata, aulas)):
+                self._reparar_guloso(candidata, aulas)
+            fitness = self.calcular_fitness(candidata)
+            self.total_avaliacoes += 1
+
+            if bandit is not None:
+                bandit.creditar(nome, fitness - fitness_atual, time.process_time() - inicio_cpu)
+
+            # Record-to-record: aceita pioras pequenas em relação ao melhor
+            if fitness >= fitness_atual or \
+               fitness >= melhor_fitness_global - self.tolerancia_aceitacao * abs(melhor_fitness_global):
+                agenda, fitness_atual = candidata, fitness
+                if fitness > melhor_fitness_global:
+                    melhor_fitness_global = fitness
+                    melhor_global = candidata.copy()
+
+            historico_fitness.append(melhor_fitness_global)
+            self.historico_atual.append(fitness_atual)
+
+            if callbacks:
+                emitir_evento(callbacks, criar_registro_geracao(
+                    self.versao, iteracao, [fitness, fitness_atual], self.total_avaliacoes,
+                    time.perf_counter() - inicio_iteracao
+                ))
+
+            if iteracao % self.intervalo_log == 0:
+                self._log(f"Iteração {iteracao}: Atual = {fitness_atual:.0f}, "
+                          f"Melhor = {melhor_fitness_global:.0f} ({nome}, {len(aulas)} aulas)")
+
+            if self.fitness_alvo is not None and melhor_fitness_global >= self.fitness_alvo:
+                self._log(f"🎯 Fitness alvo atingido na iteração {iteracao}!")
+                convergiu = True
+                break
+            if self.tempo_limite is not None and time.perf_counter() - inicio >= self.tempo_limite:
+                self._log(f"⏱️  Tempo limite atingido na iteração {iteracao}")
+                break
+
+        self.estado = {
+            'agenda_atual': agenda,
+            'fitness_atual': fitness_atual,
+            'historico_fitness': historico_fitness,
+            'melhor_global': melhor_global,
+            'melhor_fitness_global': melhor_fitness_global,
+            'geracao': iteracao_inicial + len(historico_fitness) - tamanho_historico_inicial,
+            'total_avaliacoes': self.total_avaliacoes,
+            'bandit': bandit,
+            'convergiu': convergiu
+        }
+
+        self._log(f"✅ LNS finalizado. Melhor fitness: {melhor_fitness_global:.0f} "
+                  f"({self.reparos_exatos} reparos exatos)")
+        if bandit is not None:
+            self.estatisticas_operadores = {'destruicao': bandit.estatisticas()}
+            self._log(f"🎰 Crédito dos operadores de destruição ({self.selecao_operadores}):")
+            exibir_estatisticas(self.estatisticas_operadores, self._log)
+        # O checkpoint guarda melhor_global (retomar, importar_solucao): quem chama recebe uma cópia
+        return melhor_global.copy(), melhor_fitness_global, historico_fitness
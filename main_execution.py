@@ -12,7 +12,7 @@ try:
         salvar_horario_excel
     )
     from parameter_optimization import (
-        executar_teste_rapido,
+        executar_teste_rapido_v1 as executar_teste_rapido,
         testar_config_especifica
     )
 except ImportError as e:
@@ -182,6 +182,126 @@ def executar_v2_pontuacao():
         print(f"❌ Erro durante execução V2: {e}")
         return None
 
+def executar_lns():
+    """Executa o LNS (destruir e reparar) sobre o modelo da V2"""
+    print("\n" + "="*60)
+    print("🔨 EXECUTANDO LNS - DESTRUIR E REPARAR (MODELO V2)")
+    print("="*60)
+    
+    try:
+        from large_neighborhood_search import ScheduleLNS
+        from utils_v2 import salvar_agenda_excel, gerar_relatorio_agenda_v2
+        
+        lns = ScheduleLNS()
+        lns.geracoes = 300
+        lns.tempo_limite = 60
+        
+        print("Parâmetros:")
+        print(f"  • Iterações: {lns.geracoes}")
+        print(f"  • Tempo limite: {lns.tempo_limite}s")
+        print(f"  • Destruição: {', '.join(lns.OPERADORES_DESTRUICAO)} ({lns.selecao_operadores})")
+        
+        inicio = time.time()
+        melhor_agenda, fitness, historico = lns.executar()
+        tempo_total = time.time() - inicio
+        
+        print(f"\n⏱️  Tempo total: {tempo_total:.2f} segundos")
+        print(f"🎯 Fitness final: {fitness:.0f} pontos")
+        
+        lns.exibir_agenda(melhor_agenda)
+        
+        if not os.path.exists('resultados'):
+            os.makedirs('resultados')
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        caminho_salvo = salvar_agenda_excel(melhor_agenda, lns, f"lns_{timestamp}.xlsx")
+        
+        print("\n📊 Gerando relatório detalhado...")
+        metricas = gerar_relatorio_agenda_v2(melhor_agenda, fitness, historico, lns)
+        
+        print(f"💾 Resultado LNS salvo em: {caminho_salvo}")
+        print(f"📈 Score de qualidade: {metricas['score_geral']:.1%}")
+        
+        return melhor_agenda, fitness, historico, lns
+        
+    except Exception as e:
+        print(f"❌ Erro durante execução do LNS: {e}")
+        return None
+
+def executar_portfolio_paralelo():
+    """Executa todos os motores em paralelo e fica com o melhor"""
+    print("\n" + "="*60)
+    print("🏁 EXECUTANDO PORTFÓLIO PARALELO (V1, V2, V2P, SA, LNS)")
+    print("="*60)
+    
+    try:
+        from portfolio_runner import executar_portfolio, exibir_telemetria
+        from benchmark_harness import ENGINES
+        
+        resultado = executar_portfolio(tempo_limite=60)
+        if resultado.solucao is None:
+            return None
+        
+        print("\n📊 Telemetria por motor:")
+        exibir_telemetria(resultado)
+        
+        engine = ENGINES[resultado.versao]()
+        engine.verbose = False
+        engine.carregar_dados()
+        
+        if not os.path.exists('resultados'):
+            os.makedirs('resultados')
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"portfolio_{resultado.vencedor}_{timestamp}.xlsx"
+        if resultado.versao == 'V1':
+            from visualization_script import salvar_horario_excel
+            engine.exibir_horario(resultado.solucao)
+            caminho_salvo = salvar_horario_excel(resultado.solucao, engine, filename)
+        else:
+            from utils_v2 import salvar_agenda_excel
+            engine.exibir_agenda(resultado.solucao)
+            caminho_salvo = salvar_agenda_excel(resultado.solucao, engine, filename)
+        
+        print(f"💾 Resultado do vencedor ({resultado.vencedor}) salvo em: {caminho_salvo}")
+        return resultado
+        
+    except Exception as e:
+        print(f"❌ Erro durante o portfólio: {e}")
+        return None
+
+def executar_fronteira_pareto():
+    """Executa o NSGA-II e exporta a fronteira de Pareto para escolha da coordenação"""
+    print("\n" + "="*60)
+    print("🎯 EXECUTANDO NSGA-II - FRONTEIRA DE PARETO (MODELO V2)")
+    print("="*60)
+    
+    try:
+        from nsga2_scheduler import ScheduleNSGA2, exportar_fronteira
+        
+        nsga = ScheduleNSGA2()
+        nsga.geracoes = 100
+        
+        print("Objetivos:")
+        for nome, componentes in nsga.objetivos.items():
+            print(f"  • {nome}: {', '.join(componentes)}")
+        
+        inicio = time.time()
+        nsga.executar()
+        tempo_total = time.time() - inicio
+        
+        print(f"\n⏱️  Tempo total: {tempo_total:.2f} segundos")
+        print(nsga.fronteira.tabela().to_string(index=False))
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        caminho_salvo = exportar_fronteira(nsga.fronteira, nsga, f"pareto_{timestamp}.xlsx")
+        
+        return nsga.fronteira, caminho_salvo
+        
+    except Exception as e:
+        print(f"❌ Erro durante o NSGA-II: {e}")
+        return None
+
 def executar_comparacao():
     """Executa comparação entre V1 e V2"""
     print("\n" + "="*60)
@@ -257,11 +377,14 @@ def menu_principal():
         print("5. Análise completa com visualizações (V1)")
         print("6. Análise completa com visualizações (V2)")
         print("7. Análise detalhada de agenda (V2)")
+        print("8. LNS - Destruir e reparar (modelo V2)")
+        print("9. Portfólio paralelo (todos os motores)")
+        print("10. Fronteira de Pareto (NSGA-II multiobjetivo)")
         print()
         print("0. Sair")
         
         try:
-            opcao = input("\nEscolha uma opção (0-7): ").strip()
+            opcao = input("\nEscolha uma opção (0-10): ").strip()
             
             if opcao == "1":
                 resultado = executar_v1_penalizacao()
@@ -333,6 +456,21 @@ def menu_principal():
                 except Exception as e:
                     print(f"❌ Erro durante análise V2: {e}")
                 
+            elif opcao == "8":
+                resultado = executar_lns()
+                if resultado:
+                    print("\n✅ LNS executado com sucesso!")
+                
+            elif opcao == "9":
+                resultado = executar_portfolio_paralelo()
+                if resultado:
+                    print("\n✅ Portfólio executado com sucesso!")
+                
+            elif opcao == "10":
+                resultado = executar_fronteira_pareto()
+                if resultado:
+                    print("\n✅ Fronteira de Pareto gerada com sucesso!")
+                
             elif opcao == "0":
                 print("\n👋 Obrigado por usar o sistema!")
                 break
@@ -0,0 +1,224 @@
+import copy
+import os
+import time
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+from execution_events import criar_registro_geracao, emitir_evento
+from genetic_scheduler_v2 import ScheduleGA_V2, COMPONENTES_FITNESS
+from hard_constraints import contar_violacoes
+from population_diversity import hash_genomas
+from pareto_ranking import ranks_pareto, distancia_aglomeracao
+from utils_v2 import criar_planilha_grade_visual
+
+# Objetivos padrão (todos maximizados): nome -> componentes de COMPONENTES_FITNESS somados
+OBJETIVOS_PADRAO = {
+    'professor': ('professor_satisfeito',),                                  # Dias concentrados
+    'janelas': ('sem_janelas',),                                             # Sem janelas para os alunos
+    'espalhamento': ('distribuicao_equilibrada', 'distribuicao_inteligente')  # Semana equilibrada
+}
+
+@dataclass
+class FronteiraPareto:
+    """Soluções não dominadas distintas (uma por vetor de objetivos)"""
+    nomes_objetivos: Tuple[str, ...]
+    objetivos: np.ndarray        # Soluções x objetivos
+    componentes: np.ndarray      # Soluções x COMPONENTES_FITNESS
+    violacoes: np.ndarray        # Restrições rígidas violadas por solução
+    agendas: List[np.ndarray]
+
+    @property
+    def fitness(self) -> np.ndarray:
+        """Fitness escalar (soma ponderada da V2) de cada solução"""
+        return self.componentes.sum(axis=1)
+
+    def tabela(self) -> pd.DataFrame:
+        """Uma linha por solução: objetivos, violações e fitness escalar"""
+        tabela = pd.DataFrame(self.objetivos, columns=self.nomes_objetivos)
+        tabela.insert(0, 'solucao', np.arange(1, len(self.agendas) + 1))
+        tabela['violacoes'] = self.violacoes
+        tabela['fitness'] = self.fitness
+        return tabela
+
+def matriz_agregacao(objetivos: Dict[str, Tuple[str, ...]]) -> np.ndarray:
+    """Matriz 0/1 (COMPONENTES_FITNESS x objetivos): componentes @ agregação = objetivos"""
+    if not objetivos:
+        raise ValueError("Defina ao menos um objetivo")
+    agregacao = np.zeros((len(COMPONENTES_FITNESS), len(objetivos)))
+    for j, (nome, componentes) in enumerate(objetivos.items()):
+        for componente in componentes:
+            if componente not in COMPONENTES_FITNESS:
+                raise ValueError(f"Componente desconhecido no objetivo '{nome}': {componente} "
+                                 f"(válidos: {list(COMPONENTES_FITNESS)})")
+            agregacao[COMPONENTES_FITNESS.index(componente), j] = 1.0
+    return agregacao
+
+class ScheduleNSGA2(ScheduleGA_V2):
+    """
+    NSGA-II sobre o genoma e os operadores da V2
+    - Objetivos: grupos de componentes do fitness (objetivos), sem soma ponderada
+    - Restrições rígidas (aula sem disponibilidade, carga diferente da exigida)
+      entram na dominância: menos violações sempre domina
+    - Seleção por torneio binário (rank, crowding) e sobrevivência (μ + λ);
+      genomas repetidos só completam a população
+    - executar() segue o contrato dos motores; a fronteira fica em self.fronteira
+    """
+
+    versao = 'NSGA2'
+
+    def __init__(self):
+        super().__init__()
+        self.objetivos = dict(OBJETIVOS_PADRAO)
+        self.fronteira = None
+
+    def _avaliar_objetivos(self, populacao: list) -> Tuple[np.ndarray, np.ndarray]:
+        """Matriz de componentes e violações de cada indivíduo"""
+        self.total_avaliacoes += len(populacao)
+        componentes = self.matriz_componentes(populacao)
+        violacoes = np.array([contar_violacoes(self, self.decodificar(ind)) for ind in populacao])
+        return componentes, violacoes
+
+    def _torneio_binario(self, ranks: np.ndarray, aglomeracao: np.ndarray, n: int) -> np.ndarray:
+        """n vencedores de torneios binários: menor rank, depois maior crowding"""
+        a = np.random.randint(len(ranks), size=n)
+        b = np.random.randint(len(ranks), size=n)
+        a_vence = (ranks[a] < ranks[b]) | ((ranks[a] == ranks[b]) & (aglomeracao[a] >= aglomeracao[b]))
+        return np.where(a_vence, a, b)
+
+    def _sobreviventes(self, populacao: list, objetivos: np.ndarray, violacoes: np.ndarray,
+                       n: int) -> np.ndarray:
+        """Índices dos n melhores por (rank, -crowding); repetições vão para o fim"""
+        hashes = hash_genomas(self._matriz_genomas(populacao))
+        _, primeiros = np.unique(hashes, return_index=True)
+        ranks = ranks_pareto(objetivos, violacoes)
+        repetido = np.ones(len(populacao), dtype=bool)
+        repetido[primeiros] = False
+        ranks[repetido] = ranks.max() + 1
+        aglomeracao = distancia_aglomeracao(objetivos, ranks)
+        return np.lexsort((-aglomeracao, ranks))[:n]
+
+    def _montar_fronteira(self, populacao: list, componentes: np.ndarray, violacoes: np.ndarray,
+                          agregacao: np.ndarray) -> FronteiraPareto:
+        """Fronteira (rank 0) da população, um representante por vetor de objetivos"""
+        objetivos = componentes @ agregacao
+        indices = np.flatnonzero(ranks_pareto(objetivos, violacoes) == 0)
+        _, unicos = np.unique(objetivos[indices], axis=0, return_index=True)
+        indices = indices[np.sort(unicos)]
+        indices = indices[np.argsort(-objetivos[indices, 0], kind='stable')]
+        return FronteiraPareto(
+            nomes_objetivos=tuple(self.objetivos),
+            objetivos=objetivos[indices],
+            componentes=componentes[indices],
+            violacoes=violacoes[indices],
+            agendas=[copy.deepcopy(self.decodificar(populacao[i])) for i in indices]
+        )
+
+    def executar(self, callbacks=None, retomar=False) -> Tuple[np.ndarray, float, List[float]]:
+        """
+        Executa o NSGA-II
+        - Retorna a solução da fronteira com maior fitness escalar (contrato dos motores)
+          e o histórico desse fitness por geração
+        - retomar: continua de self.estado por mais self.geracoes gerações
+        """
+        if not self.dados_carregados:
+            self._log("📚 Carregando dados...")
+            self.carregar_dados()
+
+        agregacao = matriz_agregacao(self.objetivos)
+        if retomar and self.estado is not None:
+            populacao = self.estado['populacao']
+            historico_fitness = list(self.estado['historico_fitness'])
+            geracao_inicial = self.estado['geracao']
+            self.total_avaliacoes = self.estado['total_avaliacoes']
+        else:
+            if self.verificacao_previa:
+                self._verificar_viabilidade()
+            self._log("🧬 Inicializando população...")
+            populacao = self.inicializar_populacao()
+            historico_fitness = []
+            geracao_inicial = 0
+            self.total_avaliacoes = 0
+
+        self._bandits = None
+        componentes, violacoes = self._avaliar_objetivos(populacao)
+        tamanho = len(populacao)
+
+        self._log(f"🚀 Iniciando NSGA-II com {len(self.objetivos)} objetivos: {', '.join(self.objetivos)}")
+        for geracao in range(geracao_inicial, geracao_inicial + self.geracoes):
+            inicio_avaliacao = time.perf_counter()
+            objetivos = componentes @ agregacao
+            ranks = ranks_pareto(objetivos, violacoes)
+            aglomeracao = distancia_aglomeracao(objetivos, ranks)
+
+            pais = self._torneio_binario(ranks, aglomeracao, tamanho + tamanho % 2)
+            filhos = []
+            for i, j in zip(pais[::2], pais[1::2]):
+                for filho, _ in self._gerar_filhos(copy.deepcopy(populacao[i]), copy.deepcopy(populacao[j])):
+                    filhos.append(filho)
+            filhos = filhos[:tamanho]
+            componentes_filhos, violacoes_filhos = self._avaliar_objetivos(filhos)
+
+            uniao = populacao + filhos
+            componentes = np.vstack([componentes, componentes_filhos])
+            violacoes = np.concatenate([violacoes, violacoes_filhos])
+            escolhidos = self._sobreviventes(uniao, componentes @ agregacao, violacoes, tamanho)
+            populacao = [uniao[i] for i in escolhidos]
+            componentes, violacoes = componentes[escolhidos], violacoes[escolhidos]
+            tempo_avaliacao = time.perf_counter() - inicio_avaliacao
+
+            fitness_scores = componentes.sum(axis=1)
+            historico_fitness.append(float(fitness_scores[violacoes == violacoes.min()].max()))
+
+            if callbacks:
+                emitir_evento(callbacks, criar_registro_geracao(
+                    self.versao, geracao, fitness_scores.tolist(), self.total_avaliacoes, tempo_avaliacao,
+                    None, self.taxa_mutacao, self.taxa_crossover
+                ))
+
+            if geracao % self.intervalo_log == 0:
+                frente = int((ranks_pareto(componentes @ agregacao, violacoes) == 0).sum())
+                self._log(f"Geração {geracao}: fronteira com {frente} indivíduos, "
+                          f"melhor fitness = {historico_fitness[-1]:.0f}")
+
+        self.fronteira = self._montar_fronteira(populacao, componentes, violacoes, agregacao)
+        melhor = int(np.argmax(self.fronteira.fitness))
+        melhor_global = self.fronteira.agendas[melhor]
+        melhor_fitness_global = float(self.fronteira.fitness[melhor])
+
+        self.estado = {
+            'populacao': populacao,
+            'historico_fitness': historico_fitness,
+            'melhor_global': melhor_global,
+            'melhor_fitness_global': melhor_fitness_global,
+            'geracao': geracao_inicial + self.geracoes,
+            'total_avaliacoes': self.total_avaliacoes,
+            'fitness_scores': None,
+            'convergiu': False,
+            'componentes': componentes,
+            'avaliados': populacao,
+            'pesos': dict(self.pesos)
+        }
+
+        self._log(f"✅ NSGA-II finalizado: {len(self.fronteira.agendas)} soluções na fronteira "
+                  f"(melhor fitness escalar: {melhor_fitness_global:.0f})")
+        return melhor_global, melhor_fitness_global, historico_fitness
+
+def exportar_fronteira(fronteira: FronteiraPareto, ga: ScheduleGA_V2,
+                       filename: str = 'fronteira_pareto.xlsx') -> str:
+    """
+    Salva a fronteira em resultados/: planilha 'Fronteira' com os objetivos de cada
+    solução e uma grade visual por solução ('Solucao_1', 'Solucao_2', ...)
+    Para o Excel completo de uma solução: utils_v2.salvar_agenda_excel(fronteira.agendas[i], ga)
+    """
+    pasta_resultados = 'resultados'
+    if not os.path.exists(pasta_resultados):
+        os.makedirs(pasta_resultados)
+    caminho_arquivo = os.path.join(pasta_resultados, filename)
+
+    with pd.ExcelWriter(caminho_arquivo, engine='openpyxl') as writer:
+        fronteira.tabela().to_excel(writer, sheet_name='Fronteira', index=False)
+        for i, agenda in enumerate(fronteira.agendas, start=1):
+            criar_planilha_grade_visual(writer, agenda, ga, nome_planilha=f'Solucao_{i}')
+    print(f"💾 Fronteira de Pareto ({len(fronteira.agendas)} soluções) salva em: {caminho_arquivo}")
+    return caminho_arquivo
@@ -0,0 +1,141 @@
+import math
+import random
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+@dataclass
+class EstatisticaOperador:
+    """Crédito acumulado de um operador"""
+    nome: str
+    usos: int = 0
+    sucessos: int = 0             # Filhos melhores que o melhor pai
+    melhoria_total: float = 0.0   # Soma das melhorias sobre o melhor pai
+    tempo_cpu: float = 0.0        # Segundos de CPU (operador + avaliação do filho)
+    qualidade: float = 0.0        # Média móvel da melhoria por segundo de CPU
+    probabilidade: float = 0.0    # Fração de sorteios na última escolha
+
+    @property
+    def melhoria_por_segundo(self) -> float:
+        return self.melhoria_total / self.tempo_cpu if self.tempo_cpu > 0 else 0.0
+
+class SelecaoOperadores:
+    """
+    Bandit que escolhe entre operadores pela melhoria de fitness por segundo de CPU
+    - 'ucb': qualidade normalizada + bônus de exploração c * sqrt(2 ln N / n)
+    - 'probabilidade': probability matching com probabilidade mínima por operador
+    A qualidade é uma média móvel exponencial (taxa_aprendizado), então o mix
+    acompanha a fase da busca
+    """
+
+    ESTRATEGIAS = ('ucb', 'probabilidade')
+
+    def __init__(self, nomes: List[str], estrategia: str = 'ucb', exploracao: float = 0.5,
+                 probabilidade_minima: float = 0.05, taxa_aprendizado: float = 0.3):
+        if estrategia not in self.ESTRATEGIAS:
+            raise ValueError(f"Estratégia de seleção desconhecida: {estrategia} "
+                             f"(use uma de {self.ESTRATEGIAS})")
+        if not nomes:
+            raise ValueError("Nenhum operador registrado")
+        if probabilidade_minima * len(nomes) > 1:
+            raise ValueError(f"probabilidade_minima {probabilidade_minima} grande demais "
+                             f"para {len(nomes)} operadores")
+        self.estrategia = estrategia
+        self.exploracao = exploracao
+        self.probabilidade_minima = probabilidade_minima
+        self.taxa_aprendizado = taxa_aprendizado
+        self.operadores = {nome: EstatisticaOperador(nome) for nome in nomes}
+        self.total_usos = 0
+
+    def probabilidades(self) -> Dict[str, float]:
+        """Probabilidade de sorteio de cada operador (probability matching)"""
+        qualidades = {nome: op.qualidade for nome, op in self.operadores.items()}
+        soma = sum(qualidades.values())
+        k = len(qualidades)
+        if soma <= 0:
+            return {nome: 1 / k for nome in qualidades}
+        livre = 1 - k * self.probabilidade_minima
+        return {nome: self.probabilidade_minima + livre * q / soma for nome, q in qualidades.items()}
+
+    def escolher(self) -> str:
+        """Sorteia o próximo operador"""
+        nao_usados = [nome for nome, op in self.operadores.items() if op.usos == 0]
+        if nao_usados:
+            return random.choice(nao_usados)
+
+        if self.estrategia == 'probabilidade':
+            probabilidades = self.probabilidades()
+            return random.choices(list(probabilidades), weights=list(probabilidades.values()))[0]
+
+        maxima = max(op.qualidade for op in self.operadores.values())
+        escala = maxima if maxima > 0 else 1.0
+        log_total = math.log(max(self.total_usos, 1))
+
+        def pontuacao(op: EstatisticaOperador) -> float:
+            return op.qualidade / escala + self.exploracao * math.sqrt(2 * log_total / op.usos)
+
+        return max(self.operadores.values(), key=pontuacao).nome
+
+    def creditar(self, nome: str, melhoria: float, tempo_cpu: float):
+        """Registra o resultado de uma aplicação (melhoria negativa conta como zero)"""
+        op = self.operadores[nome]
+        melhoria = max(0.0, float(melhoria))
+        tempo_cpu = max(float(tempo_cpu), 1e-6)
+        op.usos += 1
+        op.sucessos += melhoria > 0
+        op.melhoria_total += melhoria
+        op.tempo_cpu += tempo_cpu
+        op.qualidade += self.taxa_aprendizado * (melhoria / tempo_cpu - op.qualidade)
+        self.total_usos += 1
+
+    def estatisticas(self) -> Dict[str, Dict]:
+        """Crédito de cada operador (inclui melhoria por segundo e probabilidade atual)"""
+        probabilidades = self.probabilidades() if self.estrategia == 'probabilidade' else {
+            nome: op.usos / max(self.total_usos, 1) for nome, op in self.operadores.items()
+        }
+        estatisticas = {}
+        for nome, op in self.operadores.items():
+            op.probabilidade = probabilidades[nome]
+            estatisticas[nome] = dict(asdict(op), melhoria_por_segundo=op.melhoria_por_segundo)
+        return estatisticas
+
+# Origem de um filho: (crossover, mutação, CPU do crossover, CPU da mutação)
+Origem = Tuple[str, str, float, float]
+
+def gerar_filhos(bandits: Dict[str, SelecaoOperadores], crossovers: Dict[str, Callable],
+                 mutacoes: Dict[str, Callable], pai1, pai2) -> List[Tuple[object, Origem]]:
+    """
+    Aplica um crossover e uma mutação escolhidos pelos bandits a um par de pais
+    Retorna [(filho, origem)]; o CPU do crossover é dividido entre os filhos
+    """
+    nome_crossover = bandits['crossover'].escolher()
+    inicio = time.process_time()
+    filhos = crossovers[nome_crossover](pai1, pai2)
+    tempo_crossover = (time.process_time() - inicio) / len(filhos)
+
+    resultado = []
+    for filho in filhos:
+        nome_mutacao = bandits['mutacao'].escolher()
+        inicio = time.process_time()
+        filho = mutacoes[nome_mutacao](filho)
+        resultado.append((filho, (nome_crossover, nome_mutacao, tempo_crossover,
+                                  time.process_time() - inicio)))
+    return resultado
+
+def creditar_filho(bandits: Dict[str, SelecaoOperadores], origem: Optional[Origem],
+                   melhoria: float, tempo_avaliacao: float):
+    """Credita a melhoria do filho ao crossover e à mutação que o geraram"""
+    if origem is None:
+        return
+    nome_crossover, nome_mutacao, tempo_crossover, tempo_mutacao = origem
+    bandits['crossover'].creditar(nome_crossover, melhoria, tempo_crossover + tempo_avaliacao)
+    bandits['mutacao'].creditar(nome_mutacao, melhoria, tempo_mutacao + tempo_avaliacao)
+
+def exibir_estatisticas(estatisticas: Dict[str, Dict[str, Dict]], log: Callable[[str], None] = print):
+    """Tabela de crédito dos operadores ({'crossover': {...}, 'mutacao': {...}})"""
+    log(f"{'Tipo':<10} {'Operador':<16} {'Usos':>6} {'Sucessos':>9} {'Melhoria':>10} "
+        f"{'CPU (s)':>8} {'Melhoria/s':>11} {'Prob':>6}")
+    for tipo, operadores in estatisticas.items():
+        for nome, op in operadores.items():
+            log(f"{tipo:<10} {nome:<16} {op['usos']:>6} {op['sucessos']:>9} {op['melhoria_total']:>10.1f} "
+                f"{op['tempo_cpu']:>8.3f} {op['melhoria_por_segundo']:>11.1f} {op['probabilidade']:>6.2f}")
@@ -1,29 +1,44 @@
 import itertools
+import json
+import random
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import os
-from genetic_scheduler import ScheduleGA  # V1
-from genetic_scheduler_v2 import ScheduleGA_V2  # V2
-import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from benchmark_harness import (ENGINES, FITNESS_MAX_ESPERADO, inicializar_worker,
+                               executar_benchmark, avancar_configuracao, agregar_execucoes)
+from tpe_search import (ESPACO_TPE_PADRAO, amostrar_uniforme, sugerir_tpe,
+                        ordenar_multiobjetivo)
+from feasibility_check import verificar_viabilidade
+
+def _chave_execucao(config, max_geracoes, seed):
+    """Identificador de uma célula da varredura (usado para retomar execuções)"""
+    pop_size, mut_rate, cross_rate, tournament_size = config
+    return (int(pop_size), float(mut_rate), float(cross_rate), int(tournament_size),
+            int(max_geracoes), int(seed))
 
 class ParameterOptimizer:
-    """Classe para otimizar parâmetros dos algoritmos genéticos V1 e V2"""
+    """
+    Classe para otimizar parâmetros dos motores registrados em benchmark_harness
+    (V1, V2 ou qualquer motor que siga o protocolo Engine)
+    """
     
-    def __init__(self, versao="V1"):
+    def __init__(self, versao="V1", verificar_dados=True):
         self.versao = versao
         self.resultados = []
         
+        # Verificação prévia dos dados antes de qualquer varredura
+        self.verificar_dados = verificar_dados
+        self.relatorio_viabilidade = None
+        
         print(f"🔧 Inicializando otimizador para {versao}")
         
-        if versao == "V1":
-            self.classe_ag = ScheduleGA
-            self.fitness_max_esperado = 10000
-        elif versao == "V2":
-            self.classe_ag = ScheduleGA_V2
-            self.fitness_max_esperado = 15000  # Pontuação máxima estimada
-        else:
-            raise ValueError("Versão deve ser 'V1' ou 'V2'")
+        if versao not in ENGINES:
+            raise ValueError(f"Versão deve ser uma de {list(ENGINES.keys())}")
+        
+        self.classe_ag = ENGINES[versao]
+        self.fitness_max_esperado = FITNESS_MAX_ESPERADO[versao]
     
     def testar_parametros(self, 
                          populacao_sizes=[30, 50, 100],
@@ -31,75 +46,391 @@ class ParameterOptimizer:
                          taxas_crossover=[0.6, 0.8, 0.9],
                          tamanhos_torneio=[3, 5, 7],
                          max_geracoes=200,
-                         execucoes_por_config=3):
+                         execucoes_por_config=3,
+                         n_processos=1,
+                         arquivo_resultados=None,
+                         semente_base=0):
         """
         Testa diferentes combinações de parâmetros para a versão especificada
+        - n_processos > 1 distribui as execuções em um pool de processos
+          (cada processo carrega os dados do problema uma única vez)
+        - arquivo_resultados (.jsonl) recebe cada execução assim que termina;
+          ao reiniciar, as células (config, semente) já gravadas são puladas
         """
         
+        self._verificar_dados()
+        
         combinacoes = list(itertools.product(
             populacao_sizes, taxas_mutacao, taxas_crossover, tamanhos_torneio
         ))
         
         print(f"🔬 Testando {len(combinacoes)} combinações para {self.versao}")
         print(f"📊 {execucoes_por_config} execuções por combinação")
-        print(f"⏱️  Estimativa: ~{len(combinacoes) * execucoes_por_config * 0.5:.1f} minutos")
+        print(f"⏱️  Estimativa: ~{len(combinacoes) * execucoes_por_config * 0.5 / max(1, n_processos):.1f} minutos")
         print("="*60)
         
-        for i, (pop_size, mut_rate, cross_rate, tournament_size) in enumerate(combinacoes):
-            print(f"\n[{i+1}/{len(combinacoes)}] Testando {self.versao}: Pop={pop_size}, Mut={mut_rate}, Cross={cross_rate}, Tournament={tournament_size}")
-            
-            fitness_runs = []
-            tempos_runs = []
-            
+        # Execuções já concluídas em uma varredura anterior
+        concluidas = self._carregar_execucoes_concluidas(arquivo_resultados)
+        
+        tarefas = []
+        for config in combinacoes:
             for run in range(execucoes_por_config):
-                start_time = time.time()
-                
-                try:
-                    # Configurar AG com parâmetros específicos
-                    ga = self.classe_ag()
-                    ga.populacao_size = pop_size
-                    ga.taxa_mutacao = mut_rate
-                    ga.taxa_crossover = cross_rate
-                    ga.tamanho_torneio = tournament_size
-                    ga.geracoes = max_geracoes
-                    
-                    # Executar algoritmo
-                    if self.versao == "V1":
-                        _, fitness, historico = ga.executar()
-                    else:  # V2
-                        _, fitness, historico = ga.executar()
-                    
-                    tempo_execucao = time.time() - start_time
-                    
-                    fitness_runs.append(fitness)
-                    tempos_runs.append(tempo_execucao)
-                    
-                    print(f"    Run {run+1}: Fitness={fitness:.2f}, Tempo={tempo_execucao:.1f}s")
-                    
-                except Exception as e:
-                    print(f"    Run {run+1}: ERRO - {str(e)}")
-                    fitness_runs.append(0)
-                    tempos_runs.append(999)
-            
-            # Salvar resultados
-            resultado = {
-                'versao': self.versao,
-                'populacao_size': pop_size,
-                'taxa_mutacao': mut_rate,
-                'taxa_crossover': cross_rate,
-                'tamanho_torneio': tournament_size,
-                'fitness_medio': np.mean(fitness_runs),
-                'fitness_std': np.std(fitness_runs),
-                'fitness_max': np.max(fitness_runs),
-                'fitness_normalizado': np.mean(fitness_runs) / self.fitness_max_esperado,
-                'tempo_medio': np.mean(tempos_runs),
-                'tempo_std': np.std(tempos_runs)
-            }
+                seed = semente_base + run
+                if _chave_execucao(config, max_geracoes, seed) not in concluidas:
+                    tarefas.append((config, seed))
+        
+        total_execucoes = len(combinacoes) * execucoes_por_config
+        if total_execucoes > len(tarefas):
+            print(f"⏭️  {total_execucoes - len(tarefas)} execuções reaproveitadas de {arquivo_resultados}")
+        
+        for i, execucao in enumerate(self._executar_tarefas(tarefas, max_geracoes, n_processos)):
+            config = (execucao['populacao_size'], execucao['taxa_mutacao'],
+                      execucao['taxa_crossover'], execucao['tamanho_torneio'])
+            concluidas[_chave_execucao(config, max_geracoes, execucao['seed'])] = execucao
+            self._registrar_execucao(arquivo_resultados, execucao)
             
+            if execucao['erro']:
+                print(f"    [{i+1}/{len(tarefas)}] Pop={config[0]}, Mut={config[1]}, Cross={config[2]}, "
+                      f"Tournament={config[3]}, Seed={execucao['seed']}: ERRO - {execucao['erro']}")
+            else:
+                print(f"    [{i+1}/{len(tarefas)}] Pop={config[0]}, Mut={config[1]}, Cross={config[2]}, "
+                      f"Tournament={config[3]}, Seed={execucao['seed']}: "
+                      f"Fitness={execucao['fitness']:.2f}, Tempo={execucao['tempo']:.1f}s")
+        
+        # Agregar as execuções de cada combinação
+        for pop_size, mut_rate, cross_rate, tournament_size in combinacoes:
+            config = (pop_size, mut_rate, cross_rate, tournament_size)
+            execucoes = [concluidas[_chave_execucao(config, max_geracoes, semente_base + run)]
+                         for run in range(execucoes_por_config)]
+            resultado = agregar_execucoes(self.versao, config, execucoes)
             self.resultados.append(resultado)
             
         return self.analisar_resultados()
     
+    def _verificar_dados(self):
+        """
+        Verificação prévia (contagem e emparelhamento) dos dados do problema
+        Roda uma vez por otimizador e aborta a varredura se os dados forem inviáveis
+        """
+        if not self.verificar_dados or self.relatorio_viabilidade is not None:
+            return
+        
+        engine = self.classe_ag()
+        engine.verbose = False
+        engine.carregar_dados()
+        
+        self.relatorio_viabilidade = verificar_viabilidade(engine)
+        self.relatorio_viabilidade.exibir()
+        if not self.relatorio_viabilidade.viavel:
+            raise ValueError(f"Dados inviáveis para {self.versao}: varredura cancelada")
+    
+    def _executar_tarefas(self, tarefas, max_geracoes, n_processos):
+        """Executa as células pendentes, em sequência ou em um pool de processos"""
+        if n_processos is None or n_processos <= 1:
+            for config, seed in tarefas:
+                yield executar_benchmark(self.versao, config, max_geracoes, seed)
+            return
+        
+        with ProcessPoolExecutor(max_workers=n_processos,
+                                 initializer=inicializar_worker,
+                                 initargs=(self.versao,)) as pool:
+            futuros = [pool.submit(executar_benchmark, self.versao, config, max_geracoes, seed)
+                       for config, seed in tarefas]
+            for futuro in as_completed(futuros):
+                yield futuro.result()
+    
+    def _carregar_execucoes_concluidas(self, arquivo_resultados):
+        """Lê o arquivo append-only e retorna as execuções bem-sucedidas por célula"""
+        concluidas = {}
+        if not arquivo_resultados or not os.path.exists(arquivo_resultados):
+            return concluidas
+        
+        with open(arquivo_resultados, encoding='utf-8') as f:
+            for linha in f:
+                linha = linha.strip()
+                if not linha:
+                    continue
+                try:
+                    execucao = json.loads(linha)
+                except json.JSONDecodeError:
+                    continue  # Linha truncada por uma interrupção
+                if execucao.get('versao') != self.versao or execucao.get('erro'):
+                    continue
+                config = (execucao['populacao_size'], execucao['taxa_mutacao'],
+                          execucao['taxa_crossover'], execucao['tamanho_torneio'])
+                concluidas[_chave_execucao(config, execucao['max_geracoes'], execucao['seed'])] = execucao
+        
+        return concluidas
+    
+    def _registrar_execucao(self, arquivo_resultados, execucao):
+        """Acrescenta uma execução concluída ao arquivo de resultados"""
+        if not arquivo_resultados:
+            return
+        pasta = os.path.dirname(arquivo_resultados)
+        if pasta and not os.path.exists(pasta):
+            os.makedirs(pasta)
+        with open(arquivo_resultados, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(execucao, ensure_ascii=False) + "\n")
+    
+    def corrida_sucessiva(self,
+                          n_configuracoes=810,
+                          geracoes_minimas=2,
+                          geracoes_maximas=200,
+                          eta=3,
+                          espaco=None,
+                          n_processos=1,
+                          semente=0):
+        """
+        Successive halving: executa muitas configurações por poucas gerações,
+        mantém a melhor fração (1/eta) e estende o orçamento das sobreviventes
+        - Cada rodada retoma o checkpoint da anterior (sem recomeçar do zero)
+        - Retorna a melhor configuração no mesmo formato de analisar_resultados
+        """
+        self._verificar_dados()
+        
+        rng = random.Random(semente)
+        configuracoes = self._amostrar_configuracoes(n_configuracoes, espaco, rng)
+        
+        print(f"🏁 Successive halving para {self.versao}: {len(configuracoes)} configurações, "
+              f"{geracoes_minimas}→{geracoes_maximas} gerações, eta={eta}")
+        print("="*60)
+        
+        linhas, orcamento = self._executar_halving(configuracoes, geracoes_minimas, geracoes_maximas,
+                                                   eta, n_processos, semente)
+        self.resultados.extend(linhas)
+        self._resumir_orcamento_corrida(len(configuracoes), orcamento, geracoes_maximas)
+        
+        return self.analisar_resultados()
+    
+    def hyperband(self,
+                  geracoes_minimas=2,
+                  geracoes_maximas=200,
+                  eta=3,
+                  espaco=None,
+                  n_processos=1,
+                  semente=0):
+        """
+        Hyperband: várias corridas de successive halving (brackets) que trocam
+        número de configurações por orçamento inicial de gerações
+        """
+        self._verificar_dados()
+        
+        rng = random.Random(semente)
+        s_max = int(np.floor(np.log(geracoes_maximas / geracoes_minimas) / np.log(eta) + 1e-9))
+        
+        print(f"🏁 Hyperband para {self.versao}: {s_max + 1} brackets, "
+              f"{geracoes_minimas}→{geracoes_maximas} gerações, eta={eta}")
+        print("="*60)
+        
+        total_configuracoes = 0
+        orcamento_total = 0
+        for s in range(s_max, -1, -1):
+            n = int(np.ceil((s_max + 1) / (s + 1) * eta ** s))
+            geracoes_iniciais = max(1, int(round(geracoes_maximas * eta ** (-s))))
+            
+            print(f"\n📦 Bracket s={s}: {n} configurações começando com {geracoes_iniciais} gerações")
+            configuracoes = self._amostrar_configuracoes(n, espaco, rng)
+            linhas, orcamento = self._executar_halving(configuracoes, geracoes_iniciais, geracoes_maximas,
+                                                       eta, n_processos, semente + total_configuracoes)
+            self.resultados.extend(linhas)
+            total_configuracoes += len(configuracoes)
+            orcamento_total += orcamento
+        
+        self._resumir_orcamento_corrida(total_configuracoes, orcamento_total, geracoes_maximas)
+        
+        return self.analisar_resultados()
+    
+    def _amostrar_configuracoes(self, n, espaco, rng):
+        """Sorteia n configurações distintas do espaço de busca (listas por parâmetro)"""
+        if espaco is None:
+            espaco = {
+                'populacao_size': [20, 30, 40, 50, 60, 80, 100],
+                'taxa_mutacao': [0.05, 0.075, 0.1, 0.125, 0.15, 0.175, 0.2, 0.225, 0.25],
+                'taxa_crossover': [0.6, 0.65, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95],
+                'tamanho_torneio': [2, 3, 4, 5, 6, 7]
+            }
+        
+        todas = list(itertools.product(
+            espaco['populacao_size'], espaco['taxa_mutacao'],
+            espaco['taxa_crossover'], espaco['tamanho_torneio']
+        ))
+        if n >= len(todas):
+            rng.shuffle(todas)
+            return todas
+        return rng.sample(todas, n)
+    
+    def _executar_halving(self, configuracoes, geracoes_minimas, geracoes_maximas, eta, n_processos, semente):
+        """Executa uma corrida de successive halving e retorna (linhas de resultado, gerações gastas)"""
+        vivos = [{'config': config, 'estado': None, 'geracoes': 0, 'fitness': 0.0,
+                  'tempo': 0.0, 'seed': semente + i}
+                 for i, config in enumerate(configuracoes)]
+        linhas = []
+        orcamento_gasto = 0
+        orcamento = geracoes_minimas
+        rodada = 0
+        
+        pool = ProcessPoolExecutor(max_workers=n_processos, initializer=inicializar_worker,
+                                   initargs=(self.versao,)) if n_processos and n_processos > 1 else None
+        try:
+            while vivos:
+                alvo = min(orcamento, geracoes_maximas)
+                pendentes = [c for c in vivos
+                             if c['geracoes'] < alvo and not (c['estado'] and c['estado']['convergiu'])]
+                
+                argumentos = [(self.versao, c['config'], c['estado'], alvo - c['geracoes'],
+                               c['seed'] + c['geracoes']) for c in pendentes]
+                if pool is not None:
+                    saidas = list(pool.map(avancar_configuracao, *zip(*argumentos))) if argumentos else []
+                else:
+                    saidas = [avancar_configuracao(*args) for args in argumentos]
+                
+                for c, (fitness, estado, tempo) in zip(pendentes, saidas):
+                    orcamento_gasto += alvo - c['geracoes']
+                    c['fitness'], c['estado'] = fitness, estado
+                    c['tempo'] += tempo
+                    c['geracoes'] = alvo
+                
+                vivos.sort(key=lambda c: c['fitness'], reverse=True)
+                print(f"   Rodada {rodada}: {len(vivos)} configurações com {alvo} gerações - "
+                      f"melhor fitness {vivos[0]['fitness']:.2f}")
+                
+                if alvo >= geracoes_maximas or len(vivos) == 1:
+                    eliminados, vivos = vivos, []
+                else:
+                    n_manter = max(1, len(vivos) // eta)
+                    eliminados, vivos = vivos[n_manter:], vivos[:n_manter]
+                
+                for c in eliminados:
+                    linhas.append(self._linha_resultado_corrida(c, rodada))
+                
+                orcamento *= eta
+                rodada += 1
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        
+        return linhas, orcamento_gasto
+    
+    def _linha_resultado_corrida(self, candidato, rodada):
+        """Converte um candidato da corrida para o formato de self.resultados"""
+        pop_size, mut_rate, cross_rate, tournament_size = candidato['config']
+        return {
+            'versao': self.versao,
+            'populacao_size': pop_size,
+            'taxa_mutacao': mut_rate,
+            'taxa_crossover': cross_rate,
+            'tamanho_torneio': tournament_size,
+            'fitness_medio': candidato['fitness'],
+            'fitness_std': 0.0,
+            'fitness_max': candidato['fitness'],
+            'fitness_normalizado': candidato['fitness'] / self.fitness_max_esperado,
+            'tempo_medio': candidato['tempo'],
+            'tempo_std': 0.0,
+            'geracoes_executadas': candidato['geracoes'],
+            'rodada_final': rodada
+        }
+    
+    def _resumir_orcamento_corrida(self, n_configuracoes, orcamento, geracoes_maximas):
+        """Compara o orçamento gasto com o de uma grade de mesmo custo"""
+        configs_grade = orcamento / (geracoes_maximas * 3)  # grade padrão: 3 execuções por config
+        print(f"\n💰 Orçamento: {orcamento} gerações para {n_configuracoes} configurações")
+        print(f"   • Com o mesmo orçamento a grade avaliaria ~{configs_grade:.0f} configurações "
+              f"({geracoes_maximas} gerações × 3 execuções)")
+    
+    def busca_bayesiana(self,
+                        n_trials=40,
+                        n_iniciais=10,
+                        n_paralelo=4,
+                        max_geracoes=200,
+                        execucoes_por_trial=1,
+                        peso_tempo=0.1,
+                        espaco=None,
+                        semente=0):
+        """
+        Busca por modelo (TPE) sobre parâmetros contínuos e inteiros
+        - Fase inicial com n_iniciais configurações aleatórias
+        - Depois, lotes de n_paralelo sugestões avaliadas em paralelo
+        - Multiobjetivo: rank de Pareto em (fitness ↑, tempo_medio ↓),
+          desempatado por fitness_normalizado - peso_tempo * tempo relativo
+        """
+        self._verificar_dados()
+        
+        espaco = espaco or ESPACO_TPE_PADRAO
+        rng = np.random.default_rng(semente)
+        
+        print(f"🧠 Busca bayesiana (TPE) para {self.versao}: {n_trials} trials, {n_paralelo} em paralelo")
+        print("="*60)
+        
+        observados = []
+        linhas = []
+        
+        pool = ProcessPoolExecutor(max_workers=n_paralelo, initializer=inicializar_worker,
+                                   initargs=(self.versao,)) if n_paralelo > 1 else None
+        try:
+            while len(observados) < n_trials:
+                tamanho_lote = min(n_paralelo, n_trials - len(observados))
+                if len(observados) < n_iniciais:
+                    lote = amostrar_uniforme(tamanho_lote, espaco, rng)
+                else:
+                    ordem, _, _ = ordenar_multiobjetivo(
+                        [l['fitness_normalizado'] for l in linhas],
+                        [l['tempo_medio'] for l in linhas], peso_tempo)
+                    lote = sugerir_tpe(observados, ordem, espaco, tamanho_lote, rng)
+                
+                for config, linha in zip(lote, self._avaliar_lote(lote, max_geracoes, execucoes_por_trial,
+                                                                   semente, pool)):
+                    observados.append(config)
+                    linhas.append(linha)
+                    print(f"   Trial {len(observados)}/{n_trials}: Pop={config['populacao_size']}, "
+                          f"Mut={config['taxa_mutacao']:.3f}, Cross={config['taxa_crossover']:.3f}, "
+                          f"Tournament={config['tamanho_torneio']} -> "
+                          f"Fitness={linha['fitness_medio']:.2f}, Tempo={linha['tempo_medio']:.1f}s")
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        
+        ordem, ranks, escores = ordenar_multiobjetivo(
+            [l['fitness_normalizado'] for l in linhas], [l['tempo_medio'] for l in linhas], peso_tempo)
+        for linha, rank, escore in zip(linhas, ranks, escores):
+            linha['pareto_rank'] = int(rank)
+            linha['escore_multiobjetivo'] = float(escore)
+        self.resultados.extend(linhas)
+        
+        df = pd.DataFrame([linhas[i] for i in ordem])
+        fronteira = df[df['pareto_rank'] == 0].sort_values('fitness_medio', ascending=False)
+        
+        print(f"\n🏆 FRONTEIRA DE PARETO (fitness × tempo) - {self.versao}:")
+        print("-" * 80)
+        print(f"{'Pop':<5} {'Mut':<7} {'Cross':<7} {'Tourn':<6} {'Fitness':<10} {'Tempo(s)':<10} {'Escore':<8}")
+        print("-" * 80)
+        for _, row in fronteira.iterrows():
+            print(f"{int(row['populacao_size']):<5} "
+                  f"{row['taxa_mutacao']:<7.3f} "
+                  f"{row['taxa_crossover']:<7.3f} "
+                  f"{int(row['tamanho_torneio']):<6} "
+                  f"{row['fitness_medio']:<10.2f} "
+                  f"{row['tempo_medio']:<10.1f} "
+                  f"{row['escore_multiobjetivo']:<8.3f}")
+        
+        return df.iloc[0].to_dict()
+    
+    def _avaliar_lote(self, lote, max_geracoes, execucoes, semente, pool):
+        """Avalia um lote de configurações (todas as execuções do lote em paralelo se houver pool)"""
+        tuplas = [(c['populacao_size'], c['taxa_mutacao'], c['taxa_crossover'], c['tamanho_torneio'])
+                  for c in lote]
+        argumentos = [(self.versao, tupla, max_geracoes, semente + run)
+                      for tupla in tuplas for run in range(execucoes)]
+        if pool is not None:
+            execucoes_feitas = list(pool.map(executar_benchmark, *zip(*argumentos)))
+        else:
+            execucoes_feitas = [executar_benchmark(*args) for args in argumentos]
+        
+        linhas = []
+        for i, tupla in enumerate(tuplas):
+            execucoes_config = execucoes_feitas[i * execucoes:(i + 1) * execucoes]
+            linhas.append(agregar_execucoes(self.versao, tupla, execucoes_config))
+        return linhas
+    
     def analisar_resultados(self):
         """Analisa os resultados dos testes"""
         
@@ -114,7 +445,7 @@ class ParameterOptimizer:
         
         print(f"\n🏆 TOP 5 CONFIGURAÇÕES PARA {self.versao}:")
         print("-" * 100)
-        print(f"{'Rank':<4} {'Pop':<5} {'Mut':<6} {'Cross':<7} {'Tourn':<6} {'Fitness':<10} {'±Std':<8} {'Norm':<8} {'Tempo(s)':<10}")
+        print(f"{'Rank':<4} {'Pop':<5} {'Mut':<6} {'Cross':<7} {'Tourn':<6} {'Fitness':<10} {'±Std':<8} {'Norm':<8} {'Tempo(s)':<10} {'Aval/s':<10}")
         print("-" * 100)
         
         for i, (idx, row) in enumerate(df_sorted.head().iterrows()):
@@ -126,7 +457,8 @@ class ParameterOptimizer:
                   f"{row['fitness_medio']:<10.2f} "
                   f"±{row['fitness_std']:<7.2f} "
                   f"{row['fitness_normalizado']:<8.3f} "
-                  f"{row['tempo_medio']:<10.1f}")
+                  f"{row['tempo_medio']:<10.1f} "
+                  f"{row.get('avaliacoes_por_segundo', 0.0):<10.0f}")
         
         # Análise por parâmetro
         self._analisar_por_parametro(df)
@@ -436,344 +768,9 @@ def executar_teste_rapido():
         print(f"❌ Erro durante otimização: {e}")
         return None
 
-def testar_config_especifica_v2(populacao_size=50, taxa_mutacao=0.15, 
-                               taxa_crossover=0.8, tamanho_torneio=3, runs=5):
-    """Testa uma configuração específica múltiplas vezes para V2"""
-    
-    print(f"🎯 Testando configuração específica V2:")
-    print(f"   Pop: {populacao_size}, Mut: {taxa_mutacao}, Cross: {taxa_crossover}, Tournament: {tamanho_torneio}")
-    
-    resultados = []
-    
-    for run in range(runs):
-        print(f"   Execução {run+1}/{runs}...")
-        
-        ga = ScheduleGA_V2()
-        ga.populacao_size = populacao_size
-        ga.taxa_mutacao = taxa_mutacao
-        ga.taxa_crossover = taxa_crossover
-        ga.tamanho_torneio = tamanho_torneio
-        
-        _, fitness, historico = ga.executar()
-        resultados.append(fitness)
-    
-    print(f"\n📊 Resultados V2:")
-    print(f"   • Fitness médio: {np.mean(resultados):.2f}")
-    print(f"   • Desvio padrão: {np.std(resultados):.2f}")
-    print(f"   • Melhor: {np.max(resultados):.2f}")
-    print(f"   • Pior: {np.min(resultados):.2f}")
-    print(f"   • Fitness normalizado: {np.mean(resultados)/15000:.3f}")
-    
-    return resultados
-
-# Execução principal
-if __name__ == "__main__":
-    print("🔧 OTIMIZADOR DE PARÂMETROS - V1 e V2")
-    print("="*60)
-    print("Opções disponíveis:")
-    print("1. Teste rápido V1 (5-10 minutos)")
-    print("2. Teste rápido V2 (5-10 minutos)")
-    print("3. Comparar V1 vs V2 (10-15 minutos)")
-    print("4. Testar configuração específica V1")
-    print("5. Testar configuração específica V2")
-    
-    opcao = input("\nEscolha uma opção (1-5): ")
-    
-    if opcao == "1":
-        melhor = executar_teste_rapido_v1()
-    elif opcao == "2":
-        melhor = executar_teste_rapido_v2()
-    elif opcao == "3":
-        v1_config, v2_config = comparar_parametros_v1_v2()
-    elif opcao == "4":
-        resultados = testar_config_especifica()
-    elif opcao == "5":
-        resultados = testar_config_especifica_v2()
-    else:
-        print("Opção inválida!")
-        
-    def testar_parametros(self, 
-                         populacao_sizes=[30, 50, 100],
-                         taxas_mutacao=[0.05, 0.1, 0.2],
-                         taxas_crossover=[0.6, 0.8, 0.9],
-                         tamanhos_torneio=[3, 5, 7],
-                         max_geracoes=200,
-                         execucoes_por_config=3):
-        """
-        Testa diferentes combinações de parâmetros
-        """
-        
-        combinacoes = list(itertools.product(
-            populacao_sizes, taxas_mutacao, taxas_crossover, tamanhos_torneio
-        ))
-        
-        print(f"🔬 Testando {len(combinacoes)} combinações de parâmetros")
-        print(f"📊 {execucoes_por_config} execuções por combinação")
-        print(f"⏱️  Estimativa: ~{len(combinacoes) * execucoes_por_config * 0.5:.1f} minutos")
-        print("="*60)
-        
-        for i, (pop_size, mut_rate, cross_rate, tournament_size) in enumerate(combinacoes):
-            print(f"\n[{i+1}/{len(combinacoes)}] Testando: Pop={pop_size}, Mut={mut_rate}, Cross={cross_rate}, Tournament={tournament_size}")
-            
-            fitness_runs = []
-            tempos_runs = []
-            
-            for run in range(execucoes_por_config):
-                start_time = time.time()
-                
-                # Configurar AG com parâmetros específicos
-                ga = ScheduleGA()
-                ga.populacao_size = pop_size
-                ga.taxa_mutacao = mut_rate
-                ga.taxa_crossover = cross_rate
-                ga.tamanho_torneio = tournament_size
-                ga.geracoes = max_geracoes
-                
-                try:
-                    _, fitness, historico = ga.executar()
-                    tempo_execucao = time.time() - start_time
-                    
-                    fitness_runs.append(fitness)
-                    tempos_runs.append(tempo_execucao)
-                    
-                    print(f"    Run {run+1}: Fitness={fitness:.2f}, Tempo={tempo_execucao:.1f}s")
-                    
-                except Exception as e:
-                    print(f"    Run {run+1}: ERRO - {str(e)}")
-                    fitness_runs.append(0)
-                    tempos_runs.append(999)
-            
-            # Salvar resultados
-            resultado = {
-                'populacao_size': pop_size,
-                'taxa_mutacao': mut_rate,
-                'taxa_crossover': cross_rate,
-                'tamanho_torneio': tournament_size,
-                'fitness_medio': np.mean(fitness_runs),
-                'fitness_std': np.std(fitness_runs),
-                'fitness_max': np.max(fitness_runs),
-                'tempo_medio': np.mean(tempos_runs),
-                'tempo_std': np.std(tempos_runs)
-            }
-            
-            self.resultados.append(resultado)
-            
-        return self.analisar_resultados()
-    
-    def analisar_resultados(self):
-        """Analisa os resultados dos testes"""
-        
-        df = pd.DataFrame(self.resultados)
-        
-        print("\n" + "="*80)
-        print("📊 ANÁLISE DOS RESULTADOS")
-        print("="*80)
-        
-        # Top 5 configurações
-        df_sorted = df.sort_values('fitness_medio', ascending=False)
-        
-        print("\n🏆 TOP 5 CONFIGURAÇÕES:")
-        print("-" * 100)
-        print(f"{'Rank':<4} {'Pop':<5} {'Mut':<6} {'Cross':<7} {'Tourn':<6} {'Fitness':<10} {'±Std':<8} {'Tempo(s)':<10}")
-        print("-" * 100)
-        
-        for i, row in df_sorted.head().iterrows():
-            print(f"{df_sorted.index.get_loc(i)+1:<4} "
-                  f"{int(row['populacao_size']):<5} "
-                  f"{row['taxa_mutacao']:<6.2f} "
-                  f"{row['taxa_crossover']:<7.2f} "
-                  f"{int(row['tamanho_torneio']):<6} "
-                  f"{row['fitness_medio']:<10.2f} "
-                  f"±{row['fitness_std']:<7.2f} "
-                  f"{row['tempo_medio']:<10.1f}")
-        
-        # Análise por parâmetro
-        self._analisar_por_parametro(df)
-        
-        # Plotar resultados
-        self._plotar_analise(df)
-        
-        return df_sorted.iloc[0].to_dict()
-    
-    def _analisar_por_parametro(self, df):
-        """Analisa o impacto individual de cada parâmetro"""
-        
-        print("\n📈 IMPACTO DOS PARÂMETROS:")
-        print("-" * 50)
-        
-        # Tamanho da população
-        pop_impact = df.groupby('populacao_size')['fitness_medio'].agg(['mean', 'std'])
-        print(f"\nTamanho da População:")
-        for pop_size, stats in pop_impact.iterrows():
-            print(f"  {pop_size:3d}: {stats['mean']:.2f} (±{stats['std']:.2f})")
-        
-        # Taxa de mutação
-        mut_impact = df.groupby('taxa_mutacao')['fitness_medio'].agg(['mean', 'std'])
-        print(f"\nTaxa de Mutação:")
-        for mut_rate, stats in mut_impact.iterrows():
-            print(f"  {mut_rate:.2f}: {stats['mean']:.2f} (±{stats['std']:.2f})")
-        
-        # Taxa de crossover
-        cross_impact = df.groupby('taxa_crossover')['fitness_medio'].agg(['mean', 'std'])
-        print(f"\nTaxa de Crossover:")
-        for cross_rate, stats in cross_impact.iterrows():
-            print(f"  {cross_rate:.2f}: {stats['mean']:.2f} (±{stats['std']:.2f})")
-        
-        # Tamanho do torneio
-        tourn_impact = df.groupby('tamanho_torneio')['fitness_medio'].agg(['mean', 'std'])
-        print(f"\nTamanho do Torneio:")
-        for tourn_size, stats in tourn_impact.iterrows():
-            print(f"  {tourn_size:3d}: {stats['mean']:.2f} (±{stats['std']:.2f})")
-    
-    def _plotar_analise(self, df):
-        """Plota análises visuais dos resultados"""
-        
-        fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-        fig.suptitle('Análise de Parâmetros do Algoritmo Genético', fontsize=16, fontweight='bold')
-        
-        # 1. Fitness vs Tamanho da População
-        pop_stats = df.groupby('populacao_size')['fitness_medio'].agg(['mean', 'std'])
-        axes[0,0].errorbar(pop_stats.index, pop_stats['mean'], yerr=pop_stats['std'], 
-                          marker='o', capsize=5, capthick=2)
-        axes[0,0].set_title('Fitness vs Tamanho da População')
-        axes[0,0].set_xlabel('Tamanho da População')
-        axes[0,0].set_ylabel('Fitness Médio')
-        axes[0,0].grid(True, alpha=0.3)
-        
-        # 2. Fitness vs Taxa de Mutação
-        mut_stats = df.groupby('taxa_mutacao')['fitness_medio'].agg(['mean', 'std'])
-        axes[0,1].errorbar(mut_stats.index, mut_stats['mean'], yerr=mut_stats['std'], 
-                          marker='s', capsize=5, capthick=2, color='orange')
-        axes[0,1].set_title('Fitness vs Taxa de Mutação')
-        axes[0,1].set_xlabel('Taxa de Mutação')
-        axes[0,1].set_ylabel('Fitness Médio')
-        axes[0,1].grid(True, alpha=0.3)
-        
-        # 3. Fitness vs Taxa de Crossover
-        cross_stats = df.groupby('taxa_crossover')['fitness_medio'].agg(['mean', 'std'])
-        axes[0,2].errorbar(cross_stats.index, cross_stats['mean'], yerr=cross_stats['std'], 
-                          marker='^', capsize=5, capthick=2, color='green')
-        axes[0,2].set_title('Fitness vs Taxa de Crossover')
-        axes[0,2].set_xlabel('Taxa de Crossover')
-        axes[0,2].set_ylabel('Fitness Médio')
-        axes[0,2].grid(True, alpha=0.3)
-        
-        # 4. Fitness vs Tamanho do Torneio
-        tourn_stats = df.groupby('tamanho_torneio')['fitness_medio'].agg(['mean', 'std'])
-        axes[1,0].errorbar(tourn_stats.index, tourn_stats['mean'], yerr=tourn_stats['std'], 
-                          marker='d', capsize=5, capthick=2, color='red')
-        axes[1,0].set_title('Fitness vs Tamanho do Torneio')
-        axes[1,0].set_xlabel('Tamanho do Torneio')
-        axes[1,0].set_ylabel('Fitness Médio')
-        axes[1,0].grid(True, alpha=0.3)
-        
-        # 5. Tempo vs Fitness
-        axes[1,1].scatter(df['tempo_medio'], df['fitness_medio'], alpha=0.6, s=60)
-        axes[1,1].set_title('Trade-off: Tempo vs Fitness')
-        axes[1,1].set_xlabel('Tempo Médio (s)')
-        axes[1,1].set_ylabel('Fitness Médio')
-        axes[1,1].grid(True, alpha=0.3)
-        
-        # 6. Distribuição do Fitness
-        axes[1,2].hist(df['fitness_medio'], bins=15, alpha=0.7, edgecolor='black')
-        axes[1,2].axvline(df['fitness_medio'].mean(), color='red', linestyle='--', 
-                         label=f'Média: {df["fitness_medio"].mean():.2f}')
-        axes[1,2].set_title('Distribuição do Fitness')
-        axes[1,2].set_xlabel('Fitness')
-        axes[1,2].set_ylabel('Frequência')
-        axes[1,2].legend()
-        axes[1,2].grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.show()
-    
-    def salvar_resultados(self, filename="resultados_otimizacao.xlsx"):
-        """Salva os resultados em Excel"""
-        
-        # Criar pasta resultados se não existir
-        pasta_resultados = 'resultados'
-        if not os.path.exists(pasta_resultados):
-            os.makedirs(pasta_resultados)
-            print(f"📁 Pasta '{pasta_resultados}/' criada.")
-        
-        # Caminho completo do arquivo - verificar se já tem o caminho completo
-        if filename.startswith('resultados/') or filename.startswith('resultados\\'):
-            caminho_arquivo = filename
-        else:
-            caminho_arquivo = os.path.join(pasta_resultados, filename)
-        
-        df = pd.DataFrame(self.resultados)
-        df_sorted = df.sort_values('fitness_medio', ascending=False)
-        
-        try:
-            with pd.ExcelWriter(caminho_arquivo, engine='openpyxl') as writer:
-                df_sorted.to_excel(writer, sheet_name='Todos_Resultados', index=False)
-                
-                # Top 10
-                df_sorted.head(10).to_excel(writer, sheet_name='Top_10', index=False)
-                
-                # Análise por parâmetro
-                for param in ['populacao_size', 'taxa_mutacao', 'taxa_crossover', 'tamanho_torneio']:
-                    param_analysis = df.groupby(param)['fitness_medio'].agg(['mean', 'std', 'min', 'max'])
-                    param_analysis.to_excel(writer, sheet_name=f'Analise_{param}')
-            
-            print(f"💾 Resultados salvos em: {caminho_arquivo}")
-            return caminho_arquivo
-            
-        except Exception as e:
-            print(f"❌ Erro ao salvar arquivo: {e}")
-            print(f"Tentando salvar em: {caminho_arquivo}")
-            # Tentar salvar no diretório atual como fallback
-            fallback_filename = os.path.basename(filename)
-            print(f"Salvando como fallback em: {fallback_filename}")
-            
-            with pd.ExcelWriter(fallback_filename, engine='openpyxl') as writer:
-                df_sorted.to_excel(writer, sheet_name='Todos_Resultados', index=False)
-                df_sorted.head(10).to_excel(writer, sheet_name='Top_10', index=False)
-                for param in ['populacao_size', 'taxa_mutacao', 'taxa_crossover', 'tamanho_torneio']:
-                    param_analysis = df.groupby(param)['fitness_medio'].agg(['mean', 'std', 'min', 'max'])
-                    param_analysis.to_excel(writer, sheet_name=f'Analise_{param}')
-            
-            print(f"💾 Arquivo salvo em: {fallback_filename}")
-            return fallback_filename
-
-def executar_teste_rapido():
-    """Executa um teste rápido com poucos parâmetros"""
-    print("🚀 Executando Teste Rápido de Parâmetros")
-    
-    optimizer = ParameterOptimizer()
-    
-    melhor_config = optimizer.testar_parametros(
-        populacao_sizes=[30, 50],
-        taxas_mutacao=[0.1, 0.15],
-        taxas_crossover=[0.7, 0.8],
-        tamanhos_torneio=[3, 5],
-        max_geracoes=100,
-        execucoes_por_config=2
-    )
-    
-    print(f"\n🏆 MELHOR CONFIGURAÇÃO ENCONTRADA:")
-    print(f"   • Tamanho da População: {int(melhor_config['populacao_size'])}")
-    print(f"   • Taxa de Mutação: {melhor_config['taxa_mutacao']:.3f}")
-    print(f"   • Taxa de Crossover: {melhor_config['taxa_crossover']:.3f}")
-    print(f"   • Tamanho do Torneio: {int(melhor_config['tamanho_torneio'])}")
-    print(f"   • Fitness Médio: {melhor_config['fitness_medio']:.2f}")
-    
-    # Debug do caminho
-    print(f"\n🔧 DEBUG: Diretório atual: {os.getcwd()}")
-    print(f"🔧 DEBUG: Tentando salvar arquivo...")
-    
-    try:
-        caminho_salvo = optimizer.salvar_resultados("teste_rapido_parametros.xlsx")
-        print(f"✅ Arquivo salvo com sucesso em: {caminho_salvo}")
-    except Exception as e:
-        print(f"❌ Erro ao salvar: {e}")
-    
-    return melhor_config
-
-def executar_teste_completo():
+def executar_teste_completo(versao="V1"):
     """Executa um teste completo e detalhado"""
-    print("🔬 Executando Teste Completo de Parâmetros")
+    print(f"🔬 Executando Teste Completo de Parâmetros - {versao}")
     print("⚠️  Este teste pode demorar 30-60 minutos!")
     
     confirmar = input("Deseja continuar? (s/n): ")
@@ -781,7 +778,7 @@ def executar_teste_completo():
         print("Teste cancelado.")
         return None
     
-    optimizer = ParameterOptimizer()
+    optimizer = ParameterOptimizer(versao=versao)
     
     melhor_config = optimizer.testar_parametros(
         populacao_sizes=[20, 30, 50, 100],
@@ -797,50 +794,70 @@ def executar_teste_completo():
     return melhor_config
 
 def testar_config_especifica(populacao_size=50, taxa_mutacao=0.1, 
-                           taxa_crossover=0.8, tamanho_torneio=3, runs=5):
-    """Testa uma configuração específica múltiplas vezes"""
+                           taxa_crossover=0.8, tamanho_torneio=3, runs=5,
+                           versao="V1", max_geracoes=None):
+    """Testa uma configuração específica múltiplas vezes (qualquer motor registrado)"""
     
-    print(f"🎯 Testando configuração específica:")
+    print(f"🎯 Testando configuração específica {versao}:")
     print(f"   Pop: {populacao_size}, Mut: {taxa_mutacao}, Cross: {taxa_crossover}, Tournament: {tamanho_torneio}")
     
-    resultados = []
+    if max_geracoes is None:
+        max_geracoes = ENGINES[versao]().geracoes
+    
+    config = (populacao_size, taxa_mutacao, taxa_crossover, tamanho_torneio)
+    execucoes = []
     
     for run in range(runs):
         print(f"   Execução {run+1}/{runs}...")
-        
-        ga = ScheduleGA()
-        ga.populacao_size = populacao_size
-        ga.taxa_mutacao = taxa_mutacao
-        ga.taxa_crossover = taxa_crossover
-        ga.tamanho_torneio = tamanho_torneio
-        
-        _, fitness, historico = ga.executar()
-        resultados.append(fitness)
+        execucoes.append(executar_benchmark(versao, config, max_geracoes, seed=run))
+    
+    resultados = [e['fitness'] for e in execucoes]
+    resumo = agregar_execucoes(versao, config, execucoes)
     
-    print(f"\n📊 Resultados:")
+    print(f"\n📊 Resultados {versao}:")
     print(f"   • Fitness médio: {np.mean(resultados):.2f}")
     print(f"   • Desvio padrão: {np.std(resultados):.2f}")
     print(f"   • Melhor: {np.max(resultados):.2f}")
     print(f"   • Pior: {np.min(resultados):.2f}")
+    print(f"   • Fitness normalizado: {resumo['fitness_normalizado']:.3f}")
+    print(f"   • Avaliações/s: {resumo['avaliacoes_por_segundo']:.0f}")
+    print(f"   • Gerações/s: {resumo['geracoes_por_segundo']:.1f}")
+    if not np.isnan(resumo['pico_rss_mb']):
+        print(f"   • Pico de memória (RSS): {resumo['pico_rss_mb']:.1f} MB")
     
     return resultados
 
+def testar_config_especifica_v2(populacao_size=50, taxa_mutacao=0.15, 
+                               taxa_crossover=0.8, tamanho_torneio=3, runs=5):
+    """Testa uma configuração específica múltiplas vezes para V2"""
+    return testar_config_especifica(populacao_size, taxa_mutacao, taxa_crossover,
+                                    tamanho_torneio, runs, versao="V2")
+
 # Execução principal
 if __name__ == "__main__":
-    print("🔧 OTIMIZADOR DE PARÂMETROS DO ALGORITMO GENÉTICO")
+    print("🔧 OTIMIZADOR DE PARÂMETROS - V1 e V2")
     print("="*60)
     print("Opções disponíveis:")
-    print("1. Teste rápido (5-10 minutos)")
-    print("2. Teste completo (30-60 minutos)")
-    print("3. Testar configuração específica")
+    print("1. Teste rápido V1 (5-10 minutos)")
+    print("2. Teste rápido V2 (5-10 minutos)")
+    print("3. Comparar V1 vs V2 (10-15 minutos)")
+    print("4. Testar configuração específica V1")
+    print("5. Testar configuração específica V2")
+    print("6. Teste completo V1 (30-60 minutos)")
     
-    opcao = input("\nEscolha uma opção (1-3): ")
+    opcao = input("\nEscolha uma opção (1-6): ")
     
     if opcao == "1":
-        melhor = executar_teste_rapido()
+        melhor = executar_teste_rapido_v1()
     elif opcao == "2":
-        melhor = executar_teste_completo()
+        melhor = executar_teste_rapido_v2()
     elif opcao == "3":
+        v1_config, v2_config = comparar_parametros_v1_v2()
+    elif opcao == "4":
         resultados = testar_config_especifica()
+    elif opcao == "5":
+        resultados = testar_config_especifica_v2()
+    elif opcao == "6":
+        melhor = executar_teste_completo()
     else:
-        print("Opção inválida!")
\ No newline at end of file
+        print("Opção inválida!")
@@ -0,0 +1,60 @@
+import numpy as np
+from typing import Optional
+
+def ranks_pareto(objetivos: np.ndarray, violacoes: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Ordenação não dominada (todas as colunas são maximizadas)
+    Retorna o rank de cada linha: 0 = fronteira de Pareto, 1 = segunda fronteira...
+    - violacoes: com restrições, menos violações domina; com o mesmo número vale Pareto
+    """
+    objetivos = np.asarray(objetivos, dtype=float)
+    n = len(objetivos)
+    if n == 0:
+        return np.zeros(0, dtype=int)
+
+    # domina[i, j] = i domina j
+    maior_igual = (objetivos[:, None, :] >= objetivos[None, :, :]).all(axis=2)
+    maior = (objetivos[:, None, :] > objetivos[None, :, :]).any(axis=2)
+    domina = maior_igual & maior
+    if violacoes is not None:
+        violacoes = np.asarray(violacoes, dtype=float)
+        domina = (violacoes[:, None] < violacoes[None, :]) | \
+                 ((violacoes[:, None] == violacoes[None, :]) & domina)
+
+    ranks = np.full(n, -1, dtype=int)
+    contagem_dominado = domina.sum(axis=0)
+    rank = 0
+    restantes = np.ones(n, dtype=bool)
+    while restantes.any():
+        frente = restantes & (contagem_dominado == 0)
+        ranks[frente] = rank
+        restantes &= ~frente
+        contagem_dominado = contagem_dominado - domina[frente].sum(axis=0)
+        rank += 1
+    return ranks
+
+def distancia_aglomeracao(objetivos: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """
+    Crowding distance de cada linha dentro da sua fronteira (vetorizada por objetivo)
+    Extremos de cada objetivo recebem infinito
+    """
+    objetivos = np.asarray(objetivos, dtype=float)
+    distancia = np.zeros(len(objetivos))
+    for rank in np.unique(ranks):
+        indices = np.flatnonzero(ranks == rank)
+        if len(indices) <= 2:
+            distancia[indices] = np.inf
+            continue
+        valores = objetivos[indices]
+        ordem = np.argsort(valores, axis=0, kind='stable')
+        ordenados = np.take_along_axis(valores, ordem, axis=0)
+        amplitude = ordenados[-1] - ordenados[0]
+        amplitude[amplitude == 0] = 1.0
+
+        contribuicao = np.empty_like(ordenados)
+        contribuicao[1:-1] = (ordenados[2:] - ordenados[:-2]) / amplitude
+        contribuicao[[0, -1]] = np.inf
+        por_linha = np.empty_like(contribuicao)
+        np.put_along_axis(por_linha, ordem, contribuicao, axis=0)
+        distancia[indices] = por_linha.sum(axis=1)
+    return distancia
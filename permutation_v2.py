@@ -0,0 +1,216 @@
+import random
+import numpy as np
+from typing import Callable, Dict, Tuple
+from genetic_scheduler_v2 import ScheduleGA_V2
+
+class ScheduleGA_V2_Permutacao(ScheduleGA_V2):
+    """
+    Variante da V2 com genoma de permutação
+    - Genoma = permutação das células da agenda (dia * num_horarios + horário)
+    - Posição i < len(aulas_obrigatorias): célula da i-ésima aula obrigatória
+    - Posições restantes: células vazias
+    - Crossover PMX, OX ou de ciclo e mutação por troca preservam a permutação,
+      então todo filho tem exatamente a carga horária de cada disciplina (sem reparo)
+    """
+
+    versao = 'V2P'
+    OPERADORES_CROSSOVER = ('pmx', 'ox', 'ciclo')
+
+    def __init__(self):
+        super().__init__()
+        self.operador_crossover = 'pmx'
+
+    def _num_celulas(self) -> int:
+        num_celulas = self.num_dias * self.num_horarios
+        if len(self.aulas_obrigatorias) > num_celulas:
+            raise ValueError(f"{len(self.aulas_obrigatorias)} aulas obrigatórias não cabem "
+                             f"em {num_celulas} células da agenda")
+        return num_celulas
+
+    def codificar(self, agenda: np.ndarray) -> np.ndarray:
+        """
+        Converte uma agenda em permutação
+        Cada célula recebe uma aula obrigatória ainda não usada da mesma disciplina
+        (por valor, então vale para cópias, p. ex. soluções vindas de outro processo)
+        """
+        num_celulas = self._num_celulas()
+        pendentes = {}
+        for i, aula in enumerate(self.aulas_obrigatorias):
+            pendentes.setdefault(aula.disciplina, []).append(i)
+
+        genoma = np.full(num_celulas, -1, dtype=np.int64)
+        celulas_livres = []
+        for celula in range(num_celulas):
+            aula = agenda[celula // self.num_horarios, celula % self.num_horarios]
+            indices = pendentes.get(aula.disciplina) if aula is not None else None
+            if indices:
+                genoma[indices.pop(0)] = celula
+            else:
+                celulas_livres.append(celula)
+
+        # Aulas não alocadas e posições vazias recebem as células livres restantes
+        random.shuffle(celulas_livres)
+        genoma[genoma < 0] = celulas_livres
+        return genoma
+
+    def decodificar(self, individuo: np.ndarray) -> np.ndarray:
+        """Monta a agenda colocando cada aula obrigatória na célula indicada pelo genoma"""
+        agenda = self.criar_agenda_vazia()
+        for aula, celula in zip(self.aulas_obrigatorias, individuo.tolist()):
+            agenda[celula // self.num_horarios, celula % self.num_horarios] = aula
+        return agenda
+
+    def criar_cromossomo(self) -> np.ndarray:
+        """Parte da inicialização inteligente da V2 e codifica o resultado"""
+        return self.codificar(super().criar_cromossomo())
+
+    def crossover_agenda(self, pai1: np.ndarray, pai2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Crossover de permutação conforme self.operador_crossover"""
+        return self._crossover_permutacao(self.operador_crossover, pai1, pai2)
+
+    def _crossover_permutacao(self, nome: str, pai1: np.ndarray,
+                              pai2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Aplica o crossover de permutação `nome` ('pmx', 'ox' ou 'ciclo')"""
+        if random.random() > self.taxa_crossover:
+            return pai1.copy(), pai2.copy()
+
+        if nome == 'pmx':
+            operador = _crossover_pmx
+        elif nome == 'ox':
+            operador = _crossover_ox
+        elif nome == 'ciclo':
+            operador = _crossover_ciclo
+        else:
+            raise ValueError(f"Operador de crossover desconhecido: {nome} "
+                             f"(use um de {self.OPERADORES_CROSSOVER})")
+
+        return operador(pai1, pai2), operador(pai2, pai1)
+
+    def _operadores_crossover(self) -> Dict[str, Callable]:
+        """Os três crossovers de permutação"""
+        return {nome: (lambda pai1, pai2, nome=nome: self._crossover_permutacao(nome, pai1, pai2))
+                for nome in self.OPERADORES_CROSSOVER}
+
+    def _operadores_mutacao(self) -> Dict[str, Callable]:
+        """Troca aleatória e troca guiada por violações"""
+        return {
+            'troca': lambda individuo: self._mutacao_troca(individuo, guiada=False),
+            'guiada': lambda individuo: self._mutacao_troca(individuo, guiada=True)
+        }
+
+    def mutacao_agenda(self, individuo: np.ndarray) -> np.ndarray:
+        """
+        Mutação por troca: move uma aula para outra célula
+        (trocando de lugar com outra aula ou com uma célula vazia)
+        - Com self.mutacao_guiada, a aula é sorteada preferencialmente
+          entre as que estão em células com violações
+        """
+        return self._mutacao_troca(individuo, self.mutacao_guiada)
+
+    def _mutacao_troca(self, individuo: np.ndarray, guiada: bool) -> np.ndarray:
+        """Mutação por troca, guiada ou não por violações"""
+        mutado = individuo.copy()
+        num_aulas = len(self.aulas_obrigatorias)
+        num_celulas = len(mutado)
+        if num_aulas == 0 or num_celulas < 2:
+            return mutado
+
+        num_mutacoes = max(1, int(self.taxa_mutacao * num_celulas))
+        violadoras = []
+        if guiada:
+            flags = self._flags_violacao(self.decodificar(mutado)).ravel()
+            violadoras = [i for i in range(num_aulas) if flags[mutado[i]]]
+
+        for _ in range(num_mutacoes):
+            if random.random() < self.taxa_mutacao:
+                if violadoras and random.random() >= self.proporcao_aleatoria:
+                    i = random.choice(violadoras)
+                else:
+                    i = random.randrange(num_aulas)
+                j = random.randrange(num_celulas - 1)
+                if j >= i:
+                    j += 1
+                if self.podar_dominios and not self._troca_genes_permitida(mutado, i, j):
+                    opcoes = [k for k in range(num_celulas)
+                              if k != i and self._troca_genes_permitida(mutado, i, k)]
+                    if not opcoes:
+                        continue
+                    j = random.choice(opcoes)
+                mutado[i], mutado[j] = mutado[j], mutado[i]
+
+        return mutado
+
+    def _troca_genes_permitida(self, genoma: np.ndarray, i: int, j: int) -> bool:
+        """Trocar as células das posições i e j mantém as aulas dentro dos domínios"""
+        num_aulas = len(self.aulas_obrigatorias)
+        for posicao, celula in ((i, genoma[j]), (j, genoma[i])):
+            if posicao < num_aulas:
+                celula = int(celula)
+                if not self._aula_permitida(self.aulas_obrigatorias[posicao],
+                                            celula // self.num_horarios, celula % self.num_horarios):
+                    return False
+        return True
+
+def _pontos_corte(n: int) -> Tuple[int, int]:
+    """Dois pontos de corte distintos a < b em [0, n]"""
+    a, b = sorted(random.sample(range(n + 1), 2))
+    return a, b
+
+def _crossover_pmx(pai1: np.ndarray, pai2: np.ndarray) -> np.ndarray:
+    """Partially Mapped Crossover: segmento de pai1, restante de pai2 via mapeamento"""
+    p1, p2 = pai1.tolist(), pai2.tolist()
+    n = len(p1)
+    a, b = _pontos_corte(n)
+
+    filho = [-1] * n
+    filho[a:b] = p1[a:b]
+    no_segmento = set(p1[a:b])
+    posicao_p2 = {valor: i for i, valor in enumerate(p2)}
+
+    for i in range(a, b):
+        valor = p2[i]
+        if valor in no_segmento:
+            continue
+        # Segue o mapeamento até sair do segmento
+        j = i
+        while a <= j < b:
+            j = posicao_p2[p1[j]]
+        filho[j] = valor
+
+    for i in range(n):
+        if filho[i] < 0:
+            filho[i] = p2[i]
+
+    return np.array(filho, dtype=pai1.dtype)
+
+def _crossover_ox(pai1: np.ndarray, pai2: np.ndarray) -> np.ndarray:
+    """Order Crossover: segmento de pai1, demais na ordem relativa de pai2"""
+    p1, p2 = pai1.tolist(), pai2.tolist()
+    n = len(p1)
+    a, b = _pontos_corte(n)
+
+    filho = [-1] * n
+    filho[a:b] = p1[a:b]
+    no_segmento = set(p1[a:b])
+
+    restantes = [valor for valor in p2[b:] + p2[:b] if valor not in no_segmento]
+    for k, valor in enumerate(restantes):
+        filho[(b + k) % n] = valor
+
+    return np.array(filho, dtype=pai1.dtype)
+
+def _crossover_ciclo(pai1: np.ndarray, pai2: np.ndarray) -> np.ndarray:
+    """Cycle Crossover: o primeiro ciclo vem de pai1, o restante de pai2"""
+    p1, p2 = pai1.tolist(), pai2.tolist()
+    posicao_p1 = {valor: i for i, valor in enumerate(p1)}
+
+    filho = list(p2)
+    i = random.randrange(len(p1))
+    inicio = i
+    while True:
+        filho[i] = p1[i]
+        i = posicao_p1[p2[i]]
+        if i == inicio:
+            break
+
+    return np.array(filho, dtype=pai1.dtype)
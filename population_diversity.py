@@ -0,0 +1,68 @@
+from functools import lru_cache
+from typing import Iterable, List
+import numpy as np
+
+@lru_cache(maxsize=None)
+def _pesos_hash(num_posicoes: int) -> np.ndarray:
+    """Pesos aleatórios fixos (64 bits) de cada posição do genoma"""
+    rng = np.random.default_rng(20250101)
+    return rng.integers(1, 2 ** 63, size=num_posicoes, dtype=np.uint64) | np.uint64(1)
+
+def hash_genomas(matriz: np.ndarray) -> np.ndarray:
+    """
+    Hash de 64 bits de cada linha da matriz inteira (indivíduos x posições)
+    Soma ponderada com pesos aleatórios por posição, módulo 2^64 (vetorizado)
+    """
+    matriz = np.asarray(matriz)
+    pesos = _pesos_hash(matriz.shape[1])
+    with np.errstate(over='ignore'):
+        return ((matriz.astype(np.uint64) + np.uint64(1)) * pesos).sum(axis=1, dtype=np.uint64)
+
+def indices_duplicados(hashes: np.ndarray, protegidos: Iterable[int] = ()) -> List[int]:
+    """
+    Índices dos indivíduos repetidos (mantém uma cópia de cada genoma)
+    Os índices protegidos são considerados primeiro, então nunca são marcados
+    """
+    protegidos = [i for i in protegidos if 0 <= i < len(hashes)]
+    vistos = set()
+    duplicados = []
+    conjunto_protegidos = set(protegidos)
+    ordem = protegidos + [i for i in range(len(hashes)) if i not in conjunto_protegidos]
+    for i in ordem:
+        chave = int(hashes[i])
+        if chave in vistos:
+            if i not in conjunto_protegidos:
+                duplicados.append(i)
+        else:
+            vistos.add(chave)
+    return sorted(duplicados)
+
+def entropia_posicional(matriz: np.ndarray) -> float:
+    """
+    Entropia de Shannon média por posição, normalizada em [0, 1]
+    0 = todos os indivíduos iguais; 1 = máxima variedade possível por posição
+    """
+    matriz = np.asarray(matriz, dtype=np.int64)
+    num_individuos, num_posicoes = matriz.shape
+    if num_individuos < 2 or num_posicoes == 0:
+        return 0.0
+
+    num_valores = int(matriz.max()) + 1
+    # Contagem de cada valor por posição com um único bincount
+    deslocados = matriz + np.arange(num_posicoes)[None, :] * num_valores
+    contagens = np.bincount(deslocados.ravel(), minlength=num_posicoes * num_valores)
+    p = contagens.reshape(num_posicoes, num_valores) / num_individuos
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        entropia = -np.where(p > 0, p * np.log(p), 0.0).sum(axis=1)
+
+    maximo = np.log(min(num_individuos, num_valores))
+    if maximo <= 0:
+        return 0.0
+    return float(entropia.mean() / maximo)
+
+def proporcao_unicos(hashes: np.ndarray) -> float:
+    """Fração de genomas distintos na população"""
+    if len(hashes) == 0:
+        return 0.0
+    return len(np.unique(hashes)) / len(hashes)
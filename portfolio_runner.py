@@ -0,0 +1,261 @@
+import random
+import time
+import numpy as np
+from types import SimpleNamespace
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from multiprocessing import Manager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from benchmark_harness import ENGINES, _ENGINE_BASE_WORKER, inicializar_worker, pico_memoria_mb
+from genetic_scheduler_v2 import ScheduleGA_V2, Aula
+from hard_constraints import aulas_da_solucao, contar_violacoes
+from utils_v2 import analisar_qualidade_agenda
+
+@dataclass
+class MembroPortfolio:
+    """Motor do portfólio: nome registrado em ENGINES e atributos aplicados antes da execução"""
+    versao: str
+    parametros: Dict[str, Any] = field(default_factory=dict)
+    nome: Optional[str] = None
+
+    def __post_init__(self):
+        if self.versao not in ENGINES:
+            raise ValueError(f"Motor desconhecido: {self.versao} (registrados: {list(ENGINES)})")
+        self.nome = self.nome or self.versao
+
+@dataclass
+class ResultadoPortfolio:
+    """Vencedor do portfólio e telemetria de cada membro"""
+    vencedor: Optional[str]
+    versao: Optional[str]
+    solucao: Any
+    fitness: float                     # Na escala do motor vencedor (não comparável entre famílias)
+    violacoes: int
+    score: float
+    motivo_parada: str                 # 'alvo', 'prazo' ou 'convergiu'
+    tempo: float
+    telemetria: List[Dict] = field(default_factory=list)
+
+# Um membro de cada motor registrado no harness
+PORTFOLIO_PADRAO = ('V1', 'V2', 'V2P', 'SA', 'LNS')
+
+def _familia(engine) -> str:
+    """Motores da mesma família usam a mesma representação e podem trocar soluções"""
+    return 'V2' if isinstance(engine, ScheduleGA_V2) else 'V1'
+
+def avaliar_qualidade_comum(engine, solucao) -> Tuple[int, float]:
+    """
+    Medida comum às famílias V1 e V2 (os fitness têm escalas diferentes)
+    - Violações rígidas: hard_constraints.contar_violacoes (as mesmas do NSGA-II)
+    - Score: utils_v2.analisar_qualidade_agenda sobre a grade (na V1, a primeira
+      aula de cada célula; as sobrepostas já contam como violação)
+    Retorna (violações, score)
+    """
+    aulas = aulas_da_solucao(solucao)
+    num_dias, num_horarios = len(engine.dias), len(engine.horarios)
+    violacoes = contar_violacoes(engine, solucao)
+
+    agenda = np.full((num_dias, num_horarios), None, dtype=object)
+    for disciplina, professor, sala, dia, horario in aulas:
+        if agenda[dia, horario] is None:
+            agenda[dia, horario] = Aula(disciplina, professor, sala)
+    grade = SimpleNamespace(num_dias=num_dias, num_horarios=num_horarios, disciplinas=engine.disciplinas,
+                            _professor_disponivel=engine._professor_disponivel)
+    return violacoes, float(analisar_qualidade_agenda(agenda, grade)['score_geral'])
+
+def _executar_membro(membro: MembroPortfolio, geracoes_por_rodada: int, prazo: Optional[float],
+                     score_alvo: Optional[float], compartilhar: bool, incumbentes, trava,
+                     parar, seed: int) -> Dict:
+    """
+    Roda um membro em fatias de geracoes_por_rodada (execução com retomar=True)
+    Entre as fatias: publica o melhor da família, importa o incumbente de outro
+    membro e verifica alvo (avaliar_qualidade_comum), prazo e o sinal de parada
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+    inicio = time.time()
+
+    telemetria = {
+        'nome': membro.nome,
+        'versao': membro.versao,
+        'seed': seed,
+        'fitness': float('-inf'),
+        'violacoes': None,
+        'score': 0.0,
+        'rodadas': 0,
+        'geracoes': 0,
+        'avaliacoes': 0,
+        'tempo': 0.0,
+        'tempo_ate_melhor': None,
+        'exportacoes': 0,
+        'importacoes': 0,
+        'motivo_parada': 'parada',
+        'curva': [],
+        'operadores': None,
+        'erro': None
+    }
+    solucao = None
+    try:
+        if membro.versao not in _ENGINE_BASE_WORKER:
+            inicializar_worker(membro.versao)
+        engine = ENGINES[membro.versao]()
+        engine.verbose = False
+        engine.copiar_dados_de(_ENGINE_BASE_WORKER[membro.versao])
+        for atributo, valor in membro.parametros.items():
+            if not hasattr(engine, atributo):
+                raise ValueError(f"Parâmetro desconhecido para {membro.versao}: {atributo}")
+            setattr(engine, atributo, valor)
+        engine.geracoes = geracoes_por_rodada
+        familia = _familia(engine)
+        ultimo_importado = None
+
+        while not parar.is_set():
+            if prazo is not None:
+                restante = prazo - time.time()
+                if restante <= 0:
+                    telemetria['motivo_parada'] = 'prazo'
+                    break
+                if hasattr(engine, 'tempo_limite'):
+                    engine.tempo_limite = restante
+
+            retomar = engine.estado is not None
+            melhor, fitness, _ = engine.executar(retomar=retomar)
+            telemetria['rodadas'] += 1
+            if fitness > telemetria['fitness']:
+                solucao = melhor
+                telemetria['fitness'] = float(fitness)
+                telemetria['violacoes'], telemetria['score'] = avaliar_qualidade_comum(engine, melhor)
+                telemetria['tempo_ate_melhor'] = time.time() - inicio
+            telemetria['curva'].append((time.time() - inicio, telemetria['fitness']))
+
+            if compartilhar:
+                migrante = None
+                with trava:
+                    incumbente = incumbentes.get(familia)
+                    if incumbente is None or fitness > incumbente['fitness']:
+                        incumbentes[familia] = {'fitness': float(fitness), 'solucao': melhor,
+                                                'origem': membro.nome}
+                        telemetria['exportacoes'] += 1
+                    elif incumbente['origem'] != membro.nome and incumbente['fitness'] > fitness:
+                        migrante = incumbente
+                chave = None if migrante is None else (migrante['origem'], migrante['fitness'])
+                if chave is not None and chave != ultimo_importado:
+                    engine.importar_solucao(migrante['solucao'], migrante['fitness'])
+                    ultimo_importado = chave
+                    telemetria['importacoes'] += 1
+
+            if score_alvo is not None and telemetria['violacoes'] == 0 and telemetria['score'] >= score_alvo:
+                telemetria['motivo_parada'] = 'alvo'
+                parar.set()
+                break
+            if engine.estado.get('convergiu'):
+                telemetria['motivo_parada'] = 'convergiu'
+                break
+
+        telemetria['geracoes'] = engine.estado['geracao'] if engine.estado else 0
+        telemetria['avaliacoes'] = engine.total_avaliacoes
+        telemetria['operadores'] = getattr(engine, 'estatisticas_operadores', None)
+    except Exception as e:
+        telemetria['motivo_parada'] = 'erro'
+        telemetria['erro'] = str(e)
+
+    telemetria['tempo'] = time.time() - inicio
+    telemetria['pico_rss_mb'] = pico_memoria_mb()
+    telemetria['solucao'] = solucao
+    return telemetria
+
+def executar_portfolio(membros: Optional[List] = None, tempo_limite: Optional[float] = 60,
+                       score_alvo: Optional[float] = None, geracoes_por_rodada: int = 10,
+                       compartilhar: bool = True, n_processos: Optional[int] = None,
+                       semente: int = 42, verbose: bool = True) -> ResultadoPortfolio:
+    """
+    Executa vários motores em paralelo (um processo por membro) e retorna o vencedor
+    - membros: MembroPortfolio ou nomes de ENGINES (padrão: um de cada motor)
+    - tempo_limite: prazo em segundos para todos; score_alvo: score de
+      avaliar_qualidade_comum (0 a 1) que, atingido sem violações por um membro, para todos
+    - compartilhar: membros da mesma família (V1 ou modelo V2) trocam o melhor
+      encontrado a cada geracoes_por_rodada
+    - O vencedor é o de menos violações rígidas e depois maior score, medidas
+      comuns às duas famílias (empate: o mais rápido)
+    """
+    if tempo_limite is None and score_alvo is None:
+        raise ValueError("Defina tempo_limite e/ou score_alvo para o portfólio")
+    if geracoes_por_rodada < 1:
+        raise ValueError(f"geracoes_por_rodada deve ser >= 1 (recebido {geracoes_por_rodada})")
+
+    membros = [m if isinstance(m, MembroPortfolio) else MembroPortfolio(m)
+               for m in (membros or PORTFOLIO_PADRAO)]
+    nomes = [m.nome for m in membros]
+    repetidos = sorted({nome for nome in nomes if nomes.count(nome) > 1})
+    if repetidos:
+        raise ValueError(f"Nomes repetidos no portfólio: {repetidos} (use MembroPortfolio.nome)")
+
+    log = print if verbose else (lambda *_: None)
+    log(f"🏁 Portfólio com {len(membros)} motores: {', '.join(nomes)}")
+    if tempo_limite is not None:
+        log(f"   Prazo: {tempo_limite:.0f}s")
+    if score_alvo is not None:
+        log(f"   Alvo: score {score_alvo:.2f} sem violações")
+
+    inicio = time.time()
+    prazo = inicio + tempo_limite if tempo_limite is not None else None
+    telemetria = []
+    with Manager() as gerenciador:
+        incumbentes = gerenciador.dict()
+        trava = gerenciador.Lock()
+        parar = gerenciador.Event()
+        with ProcessPoolExecutor(max_workers=n_processos or len(membros)) as pool:
+            futuros = {
+                pool.submit(_executar_membro, membro, geracoes_por_rodada, prazo, score_alvo,
+                            compartilhar, incumbentes, trava, parar, semente + i): membro
+                for i, membro in enumerate(membros)
+            }
+            for futuro in as_completed(futuros):
+                registro = futuro.result()
+                telemetria.append(registro)
+                if registro['erro']:
+                    log(f"   ❌ {registro['nome']}: {registro['erro']}")
+                else:
+                    log(f"   {registro['nome']}: {registro['fitness']:.1f} "
+                        f"({registro['violacoes']} violações, score {registro['score']:.3f}) em {registro['tempo']:.1f}s, "
+                        f"{registro['rodadas']} rodadas, {registro['motivo_parada']}")
+
+    ordem = {nome: i for i, nome in enumerate(nomes)}
+    telemetria.sort(key=lambda registro: ordem[registro['nome']])
+    motivos = {registro['motivo_parada'] for registro in telemetria}
+    motivo = 'alvo' if 'alvo' in motivos else 'prazo' if 'prazo' in motivos else 'convergiu'
+
+    validos = [registro for registro in telemetria if registro['solucao'] is not None]
+    if not validos:
+        log("❌ Nenhum membro produziu solução")
+        return ResultadoPortfolio(None, None, None, 0.0, None, 0.0, motivo, time.time() - inicio, telemetria)
+
+    # Empate: vence quem chegou primeiro ao seu melhor
+    vencedor = max(validos, key=lambda registro: (-registro['violacoes'], registro['score'],
+                                                  -registro['tempo_ate_melhor']))
+    resultado = ResultadoPortfolio(
+        vencedor=vencedor['nome'],
+        versao=vencedor['versao'],
+        solucao=vencedor['solucao'],
+        fitness=vencedor['fitness'],
+        violacoes=vencedor['violacoes'],
+        score=vencedor['score'],
+        motivo_parada=motivo,
+        tempo=time.time() - inicio,
+        telemetria=telemetria
+    )
+    log(f"🏆 Vencedor: {resultado.vencedor} com {resultado.fitness:.1f} "
+        f"({resultado.violacoes} violações, score {resultado.score:.3f}) - parada por {motivo} em {resultado.tempo:.1f}s")
+    return resultado
+
+def exibir_telemetria(resultado: ResultadoPortfolio, log: Callable[[str], None] = print):
+    """Tabela com a telemetria de cada membro do portfólio"""
+    log(f"{'Membro':<12} {'Motor':<6} {'Fitness':>10} {'Viol.':>6} {'Score':>6} {'Rodadas':>8} {'Gerações':>9} "
+        f"{'Avaliações':>11} {'Tempo':>7} {'T. melhor':>10} {'Exp':>4} {'Imp':>4} {'Parada':<10}")
+    for registro in resultado.telemetria:
+        tempo_melhor = registro['tempo_ate_melhor']
+        log(f"{registro['nome']:<12} {registro['versao']:<6} {registro['fitness']:>10.1f} "
+            f"{'-' if registro['violacoes'] is None else registro['violacoes']:>6} {registro['score']:>6.3f} {registro['rodadas']:>8} {registro['geracoes']:>9} "
+            f"{registro['avaliacoes']:>11} {registro['tempo']:>7.1f} "
+            f"{'-' if tempo_melhor is None else f'{tempo_melhor:.1f}':>10} "
+            f"{registro['exportacoes']:>4} {registro['importacoes']:>4} {registro['motivo_parada']:<10}")
@@ -0,0 +1,218 @@
+import math
+import os
+import random
+import time
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from genetic_scheduler_v2 import ScheduleGA_V2
+
+COLUNAS_AGENDA = ['disciplina', 'nome_disciplina', 'turma', 'professor', 'sala', 'dia', 'horario', 'aula_numero']
+
+@dataclass
+class RelatorioReotimizacao:
+    """Resumo de uma reotimização a partir da agenda publicada"""
+    aulas_referencia: int = 0     # Aulas na agenda publicada
+    aulas_recolocadas: int = 0    # Aulas atuais colocadas na célula anterior
+    aulas_descartadas: int = 0    # Linhas que não valem mais (disciplina removida, carga menor, célula repetida)
+    aulas_novas: int = 0          # Aulas sem célula anterior (carga maior ou disciplina nova)
+    distancia_inicial: int = 0    # Aulas fora do lugar na solução de partida
+    distancia: int = 0            # Aulas fora do lugar na solução final
+    fitness: float = 0.0
+    geracoes: int = 0
+    tempo: float = 0.0
+
+def salvar_agenda_csv(agenda: np.ndarray, ga: ScheduleGA_V2,
+                      caminho: str = 'resultados/horario_otimizado.csv') -> str:
+    """Salva a agenda no formato de resultados/horario_otimizado.csv (uma linha por aula)"""
+    pasta = os.path.dirname(caminho)
+    if pasta and not os.path.exists(pasta):
+        os.makedirs(pasta)
+
+    linhas = []
+    numero = {}
+    for dia in range(ga.num_dias):
+        for horario in range(ga.num_horarios):
+            aula = agenda[dia, horario]
+            if aula is None:
+                continue
+            disciplina = ga.disciplinas[aula.disciplina]
+            numero[aula.disciplina] = numero.get(aula.disciplina, 0) + 1
+            linhas.append({
+                'disciplina': aula.disciplina,
+                'nome_disciplina': disciplina.nome,
+                'turma': disciplina.turma,
+                'professor': aula.professor,
+                'sala': aula.sala,
+                'dia': ga.dias[dia],
+                'horario': ga.horarios[horario],
+                'aula_numero': numero[aula.disciplina]
+            })
+    pd.DataFrame(linhas, columns=COLUNAS_AGENDA).to_csv(caminho, index=False)
+    return caminho
+
+def ler_referencia_csv(ga: ScheduleGA_V2, caminho: str = 'resultados/horario_otimizado.csv') -> np.ndarray:
+    """
+    Lê a agenda publicada como matriz (dias x horários) com o código da disciplina de cada célula
+    Linhas com dia ou horário desconhecido são ignoradas; na célula repetida vale a primeira
+    """
+    if not os.path.exists(caminho):
+        raise ValueError(f"Agenda de referência não encontrada: {caminho}")
+    df = pd.read_csv(caminho, dtype={'disciplina': str})
+    faltando = [c for c in ('disciplina', 'dia', 'horario') if c not in df.columns]
+    if faltando:
+        raise ValueError(f"Colunas faltando em {caminho}: {faltando}")
+
+    referencia = np.full((ga.num_dias, ga.num_horarios), None, dtype=object)
+    for _, row in df.iterrows():
+        if row['dia'] not in ga.dias or row['horario'] not in ga.horarios:
+            continue
+        dia, horario = ga.dias.index(row['dia']), ga.horarios.index(row['horario'])
+        if referencia[dia, horario] is None:
+            referencia[dia, horario] = row['disciplina']
+    return referencia
+
+def referencia_de_agenda(agenda: np.ndarray) -> np.ndarray:
+    """Matriz de referência (disciplina de cada célula) a partir de uma agenda em memória"""
+    referencia = np.full(agenda.shape, None, dtype=object)
+    for (dia, horario), aula in np.ndenumerate(agenda):
+        if aula is not None:
+            referencia[dia, horario] = aula.disciplina
+    return referencia
+
+def distancia_agendas(agenda: np.ndarray, referencia: np.ndarray) -> int:
+    """Aulas da referência que não estão mais na mesma célula (com a mesma disciplina)"""
+    return sum(1 for (dia, horario), disciplina in np.ndenumerate(referencia)
+               if disciplina is not None and
+               (agenda[dia, horario] is None or agenda[dia, horario].disciplina != disciplina))
+
+def agenda_de_referencia(ga: ScheduleGA_V2, referencia: np.ndarray) -> Tuple[np.ndarray, RelatorioReotimizacao]:
+    """
+    Monta uma agenda com as aulas obrigatórias atuais nas células da referência
+    - Cada célula recebe uma aula ainda não usada da mesma disciplina (professor e
+      sala vêm dos dados atuais); sobras da referência são descartadas
+    - Aulas que faltam vão para células livres, primeiro as do domínio
+    """
+    relatorio = RelatorioReotimizacao()
+    pendentes = {}
+    for aula in ga.aulas_obrigatorias:
+        pendentes.setdefault(aula.disciplina, []).append(aula)
+
+    agenda = ga.criar_agenda_vazia()
+    for (dia, horario), disciplina in np.ndenumerate(referencia):
+        if disciplina is None:
+            continue
+        relatorio.aulas_referencia += 1
+        if pendentes.get(disciplina):
+            agenda[dia, horario] = pendentes[disciplina].pop(0)
+            relatorio.aulas_recolocadas += 1
+        else:
+            relatorio.aulas_descartadas += 1
+
+    for aulas in pendentes.values():
+        for aula in aulas:
+            livres = [(d, h) for d in range(ga.num_dias) for h in range(ga.num_horarios) if agenda[d, h] is None]
+            if not livres:
+                break
+            permitidas = [c for c in livres if ga._aula_permitida(aula, *c)]
+            dia, horario = random.choice(permitidas or livres)
+            agenda[dia, horario] = aula
+            relatorio.aulas_novas += 1
+    return agenda, relatorio
+
+def reparar_localmente(ga: ScheduleGA_V2, agenda: np.ndarray, max_trocas: int = 50) -> int:
+    """
+    Descida por trocas que partem das células com violações (_flags_violacao),
+    aplicando a de maior ganho de fitness até não haver melhora
+    Com agenda_referencia definida, cada aula movida custa a sua estabilidade
+    Retorna o número de trocas aplicadas (modifica a agenda)
+    """
+    celulas = [(d, h) for d in range(ga.num_dias) for h in range(ga.num_horarios)]
+    fitness = ga.calcular_fitness(agenda)
+    for trocas in range(max_trocas):
+        flags = ga._flags_violacao(agenda)
+        melhor_fitness, melhor_troca = fitness, None
+        for d1, h1 in celulas:
+            if not flags[d1, h1]:
+                continue
+            for d2, h2 in celulas:
+                if (d1, h1) == (d2, h2) or not ga._troca_permitida(agenda, d1, h1, d2, h2):
+                    continue
+                agenda[d1, h1], agenda[d2, h2] = agenda[d2, h2], agenda[d1, h1]
+                novo = ga.calcular_fitness(agenda)
+                agenda[d1, h1], agenda[d2, h2] = agenda[d2, h2], agenda[d1, h1]
+                if novo > melhor_fitness:
+                    melhor_fitness, melhor_troca = novo, (d1, h1, d2, h2)
+        if melhor_troca is None:
+            return trocas
+        d1, h1, d2, h2 = melhor_troca
+        agenda[d1, h1], agenda[d2, h2] = agenda[d2, h2], agenda[d1, h1]
+        fitness = melhor_fitness
+    return max_trocas
+
+def _perturbar(ga: ScheduleGA_V2, agenda: np.ndarray, trocas: int) -> np.ndarray:
+    """Cópia da agenda com algumas trocas de células dentro dos domínios"""
+    agenda = agenda.copy()
+    celulas = [(d, h) for d in range(ga.num_dias) for h in range(ga.num_horarios)]
+    for _ in range(trocas):
+        (d1, h1), (d2, h2) = random.sample(celulas, 2)
+        if ga._troca_permitida(agenda, d1, h1, d2, h2):
+            agenda[d1, h1], agenda[d2, h2] = agenda[d2, h2], agenda[d1, h1]
+    return agenda
+
+def reotimizar(ga: ScheduleGA_V2, referencia: Optional[np.ndarray] = None,
+               caminho: str = 'resultados/horario_otimizado.csv', geracoes: int = 30,
+               fracao_sementes: float = 0.5, peso_aula_mantida: Optional[float] = None,
+               verbose: bool = True) -> Tuple[np.ndarray, float, list, RelatorioReotimizacao]:
+    """
+    Reotimiza a partir da agenda publicada após mudanças nos dados (já carregados em ga)
+    - referencia: matriz de disciplinas por célula (padrão: lida de `caminho`)
+    - A população parte da agenda publicada ajustada aos dados atuais, da mesma
+      agenda após reparar_localmente e de cópias levemente perturbadas
+      (fracao_sementes da população; 0 = sem sementes); o resto é aleatório
+    - Cada aula mantida na célula anterior vale pesos['aula_mantida'] (peso_aula_mantida)
+    - Retorna (agenda, fitness, histórico, relatório com a distância à referência)
+    Funciona com V2, V2P, SA e LNS (os dois últimos partem da agenda publicada)
+    """
+    if not isinstance(ga, ScheduleGA_V2):
+        raise ValueError("A reotimização requer um motor do modelo V2")
+    if not 0 <= fracao_sementes <= 1:
+        raise ValueError(f"fracao_sementes deve estar em [0, 1] (recebido {fracao_sementes})")
+    if not ga.dados_carregados:
+        ga.carregar_dados()
+    if referencia is None:
+        referencia = ler_referencia_csv(ga, caminho)
+
+    log = print if verbose else (lambda *_: None)
+    inicio = time.time()
+    inicial, relatorio = agenda_de_referencia(ga, referencia)
+    relatorio.distancia_inicial = distancia_agendas(inicial, referencia)
+    log(f"♻️  Agenda de referência: {relatorio.aulas_recolocadas}/{relatorio.aulas_referencia} aulas recolocadas, "
+        f"{relatorio.aulas_descartadas} descartadas, {relatorio.aulas_novas} novas")
+
+    configuracao = (ga.sementes, ga.geracoes, ga.agenda_referencia, ga.pesos)
+    ga.geracoes = geracoes
+    ga.agenda_referencia = referencia
+    if peso_aula_mantida is not None:
+        ga.pesos = dict(ga.pesos, aula_mantida=peso_aula_mantida)
+    try:
+        reparada = inicial.copy()
+        trocas = reparar_localmente(ga, reparada)
+        log(f"🔧 Reparo local: {trocas} trocas")
+        
+        # fracao_sementes = 0: nenhuma semente (população aleatória, só o termo aula_mantida puxa para a referência)
+        n_sementes = math.ceil(ga.populacao_size * fracao_sementes)
+        ga.sementes = ([reparada, inicial] + [_perturbar(ga, reparada, random.randint(1, 3))
+                                              for _ in range(n_sementes - 2)])[:n_sementes]
+        agenda, fitness, historico = ga.executar()
+    finally:
+        ga.sementes, ga.geracoes, ga.agenda_referencia, ga.pesos = configuracao
+
+    relatorio.distancia = distancia_agendas(agenda, referencia)
+    relatorio.fitness = float(fitness)
+    relatorio.geracoes = len(historico)
+    relatorio.tempo = time.time() - inicio
+    log(f"✅ Reotimização em {relatorio.tempo:.1f}s: {relatorio.distancia} aulas mudaram de lugar "
+        f"(partida: {relatorio.distancia_inicial}), fitness {relatorio.fitness:.0f}")
+    return agenda, fitness, historico, relatorio
@@ -0,0 +1,246 @@
+import copy
+import random
+import time
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+from feasibility_check import verificar_viabilidade
+from genetic_scheduler_v2 import ScheduleGA_V2, Disciplina, Disponibilidade, Professor, Sala
+from rescheduling import distancia_agendas, referencia_de_agenda, reotimizar
+from utils_v2 import analisar_qualidade_agenda
+
+def _codigo_professor(ga: ScheduleGA_V2, professor) -> object:
+    """Aceita o código ou o nome (sem diferenciar maiúsculas) do professor"""
+    if professor in ga.professores:
+        return professor
+    for codigo, prof in ga.professores.items():
+        if str(prof.nome).strip().lower() == str(professor).strip().lower():
+            return codigo
+    raise ValueError(f"Professor desconhecido: {professor}")
+
+@dataclass
+class RemoverDisponibilidade:
+    """Professor deixa de atender um dia e/ou horário (None = todos)"""
+    professor: object
+    dia: Optional[str] = None
+    horario: Optional[str] = None
+
+    def aplicar(self, ga: ScheduleGA_V2):
+        codigo = _codigo_professor(ga, self.professor)
+        ga.disponibilidades[codigo] = [
+            disp for disp in ga.disponibilidades.get(codigo, [])
+            if not ((self.dia is None or disp.dia == self.dia) and
+                    (self.horario is None or disp.horario == self.horario))
+        ]
+
+    def __str__(self):
+        return f"-disp {self.professor} {self.dia or 'todos os dias'} {self.horario or ''}".strip()
+
+@dataclass
+class AdicionarDisponibilidade:
+    """Professor passa a atender o dia/horário no turno dado"""
+    professor: object
+    dia: str
+    horario: str
+    turno: str = 'Noturno'
+
+    def aplicar(self, ga: ScheduleGA_V2):
+        codigo = _codigo_professor(ga, self.professor)
+        ga.disponibilidades.setdefault(codigo, []).append(
+            Disponibilidade(professor=codigo, turno=self.turno, dia=self.dia, horario=self.horario))
+
+    def __str__(self):
+        return f"+disp {self.professor} {self.dia} {self.horario}"
+
+@dataclass
+class AdicionarDisciplina:
+    """
+    Nova disciplina com um professor novo (o modelo liga cada professor a uma disciplina)
+    disponibilidade: pares (dia, horário) no turno da turma
+    """
+    codigo: str
+    nome: str
+    carga_horaria: int
+    turma: str
+    professor: object
+    nome_professor: str = ''
+    disponibilidade: List[Tuple[str, str]] = field(default_factory=list)
+
+    def aplicar(self, ga: ScheduleGA_V2):
+        if self.codigo in ga.disciplinas:
+            raise ValueError(f"Disciplina {self.codigo} já existe")
+        if self.turma not in ga.turmas:
+            raise ValueError(f"Turma desconhecida: {self.turma}")
+        if self.professor in ga.professores:
+            raise ValueError(f"Professor {self.professor} já leciona {ga.professores[self.professor].disciplina}")
+        turma = ga.turmas[self.turma]
+        ga.disciplinas[self.codigo] = Disciplina(codigo=self.codigo, nome=self.nome,
+                                                 carga_horaria=self.carga_horaria,
+                                                 periodo=turma.periodo, turma=self.turma)
+        ga.professores[self.professor] = Professor(codigo=self.professor,
+                                                   nome=self.nome_professor or str(self.professor),
+                                                   disciplina=self.codigo)
+        ga.disponibilidades[self.professor] = [
+            Disponibilidade(professor=self.professor, turno=turma.turno, dia=dia, horario=horario)
+            for dia, horario in self.disponibilidade
+        ]
+
+    def __str__(self):
+        return f"+disc {self.codigo} ({self.carga_horaria}h)"
+
+@dataclass
+class RemoverDisciplina:
+    codigo: str
+
+    def aplicar(self, ga: ScheduleGA_V2):
+        if self.codigo not in ga.disciplinas:
+            raise ValueError(f"Disciplina desconhecida: {self.codigo}")
+        del ga.disciplinas[self.codigo]
+
+    def __str__(self):
+        return f"-disc {self.codigo}"
+
+@dataclass
+class RemoverSala:
+    codigo: object
+
+    def aplicar(self, ga: ScheduleGA_V2):
+        if self.codigo not in ga.salas:
+            raise ValueError(f"Sala desconhecida: {self.codigo}")
+        del ga.salas[self.codigo]
+        if not ga.salas:
+            raise ValueError("Nenhuma sala restante")
+
+    def __str__(self):
+        return f"-sala {self.codigo}"
+
+@dataclass
+class AdicionarSala:
+    codigo: object
+    nome: str
+    capacidade: int
+
+    def aplicar(self, ga: ScheduleGA_V2):
+        ga.salas[self.codigo] = Sala(codigo=self.codigo, nome=self.nome, capacidade=self.capacidade)
+
+    def __str__(self):
+        return f"+sala {self.codigo} ({self.capacidade})"
+
+@dataclass
+class Cenario:
+    """Variante dos dados: nome e lista de mudanças aplicadas sobre a base"""
+    nome: str
+    mudancas: list = field(default_factory=list)
+
+    @property
+    def descricao(self) -> str:
+        return '; '.join(str(mudanca) for mudanca in self.mudancas)
+
+def compilar_cenario(base: ScheduleGA_V2, cenario: Cenario) -> ScheduleGA_V2:
+    """
+    Cópia do motor base com as mudanças aplicadas, sem reler o Excel
+    Só os dicionários de dados são copiados; domínios e aulas são recalculados
+    """
+    ga = copy.copy(base)
+    ga.verbose = False
+    ga.estado = None
+    ga.sementes = []
+    ga.disciplinas = dict(base.disciplinas)
+    ga.professores = dict(base.professores)
+    ga.salas = dict(base.salas)
+    ga.turmas = dict(base.turmas)
+    ga.disponibilidades = {prof: list(disps) for prof, disps in base.disponibilidades.items()}
+    for mudanca in cenario.mudancas:
+        mudanca.aplicar(ga)
+    ga._calcular_dominios()
+    ga._criar_aulas_obrigatorias()
+    return ga
+
+def _linha_agenda(ga: ScheduleGA_V2, agenda: np.ndarray, referencia: np.ndarray) -> dict:
+    """Métricas comparáveis entre cenários (fitness sem o termo de estabilidade)"""
+    metricas = analisar_qualidade_agenda(agenda, ga)
+    return {
+        'fitness': float(ga.calcular_fitness(agenda)),
+        'aulas_movidas': distancia_agendas(agenda, referencia),
+        'completude': metricas['completude_disciplinas'],
+        'respeito_disponibilidade': metricas['respeito_disponibilidade'],
+        'score_geral': metricas['score_geral']
+    }
+
+def _executar_cenario(base: ScheduleGA_V2, cenario: Cenario, referencia: np.ndarray,
+                      geracoes: int, seed: int) -> dict:
+    """Executado em um processo do pool: compila o cenário e reotimiza a partir da base"""
+    random.seed(seed)
+    np.random.seed(seed)
+    inicio = time.time()
+    linha = {'cenario': cenario.nome, 'mudancas': cenario.descricao}
+    try:
+        ga = compilar_cenario(base, cenario)
+        viabilidade = verificar_viabilidade(ga)
+        agenda, _, _, relatorio = reotimizar(ga, referencia, geracoes=geracoes, verbose=False)
+        linha.update(_linha_agenda(ga, agenda, referencia))
+        linha.update({
+            'viavel': viabilidade.viavel,
+            'problemas': '; '.join(viabilidade.erros),
+            'aulas_descartadas': relatorio.aulas_descartadas,
+            'aulas_novas': relatorio.aulas_novas,
+            'agenda': agenda,
+            'erro': None
+        })
+    except Exception as e:
+        linha.update({'viavel': False, 'erro': str(e)})
+    linha['tempo'] = time.time() - inicio
+    return linha
+
+def executar_cenarios(base: ScheduleGA_V2, cenarios: List[Cenario], agenda_base: Optional[np.ndarray] = None,
+                      geracoes: int = 30, n_processos: Optional[int] = None, semente: int = 42,
+                      verbose: bool = True) -> pd.DataFrame:
+    """
+    Avalia vários cenários "e se" sobre um problema base (modelo V2)
+    - base: motor com os dados carregados uma vez e os parâmetros desejados
+    - agenda_base: solução atual (padrão: resolve a base uma vez)
+    - Cada cenário é compilado a partir da base e reotimizado em paralelo com
+      warm start na agenda_base (rescheduling.reotimizar)
+    Retorna uma tabela com uma linha por cenário (a primeira é a base); as
+    colunas delta_* comparam com a base e 'agenda' guarda a solução de cada um
+    """
+    if not isinstance(base, ScheduleGA_V2):
+        raise ValueError("O executor de cenários requer um motor do modelo V2")
+    nomes = [cenario.nome for cenario in cenarios]
+    if len(set(nomes)) != len(nomes) or 'base' in nomes:
+        raise ValueError("Nomes de cenário devem ser únicos e diferentes de 'base'")
+
+    log = print if verbose else (lambda *_: None)
+    if not base.dados_carregados:
+        base.carregar_dados()
+    if agenda_base is None:
+        log("🧬 Resolvendo o problema base...")
+        random.seed(semente)
+        np.random.seed(semente)
+        agenda_base, _, _ = base.executar()
+    referencia = referencia_de_agenda(agenda_base)
+
+    inicio = time.time()
+    linha_base = {'cenario': 'base', 'mudancas': '', 'viavel': verificar_viabilidade(base).viavel,
+                  'problemas': '', 'aulas_descartadas': 0, 'aulas_novas': 0,
+                  'agenda': agenda_base, 'erro': None, 'tempo': 0.0}
+    linha_base.update(_linha_agenda(base, agenda_base, referencia))
+
+    log(f"🔀 Avaliando {len(cenarios)} cenários...")
+    with ProcessPoolExecutor(max_workers=n_processos) as pool:
+        futuros = [pool.submit(_executar_cenario, base, cenario, referencia, geracoes, semente + i)
+                   for i, cenario in enumerate(cenarios)]
+        linhas = [linha_base] + [futuro.result() for futuro in futuros]
+
+    tabela = pd.DataFrame(linhas)
+    for coluna in ('fitness', 'score_geral', 'respeito_disponibilidade'):
+        tabela[f'delta_{coluna}'] = tabela[coluna] - linha_base[coluna]
+    colunas = ['cenario', 'mudancas', 'viavel', 'fitness', 'delta_fitness', 'aulas_movidas',
+               'aulas_descartadas', 'aulas_novas', 'completude', 'respeito_disponibilidade',
+               'delta_respeito_disponibilidade', 'score_geral', 'delta_score_geral',
+               'tempo', 'problemas', 'erro', 'agenda']
+    tabela = tabela[colunas]
+    log(f"✅ {len(cenarios)} cenários em {time.time() - inicio:.1f}s")
+    return tabela
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+from genetic_scheduler_v2 import ScheduleGA_V2, COMPONENTES_FITNESS
+
+# Componentes sem peso em self.pesos: entram na reponderação com fator 1
+COMPONENTES_FIXOS = ('bonus_consecutivas',)
+
+def fatores_reponderacao(pesos_originais: Dict[str, float], novos_pesos: Dict[str, float]) -> np.ndarray:
+    """
+    Fator de cada coluna de COMPONENTES_FITNESS: novo peso / peso usado na avaliação
+    - novos_pesos pode ser parcial (pesos ausentes ficam como estavam)
+    - Componente avaliado com peso 0 só pode continuar com peso 0
+    """
+    validos = [c for c in COMPONENTES_FITNESS if c not in COMPONENTES_FIXOS]
+    desconhecidos = sorted(set(novos_pesos) - set(validos))
+    if desconhecidos:
+        raise ValueError(f"Pesos desconhecidos: {desconhecidos} (válidos: {validos})")
+
+    fatores = np.ones(len(COMPONENTES_FITNESS))
+    for j, componente in enumerate(COMPONENTES_FITNESS):
+        if componente in COMPONENTES_FIXOS or componente not in novos_pesos:
+            continue
+        original, novo = pesos_originais.get(componente, 0), novos_pesos[componente]
+        if original == 0:
+            if novo != 0:
+                raise ValueError(f"'{componente}' foi avaliado com peso 0 e não pode ser reponderado")
+            fatores[j] = 0.0
+        else:
+            fatores[j] = novo / original
+    return fatores
+
+def reponderar(componentes: np.ndarray, pesos_originais: Dict[str, float],
+               novos_pesos: Dict[str, float]) -> np.ndarray:
+    """
+    Fitness de cada linha da matriz de componentes sob novos pesos (um produto matriz-vetor)
+    Exato para todos os termos lineares no peso; a penalidade por aulas extras de
+    disciplina_atendida (que a reparação da V2 evita) escala junto com o peso
+    """
+    componentes = np.atleast_2d(componentes)
+    if componentes.shape[1] != len(COMPONENTES_FITNESS):
+        raise ValueError(f"A matriz deve ter {len(COMPONENTES_FITNESS)} colunas (recebido {componentes.shape[1]})")
+    return componentes @ fatores_reponderacao(pesos_originais, novos_pesos)
+
+def arquivo_componentes(ga: ScheduleGA_V2, fonte: str = 'populacao') -> Tuple[List[np.ndarray], np.ndarray, Dict]:
+    """
+    Agendas arquivadas, sua matriz de componentes e os pesos usados na avaliação
+    - fonte: 'populacao' (última população avaliada, guardada no checkpoint) ou 'hall_da_fama'
+    """
+    if not isinstance(ga, ScheduleGA_V2):
+        raise ValueError("A reponderação requer um motor do modelo V2")
+    if fonte not in ('populacao', 'hall_da_fama'):
+        raise ValueError(f"Fonte desconhecida: {fonte} (use 'populacao' ou 'hall_da_fama')")
+    if ga.estado is None:
+        raise ValueError("Sem checkpoint: execute o motor antes de reponderar")
+
+    if fonte == 'populacao':
+        matriz = ga.estado.get('componentes')
+        if matriz is None:
+            raise ValueError("O checkpoint não tem matriz de componentes (motor sem população)")
+        agendas = [ga.decodificar(ind) for ind in ga.estado['avaliados']]
+    else:
+        if not ga.hall_da_fama:
+            raise ValueError("Hall da fama vazio (preenchido pelos motores genéticos do modelo V2)")
+        agendas = [individuo for _, individuo, _ in ga.hall_da_fama]
+        matriz = np.array([componentes for _, _, componentes in ga.hall_da_fama])
+    return agendas, matriz, ga.estado['pesos']
+
+def reclassificar(ga: ScheduleGA_V2, novos_pesos: Dict[str, float], fonte: str = 'populacao',
+                  top: Optional[int] = None) -> pd.DataFrame:
+    """
+    Reordena as agendas arquivadas na última execução sob novos pesos, sem rodar o GA
+    Retorna uma tabela da melhor para a pior, com as posições antes e depois,
+    o fitness original e o reponderado, os componentes e a agenda de cada linha
+    """
+    agendas, matriz, pesos = arquivo_componentes(ga, fonte)
+    fitness_anterior = matriz.sum(axis=1)
+    fitness_novo = reponderar(matriz, pesos, novos_pesos)
+
+    posicao_anterior = np.empty(len(agendas), dtype=int)
+    posicao_anterior[np.argsort(-fitness_anterior, kind='stable')] = np.arange(1, len(agendas) + 1)
+    ordem = np.argsort(-fitness_novo, kind='stable')
+
+    tabela = pd.DataFrame(matriz[ordem] * fatores_reponderacao(pesos, novos_pesos), columns=COMPONENTES_FITNESS)
+    tabela.insert(0, 'posicao', np.arange(1, len(agendas) + 1))
+    tabela.insert(1, 'posicao_anterior', posicao_anterior[ordem])
+    tabela.insert(2, 'indice', ordem)
+    tabela.insert(3, 'fitness', fitness_novo[ordem])
+    tabela.insert(4, 'fitness_anterior', fitness_anterior[ordem])
+    tabela['agenda'] = [agendas[i] for i in ordem]
+    return tabela if top is None else tabela.head(top)
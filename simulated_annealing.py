@@ -0,0 +1,328 @@
+import math
+import random
+import time
+import numpy as np
+from typing import List, Tuple
+from execution_events import criar_registro_geracao, emitir_evento
+from day_bitmask import tabelas_mascara, mascaras_agenda
+from genetic_scheduler_v2 import ScheduleGA_V2
+
+class ModeloIncremental:
+    """
+    Agenda com máscaras de bits por dia, por disciplina e contagem de aulas por
+    professor/dia, para avaliar a troca de duas células sem recalcular a agenda inteira
+    - Só mudam os termos dos dias, das (até duas) disciplinas e professores
+      envolvidos e a disponibilidade e a estabilidade das duas células
+    - Disciplinas atendidas e uso da sala não mudam com trocas (constantes)
+    """
+
+    def __init__(self, ga: ScheduleGA_V2, agenda: np.ndarray):
+        self.ga = ga
+        self.agenda = agenda
+        self.tabelas = tabelas_mascara(ga.num_horarios)
+        self.ocupacao, self.mascaras = mascaras_agenda(agenda)
+        self.dias_professor = {}
+        for dia in range(ga.num_dias):
+            for horario in range(ga.num_horarios):
+                aula = agenda[dia, horario]
+                if aula is not None:
+                    contagem = self.dias_professor.setdefault(aula.professor, [0] * ga.num_dias)
+                    contagem[dia] += 1
+        self.disponivel = {(prof, ga.dias.index(disp.dia), ga.horarios.index(disp.horario))
+                           for prof, disps in ga.disponibilidades.items() for disp in disps
+                           if disp.dia in ga.dias and disp.horario in ga.horarios}
+        self.fitness = ga.calcular_fitness(agenda)
+
+    def _termo_dias(self) -> float:
+        """Distribuição equilibrada, carga diária e continuidade (dependem só da ocupação)"""
+        pesos = self.ga.pesos
+        ocupados = [self.tabelas.ocupados[mascara] for mascara in self.ocupacao]
+        media = sum(ocupados) / len(ocupados)
+        desvio = math.sqrt(sum((c - media) ** 2 for c in ocupados) / len(ocupados))
+        pontos = pesos['distribuicao_equilibrada'] * max(0, (2.0 - desvio)) * 0.5
+        pontos += pesos['sem_sobrecarga_dia'] * sum(1 for c in ocupados if c <= 4)
+        pontos += sum(pesos['sem_janelas'] * max(0, 4 - self.tabelas.janelas[mascara])
+                      for mascara in self.ocupacao if mascara)
+        return pontos
+
+    def _termo_disciplina(self, disciplina: str) -> float:
+        """Distribuição planejada e aulas consecutivas de uma disciplina"""
+        info = self.ga.distribuicao_disciplinas.get(disciplina)
+        mascaras = self.mascaras.get(disciplina)
+        if info is None or mascaras is None:
+            return 0.0
+        planejada = sorted(info['distribuicao'], reverse=True)
+        dias_com_aulas = sorted((self.tabelas.ocupados[m] for m in mascaras if m), reverse=True)
+
+        pontos = 0.0
+        if len(dias_com_aulas) == len(planejada):
+            if dias_com_aulas == planejada:
+                pontos += self.ga.pesos['distribuicao_inteligente']
+            else:
+                diferenca = sum(abs(real - plan) for real, plan in zip(dias_com_aulas, planejada))
+                total_aulas = sum(planejada)
+                if total_aulas > 0:
+                    pontos += self.ga.pesos['distribuicao_inteligente'] * max(0, 1 - diferenca / total_aulas)
+        for mascara in mascaras:
+            consecutivas = self.tabelas.maior_sequencia[mascara]
+            if consecutivas >= 2:
+                pontos += 50 * (consecutivas - 1)
+        return pontos
+
+    def _termo_professor(self, professor: str) -> float:
+        """Concentração dos dias trabalhados pelo professor"""
+        dias = sum(1 for c in self.dias_professor[professor] if c > 0)
+        return self.ga.pesos['professor_satisfeito'] * max(0, 6 - dias)
+
+    def _termo_celula(self, dia: int, horario: int) -> float:
+        """Disponibilidade do professor e estabilidade em relação à agenda de referência"""
+        aula = self.agenda[dia, horario]
+        if aula is None:
+            return 0.0
+        pontos = 0.0
+        if (aula.professor, dia, horario) in self.disponivel:
+            pontos += self.ga.pesos['disponibilidade_respeitada']
+        referencia = self.ga.agenda_referencia
+        if referencia is not None and referencia[dia, horario] == aula.disciplina:
+            pontos += self.ga.pesos['aula_mantida']
+        return pontos
+
+    def _termos_afetados(self, celulas, disciplinas, professores) -> float:
+        return (self._termo_dias()
+                + sum(self._termo_disciplina(d) for d in disciplinas)
+                + sum(self._termo_professor(p) for p in professores)
+                + sum(self._termo_celula(d, h) for d, h in celulas))
+
+    def trocar(self, dia1: int, hora1: int, dia2: int, hora2: int):
+        """Troca o conteúdo das duas células atualizando as máscaras (sem mexer no fitness)"""
+        a, b = self.agenda[dia1, hora1], self.agenda[dia2, hora2]
+        for aula, dia, hora in ((a, dia1, hora1), (b, dia2, hora2)):
+            if aula is not None:
+                bit = ~(1 << hora)
+                self.ocupacao[dia] &= bit
+                self.mascaras[aula.disciplina][dia] &= bit
+                self.dias_professor[aula.professor][dia] -= 1
+        for aula, dia, hora in ((a, dia2, hora2), (b, dia1, hora1)):
+            if aula is not None:
+                bit = 1 << hora
+                self.ocupacao[dia] |= bit
+                self.mascaras[aula.disciplina][dia] |= bit
+                self.dias_professor[aula.professor][dia] += 1
+        self.agenda[dia1, hora1], self.agenda[dia2, hora2] = b, a
+
+    def delta_troca(self, dia1: int, hora1: int, dia2: int, hora2: int) -> float:
+        """Variação do fitness se as duas células forem trocadas (a agenda volta ao estado original)"""
+        a, b = self.agenda[dia1, hora1], self.agenda[dia2, hora2]
+        if a is None and b is None:
+            return 0.0
+        celulas = ((dia1, hora1), (dia2, hora2))
+        aulas = [aula for aula in (a, b) if aula is not None]
+        disciplinas = {aula.disciplina for aula in aulas}
+        professores = {aula.professor for aula in aulas}
+
+        antes = self._termos_afetados(celulas, disciplinas, professores)
+        self.trocar(dia1, hora1, dia2, hora2)
+        depois = self._termos_afetados(celulas, disciplinas, professores)
+        self.trocar(dia1, hora1, dia2, hora2)
+        return depois - antes
+
+class ScheduleSA(ScheduleGA_V2):
+    """
+    Simulated annealing sobre a mesma agenda e os mesmos pesos da V2
+    - Vizinhança: troca de duas células (uma delas com aula), respeitando os domínios
+    - Avaliação incremental (ModeloIncremental): só os termos afetados pela troca
+    - Temperatura inicial calibrada por amostragem (aceitacao_inicial de pioras)
+    - Temperatura adaptativa: segue uma taxa de aceitação alvo que decai de
+      aceitacao_inicial a aceitacao_final ao longo das épocas/tempo
+    - Reaquecimento após epocas_reaquecimento épocas sem melhora (recomeça do melhor)
+    - Para por número de épocas (self.geracoes), tempo_limite ou fitness_alvo
+    """
+
+    versao = 'SA'
+
+    def __init__(self):
+        super().__init__()
+        self.geracoes = 300                  # Épocas (níveis de temperatura)
+        self.passos_por_temperatura = 100    # Trocas propostas por época
+        self.aceitacao_inicial = 0.5         # Probabilidade inicial de aceitar uma piora média
+        self.aceitacao_final = 0.01
+        self.resfriamento = 0.9              # Fator de ajuste da temperatura por época
+        self.amostras_temperatura = 100
+        self.epocas_reaquecimento = 30       # Épocas sem melhora que disparam o reaquecimento
+        self.fator_reaquecimento = 0.5       # Temperatura de reaquecimento = fator * inicial
+        self.tempo_limite = None             # Segundos (None = sem limite)
+        self.fitness_alvo = None
+        self.temperatura = None
+        self.historico_temperatura = []
+        self.historico_atual = []
+        self.reaquecimentos = 0
+
+    def _propor_troca(self, modelo: ModeloIncremental, celulas: List[Tuple[int, int]]):
+        """Sorteia uma troca válida (primeira célula com aula); None se não encontrar"""
+        for _ in range(10):
+            dia1, hora1 = random.choice(celulas)
+            if modelo.agenda[dia1, hora1] is None:
+                continue
+            dia2, hora2 = random.choice(celulas)
+            if (dia1, hora1) == (dia2, hora2):
+                continue
+            if self.podar_dominios and not self._troca_permitida(modelo.agenda, dia1, hora1, dia2, hora2):
+                continue
+            return dia1, hora1, dia2, hora2
+        return None
+
+    def _temperatura_inicial(self, modelo: ModeloIncremental, celulas: List[Tuple[int, int]]) -> float:
+        """Temperatura em que uma piora média é aceita com probabilidade aceitacao_inicial"""
+        pioras = []
+        for _ in range(self.amostras_temperatura):
+            troca = self._propor_troca(modelo, celulas)
+            if troca is not None:
+                delta = modelo.delta_troca(*troca)
+                self.total_avaliacoes += 1
+                if delta < 0:
+                    pioras.append(-delta)
+        if not pioras:
+            return 1.0
+        return float(np.mean(pioras)) / -math.log(self.aceitacao_inicial)
+
+    def importar_solucao(self, solucao: np.ndarray, fitness: float):
+        """Faz a próxima execução com retomar=True continuar da solução externa (mesma temperatura)"""
+        if self.estado is None:
+            raise ValueError("Sem checkpoint: execute o motor antes de importar soluções")
+        self.estado['agenda_atual'] = solucao.copy()
+        if fitness > self.estado['melhor_fitness_global']:
+            self.estado['melhor_global'] = solucao.copy()
+            self.estado['melhor_fitness_global'] = fitness
+
+    def executar(self, callbacks=None, retomar=False) -> Tuple[np.ndarray, float, List[float]]:
+        """
+        Executa o simulated annealing
+        - Mesmo contrato dos motores genéticos: (melhor agenda, fitness, histórico)
+        - O histórico guarda o melhor fitness ao fim de cada época
+        - retomar: continua de self.estado por mais self.geracoes épocas
+        """
+        if not self.dados_carregados:
+            self._log("📚 Carregando dados...")
+            self.carregar_dados()
+
+        inicio = time.perf_counter()
+        celulas = [(d, h) for d in range(self.num_dias) for h in range(self.num_horarios)]
+
+        if retomar and self.estado is not None:
+            modelo = ModeloIncremental(self, self.estado['agenda_atual'].copy())
+            historico_fitness = list(self.estado['historico_fitness'])
+            melhor_global = self.estado['melhor_global']
+            melhor_fitness_global = self.estado['melhor_fitness_global']
+            epoca_inicial = self.estado['geracao']
+            self.total_avaliacoes = self.estado['total_avaliacoes']
+            temperatura_inicial = self.estado['temperatura_inicial']
+            self.temperatura = self.estado['temperatura']
+        else:
+            if self.verificacao_previa:
+                self._verificar_viabilidade()
+
+            self._log("🧬 Criando solução inicial...")
+            modelo = ModeloIncremental(self, self._solucao_inicial())
+            historico_fitness = []
+            melhor_global = modelo.agenda.copy()
+            melhor_fitness_global = modelo.fitness
+            epoca_inicial = 0
+            self.total_avaliacoes = 1
+            self.historico_temperatura = []
+            self.historico_atual = []
+            self.reaquecimentos = 0
+            temperatura_inicial = self._temperatura_inicial(modelo, celulas)
+            self.temperatura = temperatura_inicial
+
+        convergiu = False
+        epocas_sem_melhora = 0
+        tamanho_historico_inicial = len(historico_fitness)
+        total_epocas = max(self.geracoes, 1)
+
+        self._log(f"🔥 Iniciando annealing (T0 = {temperatura_inicial:.2f})...")
+        for epoca in range(epoca_inicial, epoca_inicial + self.geracoes):
+            inicio_epoca = time.perf_counter()
+            aceitas = 0
+            propostas = 0
+            visitados = []
+            melhorou = False
+
+            for _ in range(self.passos_por_temperatura):
+                troca = self._propor_troca(modelo, celulas)
+                if troca is None:
+                    continue
+                delta = modelo.delta_troca(*troca)
+                self.total_avaliacoes += 1
+                propostas += 1
+                if delta >= 0 or random.random() < math.exp(delta / max(self.temperatura, 1e-9)):
+                    modelo.trocar(*troca)
+                    modelo.fitness += delta
+                    aceitas += 1
+                    if modelo.fitness > melhor_fitness_global + 1e-9:
+                        melhor_fitness_global = modelo.fitness
+                        melhor_global = modelo.agenda.copy()
+                        melhorou = True
+                visitados.append(modelo.fitness)
+
+            historico_fitness.append(melhor_fitness_global)
+            self.historico_atual.append(modelo.fitness)
+            self.historico_temperatura.append(self.temperatura)
+            epocas_sem_melhora = 0 if melhorou else epocas_sem_melhora + 1
+
+            if callbacks:
+                emitir_evento(callbacks, criar_registro_geracao(
+                    self.versao, epoca, visitados or [modelo.fitness], self.total_avaliacoes,
+                    time.perf_counter() - inicio_epoca
+                ))
+
+            if epoca % self.intervalo_log == 0:
+                self._log(f"Época {epoca}: Atual = {modelo.fitness:.0f}, Melhor = {melhor_fitness_global:.0f}, "
+                          f"T = {self.temperatura:.2f}, Aceitação = {aceitas / max(propostas, 1):.1%}")
+
+            # Critérios de parada
+            if self.fitness_alvo is not None and melhor_fitness_global >= self.fitness_alvo:
+                self._log(f"🎯 Fitness alvo atingido na época {epoca}!")
+                convergiu = True
+                break
+            decorrido = time.perf_counter() - inicio
+            if self.tempo_limite is not None and decorrido >= self.tempo_limite:
+                self._log(f"⏱️  Tempo limite atingido na época {epoca}")
+                break
+
+            # Reaquecimento: recomeça do melhor com temperatura alta
+            if epocas_sem_melhora >= self.epocas_reaquecimento:
+                self.reaquecimentos += 1
+                self.temperatura = temperatura_inicial * self.fator_reaquecimento
+                modelo = ModeloIncremental(self, melhor_global.copy())
+                self.total_avaliacoes += 1
+                epocas_sem_melhora = 0
+                self._log(f"♨️  Reaquecimento {self.reaquecimentos} na época {epoca} "
+                          f"(T = {self.temperatura:.2f})")
+                continue
+
+            # Temperatura adaptativa: aceitação acima do alvo esfria, abaixo aquece
+            progresso = (epoca - epoca_inicial + 1) / total_epocas
+            if self.tempo_limite:
+                progresso = max(progresso, decorrido / self.tempo_limite)
+            alvo = self.aceitacao_inicial * (self.aceitacao_final / self.aceitacao_inicial) ** min(progresso, 1.0)
+            if aceitas / max(propostas, 1) > alvo:
+                self.temperatura *= self.resfriamento
+            else:
+                self.temperatura /= self.resfriamento
+
+        self.estado = {
+            'agenda_atual': modelo.agenda,
+            'historico_fitness': historico_fitness,
+            'melhor_global': melhor_global,
+            'melhor_fitness_global': melhor_fitness_global,
+            'geracao': epoca_inicial + len(historico_fitness) - tamanho_historico_inicial,
+            'total_avaliacoes': self.total_avaliacoes,
+            'temperatura': self.temperatura,
+            'temperatura_inicial': temperatura_inicial,
+            'convergiu': convergiu
+        }
+
+        self._log(f"✅ Annealing finalizado. Melhor fitness: {melhor_fitness_global:.0f} "
+                  f"({self.reaquecimentos} reaquecimentos)")
+        # O checkpoint guarda melhor_global (retomar, importar_solucao): quem chama recebe uma cópia
+        return melhor_global.copy(), melhor_fitness_global, historico_fitness
@@ -0,0 +1,97 @@
+import numpy as np
+from typing import Dict, List, Tuple
+from pareto_ranking import ranks_pareto
+
+# Espaço de busca padrão: nome -> (mínimo, máximo, tipo)
+ESPACO_TPE_PADRAO = {
+    'populacao_size': (20, 120, 'int'),
+    'taxa_mutacao': (0.01, 0.30, 'float'),
+    'taxa_crossover': (0.50, 1.00, 'float'),
+    'tamanho_torneio': (2, 8, 'int')
+}
+
+class EstimadorParzen:
+    """Mistura de gaussianas (uma por observação) em [0, 1]^d, dimensões independentes"""
+
+    def __init__(self, pontos: np.ndarray, largura_minima: float = 0.05):
+        self.pontos = np.atleast_2d(np.asarray(pontos, dtype=float))
+        n, d = self.pontos.shape
+        # Regra de Scott por dimensão, com piso para não colapsar em poucos pontos
+        desvio = self.pontos.std(axis=0) if n > 1 else np.full(d, 0.25)
+        self.larguras = np.maximum(desvio * n ** (-1.0 / (d + 4)), largura_minima)
+
+    def log_densidade(self, x: np.ndarray) -> np.ndarray:
+        """Log-densidade de cada linha de x"""
+        x = np.atleast_2d(x)
+        z = (x[:, None, :] - self.pontos[None, :, :]) / self.larguras
+        log_comp = -0.5 * z ** 2 - np.log(self.larguras * np.sqrt(2 * np.pi))
+        log_comp = log_comp.sum(axis=2)
+        maximo = log_comp.max(axis=1, keepdims=True)
+        return (maximo + np.log(np.exp(log_comp - maximo).mean(axis=1, keepdims=True))).ravel()
+
+    def amostrar(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        """Sorteia n pontos da mistura, truncados em [0, 1]"""
+        centros = self.pontos[rng.integers(0, len(self.pontos), size=n)]
+        return np.clip(centros + rng.normal(size=centros.shape) * self.larguras, 0.0, 1.0)
+
+def normalizar(valores: List[Dict], espaco: Dict) -> np.ndarray:
+    """Converte configurações (dicts) para vetores em [0, 1]^d"""
+    nomes = list(espaco.keys())
+    X = np.array([[float(v[nome]) for nome in nomes] for v in valores], dtype=float)
+    minimos = np.array([espaco[nome][0] for nome in nomes], dtype=float)
+    maximos = np.array([espaco[nome][1] for nome in nomes], dtype=float)
+    return (X - minimos) / (maximos - minimos)
+
+def desnormalizar(x: np.ndarray, espaco: Dict) -> Dict:
+    """Converte um vetor em [0, 1]^d para configuração (inteiros arredondados)"""
+    config = {}
+    for valor, (nome, (minimo, maximo, tipo)) in zip(x, espaco.items()):
+        real = minimo + valor * (maximo - minimo)
+        config[nome] = int(round(real)) if tipo == 'int' else round(float(real), 3)
+    return config
+
+def amostrar_uniforme(n: int, espaco: Dict, rng: np.random.Generator) -> List[Dict]:
+    """Configurações aleatórias para a fase inicial da busca"""
+    return [desnormalizar(rng.random(len(espaco)), espaco) for _ in range(n)]
+
+def sugerir_tpe(observados: List[Dict], ordem: np.ndarray, espaco: Dict, n_sugestoes: int,
+                rng: np.random.Generator, gamma: float = 0.25, n_candidatos: int = 64) -> List[Dict]:
+    """
+    Sugere novas configurações pelo Tree-structured Parzen Estimator
+    - ordem: índices das observações do melhor para o pior
+    - l(x) modela a fração gamma melhor, g(x) o restante; maximiza l(x)/g(x)
+    """
+    X = normalizar(observados, espaco)
+    n_bons = max(1, int(np.ceil(gamma * len(X))))
+    bons = EstimadorParzen(X[ordem[:n_bons]])
+    ruins = EstimadorParzen(X[ordem[n_bons:]] if len(X) > n_bons else X)
+
+    ja_vistos = {tuple(sorted(c.items())) for c in observados}
+    sugestoes = []
+    for _ in range(n_sugestoes):
+        candidatos = bons.amostrar(n_candidatos, rng)
+        razao = bons.log_densidade(candidatos) - ruins.log_densidade(candidatos)
+        for indice in np.argsort(-razao):
+            config = desnormalizar(candidatos[indice], espaco)
+            chave = tuple(sorted(config.items()))
+            if chave not in ja_vistos:
+                ja_vistos.add(chave)
+                sugestoes.append(config)
+                break
+        else:
+            sugestoes.append(desnormalizar(rng.random(len(espaco)), espaco))
+    return sugestoes
+
+def ordenar_multiobjetivo(fitness_normalizado: np.ndarray, tempos: np.ndarray,
+                          peso_tempo: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Ordena observações por rank de Pareto (fitness ↑, tempo ↓) e desempata
+    pelo escore escalar fitness_normalizado - peso_tempo * tempo_relativo
+    Retorna (ordem, ranks, escores)
+    """
+    fitness_normalizado = np.asarray(fitness_normalizado, dtype=float)
+    tempos = np.asarray(tempos, dtype=float)
+    ranks = ranks_pareto(np.column_stack([fitness_normalizado, -tempos]))
+    escores = fitness_normalizado - peso_tempo * tempos / max(tempos.max(), 1e-9)
+    ordem = np.lexsort((-escores, ranks))
+    return ordem, ranks, escores
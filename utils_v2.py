@@ -81,7 +81,17 @@ def salvar_agenda_excel(agenda, ga_v2, filename="agenda_otimizada_v2.xlsx"):
         print(f"❌ Erro ao salvar agenda: {e}")
         return None
 
-def criar_planilha_grade_visual(writer, agenda, ga_v2):
+def salvar_hall_da_fama_excel(hall_da_fama, ga_v2, prefixo="hall_da_fama"):
+    """Salva cada agenda do hall da fama (do melhor ao pior) com salvar_agenda_excel"""
+    caminhos = []
+    for posicao, (fitness, agenda, _) in enumerate(hall_da_fama, start=1):
+        caminho = salvar_agenda_excel(agenda, ga_v2, f"{prefixo}_{posicao}.xlsx")
+        if caminho:
+            caminhos.append(caminho)
+    print(f"🏅 {len(caminhos)} agendas do hall da fama salvas em resultados/{prefixo}_*.xlsx")
+    return caminhos
+
+def criar_planilha_grade_visual(writer, agenda, ga_v2, nome_planilha='Grade_Visual'):
     """Cria uma planilha com visualização em grade da agenda"""
     
     # Criar matriz visual
@@ -108,7 +118,7 @@ def criar_planilha_grade_visual(writer, agenda, ga_v2):
         dados_grade.append(linha)
     
     df_grade = pd.DataFrame(dados_grade[1:], columns=dados_grade[0])
-    df_grade.to_excel(writer, sheet_name='Grade_Visual', index=False)
+    df_grade.to_excel(writer, sheet_name=nome_planilha, index=False)
 
 def criar_planilha_estatisticas(writer, agenda, ga_v2):
     """Cria planilha com estatísticas da agenda"""